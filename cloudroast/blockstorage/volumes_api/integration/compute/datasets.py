@@ -11,7 +11,54 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from itertools import combinations
+from random import Random
+
+from cafe.drivers.unittest.datasets import DatasetList
 from cloudcafe.blockstorage.datasets import ComputeIntegrationDatasets
+from cloudcafe.common.tools.check_dict import get_value
+
+# Covering array strength and seed for the bfv-pairwise datasets, a strength
+# of 2 covers every pair of values, 3 every triple, and so on
+PAIRWISE_STRENGTH = int(get_value('bfv-pairwise-strength') or 2)
+PAIRWISE_SEED = int(get_value('bfv-pairwise-seed') or 0)
+
+
+def _value_key(value):
+    for attr in ('id', 'name'):
+        if getattr(value, attr, None) is not None:
+            return getattr(value, attr)
+    return repr(value)
+
+
+def covering_datasets(dataset_list, strength=2, seed=0):
+    """ Returns the datasets of a full cartesian product dataset list that
+    form a covering array of the given strength: every combination of
+    strength values, one from each of any strength factors, appears in at
+    least one of the returned datasets. Datasets are picked greedily, the
+    one covering the most combinations not covered yet first, with ties
+    broken by the seed.
+    """
+    rows = []
+    for dataset in dataset_list:
+        factors = sorted(dataset.data)
+        values = [(factor, _value_key(dataset.data[factor]))
+                  for factor in factors]
+        rows.append((dataset, set(
+            combinations(values, min(strength, len(values))))))
+    Random(seed).shuffle(rows)
+
+    uncovered = set()
+    for _, row_combinations in rows:
+        uncovered.update(row_combinations)
+
+    covering = DatasetList()
+    while uncovered:
+        dataset, row_combinations = max(
+            rows, key=lambda row: len(row[1] & uncovered))
+        covering.append_new_dataset(dataset.name, dataset.data)
+        uncovered -= row_combinations
+    return covering
 
 
 class bfv_datasets(object):
@@ -59,4 +106,9 @@ class bfv_datasets(object):
     flavors_by_images_by_volume_type.apply_test_tags("bfv-exhaustive")
     configured.apply_test_tags("bfv-configured")
     single.apply_test_tags("bfv-single-random")
-    flavors_by_images_by_volume_type.merge_dataset_tags(configured, single)
+    pairwise = covering_datasets(
+        flavors_by_images_by_volume_type, strength=PAIRWISE_STRENGTH,
+        seed=PAIRWISE_SEED)
+    pairwise.apply_test_tags("bfv-pairwise")
+    flavors_by_images_by_volume_type.merge_dataset_tags(
+        configured, single, pairwise)
@@ -14,9 +14,58 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from cloudcafe.common.tools.check_dict import get_value
 from cloudcafe.common.tools.datagen import random_string
 from cloudcafe.compute.composites import ComputeIntegrationComposite
 from cloudroast.blockstorage.volumes_api.fixtures import VolumesTestFixture
+from cloudroast.blockstorage.volumes_api.integration.compute.io_benchmark \
+    import VolumeIOBenchmark
+from cloudroast.common.concurrency import map_concurrently
+
+
+class ServerSnapshot(object):
+    """Handle to a server snapshot that is being created, returned by
+    ComputeIntegrationTestFixture.start_server_snapshot
+    """
+
+    def __init__(self, images, server_id, image_id):
+        self.images = images
+        self.server_id = server_id
+        self.image_id = image_id
+        self._server_done = False
+        self._image = None
+
+    def wait_for_server(self):
+        """Waits for the server to finish snapshotting"""
+        if not self._server_done:
+            self.images.behaviors.verify_server_snapshotting_progression(
+                self.server_id)
+            self._server_done = True
+
+    def wait(self):
+        """Waits for the snapshot image to become active and returns it"""
+        if self._image is None:
+            self.wait_for_server()
+            resp = self.images.behaviors.wait_for_image_status(
+                self.image_id, 'ACTIVE', 10, 600)
+            if getattr(resp, 'entity', None) is None:
+                resp = self.images.client.get_image(self.image_id)
+                assert resp.ok, (
+                    "Could not get updated snapshot info after create")
+            assert resp.entity is not None, (
+                "Could not deserialize snapshot info response")
+            self._image = resp.entity
+        return self._image
+
+    @classmethod
+    def wait_all(cls, snapshots):
+        """Waits for all the snapshots at once and returns their images"""
+        results = map_concurrently(
+            lambda snapshot: snapshot.wait(), snapshots, len(snapshots))
+        for result in results:
+            if not result.ok:
+                raise result.error
+        return [result.result for result in results]
 
 
 class ComputeIntegrationTestFixture(VolumesTestFixture):
@@ -217,6 +266,25 @@ class ComputeIntegrationTestFixture(VolumesTestFixture):
             connection_timeout=connection_timeout, key=key,
             password=password)
 
+    @classmethod
+    def benchmark_attached_volume(
+            cls, server_connection, mount_point, volume):
+        """Runs the volume I/O benchmark on a mounted volume, and logs the
+        throughput and IOPS for the volume type. The benchmark size in MB
+        is set by volume-io-size-mb, 64 by default.
+        """
+        benchmark = VolumeIOBenchmark(
+            server_connection, mount_point,
+            size_mb=int(get_value('volume-io-size-mb') or 64))
+        report = benchmark.run()
+        report['volume_type'] = volume.volume_type
+        cls.fixture_log.info(
+            "Volume type {volume_type}: sequential write {seq_write_mbps:.1f} "
+            "MB/s, sequential read {seq_read_mbps:.1f} MB/s, random write "
+            "{rand_write_iops:.0f} IOPS, random read {rand_read_iops:.0f} "
+            "IOPS ({random_io_tool}, {size_mb} MB)".format(**report))
+        return report
+
     @classmethod
     def setup_server_and_attached_volume_with_data(
             cls, server=None, volume=None):
@@ -226,6 +294,9 @@ class ComputeIntegrationTestFixture(VolumesTestFixture):
         Writes data to the volume
         Saves the md5sum of the written data as a class attribute
         Syncs the filesystem write cache.
+        If volume-io-benchmark is enabled, benchmarks the volume and writes
+        a seeded pattern that can be verified chunk by chunk with
+        io_benchmark.verify_pattern
         """
 
         # Build new server using configured defaults
@@ -264,6 +335,19 @@ class ComputeIntegrationTestFixture(VolumesTestFixture):
         assert cls.original_md5hash is not None, (
             "Unable to hash file on mounted volume")
 
+        cls.io_benchmark = None
+        if get_value('volume-io-benchmark') == 'true':
+            cls.io_benchmark_report = cls.benchmark_attached_volume(
+                cls.server_conn, cls.volume_mount_point, cls.test_volume)
+            cls.io_benchmark = VolumeIOBenchmark(
+                cls.server_conn, cls.volume_mount_point,
+                size_mb=cls.io_benchmark_report['size_mb'])
+            cls.io_benchmark.write_pattern()
+            corrupted = cls.io_benchmark.verify_pattern()
+            assert not corrupted, (
+                "Chunks {0} of the pattern written to the attached volume "
+                "are corrupted".format(corrupted))
+
         # Make the fs writes cached data to disk before unmount.
         cls.server_conn.filesystem_sync()
 
@@ -337,7 +421,13 @@ class ComputeIntegrationTestFixture(VolumesTestFixture):
             return False
         return True
 
-    def make_server_snapshot(self, server, add_cleanup=True):
+    def start_server_snapshot(self, server, add_cleanup=True):
+        """Requests a snapshot of the server and returns a ServerSnapshot
+        handle as soon as the image id is known, so the caller can do other
+        work, or start other snapshots, before waiting for it.
+        The image id is taken from the location header of the create
+        response, or else looked up by the snapshot name.
+        """
         server_snapshot_name = random_string(
             prefix="cbs_qe_image_of_{0}_".format(server.name), size=10)
 
@@ -348,39 +438,37 @@ class ComputeIntegrationTestFixture(VolumesTestFixture):
             "Create-Server-Image call failed with a {0}".format(
                 create_img_resp.status_code))
 
-        self.images.behaviors.verify_server_snapshotting_progression(server.id)
+        image_id = self._get_snapshot_id(
+            create_img_resp, server.id, server_snapshot_name)
+        assert image_id is not None, "Could not locate image by name."
+
+        if add_cleanup is True:
+            self.addCleanup(self.images.client.delete_image, image_id)
+
+        return ServerSnapshot(self.images, server.id, image_id)
+
+    def _get_snapshot_id(self, create_img_resp, server_id, name):
+        location = create_img_resp.headers.get('location')
+        if location:
+            return location.rstrip('/').rsplit('/', 1)[-1]
 
-        # Poll for list of all snapshots and find the one that belongs to our
-        # server.
-        list_imgs_resp = self.images.client.list_images()
+        # Only list the images with the snapshot name, the snapshot could
+        # be missing from an unfiltered first page of images
+        list_imgs_resp = self.images.client.list_images(
+            server_ref=server_id, image_name=name)
         assert list_imgs_resp.ok, (
             "list-images call failed with a {0}".format(
                 list_imgs_resp.status_code))
         assert list_imgs_resp.entity is not None, (
-            "Unable to deserialize list-images response".format(
-                list_imgs_resp.status_code))
-        image_list = list_imgs_resp.entity
-        server_snapshot = None
-        for img in image_list:
-            if img.name == server_snapshot_name:
-                server_snapshot = img
-                break
-
-        assert server_snapshot is not None, "Could not locate image by name."
-        if add_cleanup is True:
-            self.addCleanup(
-                self.images.client.delete_image, server_snapshot.id)
-
-        # Wait for the image to become active just in case
-        self.images.behaviors.wait_for_image_status(
-            server_snapshot.id, 'ACTIVE', 10, 600)
-
-        # get the model for the snapshot in question
-        resp = self.images.client.get_image(server_snapshot.id)
-        assert resp.ok, ("Could not get updated snapshot info after create")
-        assert resp.entity is not None, (
-            "Could not deserialize snapshot infor response")
-        return resp.entity
+            "Unable to deserialize list-images response")
+        for img in list_imgs_resp.entity:
+            if img.name == name:
+                return img.id
+        return None
+
+    def make_server_snapshot(self, server, add_cleanup=True):
+        return self.start_server_snapshot(
+            server, add_cleanup=add_cleanup).wait()
 
     def create_bootable_volume_from_server_snapshot(
             self, image, flavor, volume_type):
@@ -433,16 +521,17 @@ class ComputeIntegrationTestFixture(VolumesTestFixture):
             name=None, image=image.id, flavor=flavor.id, add_cleanup=False)
         self.addCleanup(self.servers.client.delete_server, server.id)
 
-        # Make a snapshot of the server via the images api
-        self.make_server_snapshot(server)
-        self.servers.behaviors.wait_for_server_status(
-            server.id, 'ACTIVE', timeout=300)
-        self.make_server_snapshot(server)
-        self.servers.behaviors.wait_for_server_status(
-            server.id, 'ACTIVE', timeout=300)
-        server_snapshot_3 = self.make_server_snapshot(server)
-        self.servers.behaviors.wait_for_server_status(
-            server.id, 'ACTIVE', timeout=300)
+        # Make three snapshots of the server via the images api. Each one
+        # only waits for the server to be done snapshotting, the images
+        # become active while the next snapshots are taken.
+        snapshots = []
+        for _ in range(3):
+            snapshot = self.start_server_snapshot(server)
+            snapshot.wait_for_server()
+            self.servers.behaviors.wait_for_server_status(
+                server.id, 'ACTIVE', timeout=300)
+            snapshots.append(snapshot)
+        server_snapshot_3 = ServerSnapshot.wait_all(snapshots)[-1]
 
         # Create a bootable volume from the server snapshot
         self.create_volume_from_image_test(volume_type, server_snapshot_3)
@@ -0,0 +1,190 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import pipes
+from random import Random
+
+BENCHMARK_FILE_NAME = "qe_io_benchmark"
+PATTERN_FILE_NAME = "qe_io_pattern"
+RANDOM_IO_BLOCK_SIZE = 4096
+MB = 1024 * 1024
+
+# Runs a command on the guest and prints its exit status and its start and
+# end times, so the workloads are timed by the guest clock rather than over
+# ssh
+TIMED_COMMAND = (
+    "start=$(date +%s.%N); {command} > /dev/null 2>&1; status=$?; "
+    "end=$(date +%s.%N); echo \"$status $start $end\"")
+
+
+class VolumeIOBenchmark(object):
+    """
+    Runs sequential and random read/write workloads on a mounted volume of
+    a linux server, and writes a seeded pattern file whose chunks can be
+    verified one by one after the volume is cloned, snapshotted or migrated.
+    """
+
+    def __init__(
+            self, server_connection, directory, size_mb=64,
+            chunk_size=MB, random_io_count=256, seed=0):
+        self.server_connection = server_connection
+        self.directory = directory.rstrip('/')
+        self.size_mb = size_mb
+        self.chunk_size = chunk_size
+        self.random_io_count = random_io_count
+        self.seed = seed
+
+    def _execute(self, command):
+        return self.server_connection.ssh_client.execute_command(command)
+
+    def _path(self, file_name, directory=None):
+        return pipes.quote("{0}/{1}".format(
+            (directory or self.directory).rstrip('/'), file_name))
+
+    def _timed(self, command):
+        """
+        Returns the seconds command took to run on the guest, and raises if
+        it exited with a non-zero status, so a failed workload is not
+        reported as a fast one.
+        """
+        resp = self._execute(TIMED_COMMAND.format(command=command))
+        status, start, end = resp.stdout.split()[-3:]
+        if status != '0':
+            raise Exception(
+                "'{0}' exited with status {1} on the server".format(
+                    command, status))
+        return float(end) - float(start)
+
+    def _drop_caches(self):
+        self._execute("sync; echo 3 > /proc/sys/vm/drop_caches")
+
+    def _has_fio(self):
+        resp = self._execute("command -v fio")
+        return bool(resp.stdout.strip())
+
+    def _random_offsets(self):
+        blocks = self.size_mb * MB / RANDOM_IO_BLOCK_SIZE
+        count = min(self.random_io_count, blocks)
+        return Random(self.seed).sample(xrange(blocks), count)
+
+    def _random_io_command(self, path, write, use_fio):
+        if use_fio:
+            return (
+                "fio --name=qe_random --filename={path} --rw={rw} "
+                "--bs={bs} --size={size}M --direct=1 --ioengine=sync "
+                "--number_ios={count} --randseed={seed}").format(
+                    path=path, rw='randwrite' if write else 'randread',
+                    bs=RANDOM_IO_BLOCK_SIZE, size=self.size_mb,
+                    count=self.random_io_count, seed=self.seed)
+
+        offsets = ' '.join(str(offset) for offset in self._random_offsets())
+        if write:
+            dd_command = (
+                "dd if=/dev/zero of={path} bs={bs} count=1 seek=$o "
+                "conv=notrunc oflag=direct")
+        else:
+            dd_command = (
+                "dd if={path} of=/dev/null bs={bs} count=1 skip=$o "
+                "iflag=direct")
+        return "for o in {offsets}; do {dd}; done".format(
+            offsets=offsets,
+            dd=dd_command.format(path=path, bs=RANDOM_IO_BLOCK_SIZE))
+
+    def run(self):
+        """
+        Runs the workloads on a scratch file, removed afterwards, and returns
+        the sequential throughput in MB/s and the random IOPS.
+        """
+        path = self._path(BENCHMARK_FILE_NAME)
+        size = self.size_mb * MB
+        report = {'size_mb': self.size_mb}
+
+        seconds = self._timed(
+            "dd if=/dev/zero of={path} bs=1M count={count} oflag=direct "
+            "conv=fsync".format(path=path, count=self.size_mb))
+        report['seq_write_mbps'] = size / MB / seconds
+
+        self._drop_caches()
+        seconds = self._timed(
+            "dd if={path} of=/dev/null bs=1M iflag=direct".format(path=path))
+        report['seq_read_mbps'] = size / MB / seconds
+
+        use_fio = self._has_fio()
+        report['random_io_tool'] = 'fio' if use_fio else 'dd'
+        count = (self.random_io_count if use_fio
+                 else len(self._random_offsets()))
+
+        seconds = self._timed(self._random_io_command(path, True, use_fio))
+        report['rand_write_iops'] = count / seconds
+
+        self._drop_caches()
+        seconds = self._timed(self._random_io_command(path, False, use_fio))
+        report['rand_read_iops'] = count / seconds
+
+        self._execute("rm -f {0}".format(path))
+        return report
+
+    @property
+    def chunk_count(self):
+        return self.size_mb * MB / self.chunk_size
+
+    def _pattern_token(self):
+        return hashlib.sha1(str(self.seed)).hexdigest()
+
+    def _chunk(self, index):
+        body_size = self.chunk_size - 16
+        token = self._pattern_token()
+        body = (token * (body_size / len(token) + 1))[:body_size]
+        return "{0:016d}{1}".format(index, body)
+
+    @property
+    def expected_chunk_md5s(self):
+        return [hashlib.md5(self._chunk(index)).hexdigest()
+                for index in xrange(self.chunk_count)]
+
+    def write_pattern(self):
+        """
+        Writes chunk_count chunks, each a 16 digit chunk index followed by
+        the seeded token repeated, and syncs them to the volume.
+        """
+        path = self._path(PATTERN_FILE_NAME)
+        body_path = self._path(PATTERN_FILE_NAME + ".body")
+        self._execute(
+            "yes {token} | tr -d '\\n' | head -c {body_size} > {body}; "
+            "rm -f {path}; i=0; while [ $i -lt {count} ]; do "
+            "printf '%016d' $i >> {path}; cat {body} >> {path}; "
+            "i=$((i + 1)); done; rm -f {body}; sync".format(
+                token=self._pattern_token(), body_size=self.chunk_size - 16,
+                body=body_path, path=path, count=self.chunk_count))
+
+    def verify_pattern(self, directory=None):
+        """
+        Checksums the pattern file chunk by chunk, in the benchmarked
+        directory or in another one, for ex. where a clone is mounted.
+        Returns the indexes of the missing or corrupted chunks.
+        """
+        path = self._path(PATTERN_FILE_NAME, directory)
+        resp = self._execute(
+            "i=0; while [ $i -lt {count} ]; do "
+            "dd if={path} bs={chunk_size} skip=$i count=1 2> /dev/null | "
+            "md5sum; i=$((i + 1)); done".format(
+                path=path, chunk_size=self.chunk_size,
+                count=self.chunk_count))
+        found = [line.split()[0] for line in resp.stdout.splitlines()
+                 if line.strip()]
+        return [index for index, md5 in enumerate(self.expected_chunk_md5s)
+                if index >= len(found) or found[index] != md5]
@@ -15,6 +15,8 @@ limitations under the License.
 """
 from cloudroast.blockstorage.volumes_api.integration.compute.fixtures import \
     ComputeIntegrationTestFixture
+from cloudroast.blockstorage.volumes_api.integration.compute.io_benchmark \
+    import VolumeIOBenchmark
 
 
 class VolumeCloningIntegrationSmokeTests(ComputeIntegrationTestFixture):
@@ -63,6 +65,21 @@ class VolumeCloningIntegrationSmokeTests(ComputeIntegrationTestFixture):
             "not match".format(
                 self.original_hash, md5hash, self.written_filename))
 
+        # verify the benchmark pattern chunk by chunk on the volume clone,
+        # and benchmark the clone
+        if self.io_benchmark:
+            clone_benchmark = VolumeIOBenchmark(
+                self.server_conn, self.clone_mount_point,
+                size_mb=self.io_benchmark.size_mb,
+                chunk_size=self.io_benchmark.chunk_size,
+                seed=self.io_benchmark.seed)
+            corrupted = clone_benchmark.verify_pattern()
+            assert not corrupted, (
+                "Chunks {0} of the pattern on the cloned volume are "
+                "corrupted".format(corrupted))
+            self.benchmark_attached_volume(
+                self.server_conn, self.clone_mount_point, self.volume_clone)
+
     def tearDown(self):
         if hasattr(self, 'clone_attachment'):
             self.unmount_attached_volume(
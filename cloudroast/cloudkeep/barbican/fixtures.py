@@ -14,7 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import json
+import random
 import requests
+import time
 
 from os import path
 from uuid import uuid4
@@ -36,6 +38,18 @@ from cloudcafe.cloudkeep.config import (MarshallingConfig, CloudKeepConfig,
                                         CloudKeepOrdersConfig,
                                         CloudKeepAuthConfig)
 from cloudcafe.common.tools import randomstring
+from cloudcafe.common.tools.check_dict import get_value
+from cloudroast.common.concurrency import map_concurrently
+from cloudroast.common.timing import LatencyRecorder
+
+# Maximum number of entity creations in flight while seeding
+SEED_WORKERS = 10
+# Times a creation rejected with 429 Too Many Requests is retried
+SEED_MAX_RETRIES = 6
+# Number of entities seeded by the paging fixtures
+PAGING_SEED_COUNT = 150
+# Default number of secrets seeded by the scale paging fixture
+SCALE_SEED_COUNT = 10000
 
 
 class BarbicanFixture(BaseTestFixture):
@@ -47,6 +61,78 @@ class BarbicanFixture(BaseTestFixture):
         cls.cloudkeep = CloudKeepConfig()
         cls.keystone = keystone_config or CloudKeepAuthConfig()
 
+    @classmethod
+    def seed_concurrently(cls, create, count, max_workers=SEED_WORKERS,
+                          get_ref=lambda resp: resp.ref):
+        """
+        Calls create count times with at most max_workers calls in flight,
+        retrying calls rejected with 429 Too Many Requests with exponential
+        backoff. The behaviors keep track of the created entities, so they
+        are deleted by the usual teardown.
+
+        :param create: behavior call creating one entity, for ex.
+                       behaviors.create_secret_from_config
+        :param count: number of entities to create
+        :param get_ref: returns the ref of an entity from the create
+                        response, the container create responses have it
+                        at resp.entity.reference
+        :return: the refs of the created entities
+        """
+        results = map_concurrently(
+            lambda _: cls._create_with_retry(create), xrange(count),
+            max_workers)
+
+        failed = [result for result in results if not result.ok]
+        if failed:
+            raise Exception('Seeding failed for {0} of {1} entities, first '
+                            'error: {2}'.format(len(failed), count,
+                                                failed[0].error))
+        return [get_ref(result.result) for result in results]
+
+    @classmethod
+    def _create_with_retry(cls, create):
+        delay = 1
+        for attempt in range(SEED_MAX_RETRIES + 1):
+            resp = create()
+            if resp.status_code != 429 or attempt == SEED_MAX_RETRIES:
+                break
+            time.sleep(delay + random.uniform(0, delay))
+            delay *= 2
+
+        if resp.status_code >= 400:
+            raise Exception('Create returned unexpected response code '
+                            '{0}'.format(resp.status_code))
+        return resp
+
+    @classmethod
+    def record_paging(cls, get_page, limit, recorder=None):
+        """
+        Pages through a list with the given limit, recording the latency
+        of each page request.
+
+        :param get_page: callable taking limit and offset keyword arguments
+                         and returning the list response, for ex.
+                         client.get_secrets
+        :param limit: number of entities per page
+        :return: the recorder with the page latencies and the number of
+                 entities listed
+        """
+        recorder = recorder or LatencyRecorder('paging')
+        offset = 0
+        while True:
+            resp = recorder.call(get_page, limit=limit, offset=offset)
+            if resp.status_code != 200:
+                raise Exception('Listing returned unexpected response code '
+                                '{0}'.format(resp.status_code))
+            page = (getattr(resp.entity, 'secrets', None) or
+                    getattr(resp.entity, 'orders', None) or
+                    getattr(resp.entity, 'containers', None) or [])
+            recorder.add_items(len(page))
+            if len(page) < limit:
+                break
+            offset += limit
+        return recorder
+
     def get_id(self, request):
         """
         Helper function to extract the producer id from location header
@@ -208,11 +294,15 @@ class SecretsFixture(AuthenticationFixture):
 
 class SecretsPagingFixture(SecretsFixture):
 
+    seed_count = PAGING_SEED_COUNT
+
     @classmethod
     def setUpClass(cls):
         super(SecretsPagingFixture, cls).setUpClass()
-        for count in range(150):
-            cls.behaviors.create_secret_from_config(use_expiration=False)
+        cls.secret_refs = cls.seed_concurrently(
+            lambda: cls.behaviors.create_secret_from_config(
+                use_expiration=False),
+            cls.seed_count)
 
     def tearDown(self):
         """ Overrides superclass method so that secrets are not deleted
@@ -266,11 +356,15 @@ class OrdersFixture(AuthenticationFixture):
 
 class OrdersPagingFixture(OrdersFixture):
 
+    seed_count = PAGING_SEED_COUNT
+
     @classmethod
     def setUpClass(cls):
         super(OrdersPagingFixture, cls).setUpClass()
-        for count in range(150):
-            cls.behaviors.create_order_from_config(use_expiration=False)
+        cls.order_refs = cls.seed_concurrently(
+            lambda: cls.behaviors.create_order_from_config(
+                use_expiration=False),
+            cls.seed_count)
 
     def tearDown(self):
         """ Overrides superclass method so that orders are not deleted
@@ -341,6 +435,56 @@ class ContainerFixture(OrdersFixture):
         self.order_behaviors.delete_all_created_orders_and_secrets()
         self.behaviors.delete_all_created_containers()
 
+
+class ContainersPagingFixture(ContainerFixture):
+
+    seed_count = PAGING_SEED_COUNT
+
+    @classmethod
+    def setUpClass(cls):
+        super(ContainersPagingFixture, cls).setUpClass()
+        cls.container_refs = cls.seed_concurrently(
+            cls.behaviors.create_container_with_secret, cls.seed_count,
+            get_ref=lambda resp: resp.entity.reference)
+
+    def tearDown(self):
+        """ Overrides superclass method so that containers are not deleted
+        between tests.
+        """
+        pass
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.behaviors.delete_all_created_containers()
+        cls.secret_behaviors.delete_all_created_secrets()
+        super(ContainersPagingFixture, cls).tearDownClass()
+
+
+class SecretsScalePagingFixture(SecretsPagingFixture):
+    """ Seeds paging-scale secrets, 10000 by default, and records the
+    latency of paging through them, which is logged on teardown.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.seed_count = int(get_value('paging-scale') or SCALE_SEED_COUNT)
+        super(SecretsScalePagingFixture, cls).setUpClass()
+        cls.paging_latency = LatencyRecorder('secrets paging')
+
+    def page_secrets(self, limit):
+        """ Pages through all the secrets, recording the page latencies
+        in paging_latency, and returns the number of secrets listed.
+        """
+        start = self.paging_latency.items
+        self.record_paging(self.client.get_secrets, limit,
+                           recorder=self.paging_latency)
+        return self.paging_latency.items - start
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.fixture_log.info(str(cls.paging_latency))
+        super(SecretsScalePagingFixture, cls).tearDownClass()
+
 # ---------------- DATASETS -------------
 
 
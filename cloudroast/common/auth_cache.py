@@ -0,0 +1,221 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import calendar
+import cPickle as pickle
+import fcntl
+import os
+import threading
+import time
+from hashlib import sha1
+
+from cloudcafe.auth.config import UserAuthConfig, UserConfig
+from cloudcafe.auth.provider import AuthProvider
+
+from cloudroast.common.run_cache import get_run_cache_directory
+
+
+class AccessDataCache(object):
+    """
+    @summary: Token and service catalog cache keyed by auth endpoint, user
+        config section, username, tenant and cafe config file. Entries are
+        kept in memory and pickled, readable by the current user only, to a
+        directory of the engine temp directory private to the run, so the
+        parallel runner processes of a run authenticate once per token
+        lifetime instead of once per test class.
+    """
+
+    TOKEN_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+    def __init__(self, cache_directory=None, expiry_margin=300,
+                 default_lifetime=3600):
+        """
+        @param cache_directory: Directory shared by the runner processes,
+            defaults to a directory of access_data_cache in the engine temp
+            directory private to the run
+        @type cache_directory: String
+        @param expiry_margin: Seconds before token expiry at which an entry
+            is treated as expired
+        @type expiry_margin: Integer
+        @param default_lifetime: Seconds to keep an entry whose token expiry
+            cannot be read
+        @type default_lifetime: Integer
+        """
+        self._cache_directory = cache_directory
+        self.expiry_margin = expiry_margin
+        self.default_lifetime = default_lifetime
+        self._entries = {}
+
+    @property
+    def cache_directory(self):
+        if self._cache_directory is None:
+            self._cache_directory = get_run_cache_directory(
+                'access_data_cache')
+        elif not os.path.isdir(self._cache_directory):
+            try:
+                os.makedirs(self._cache_directory, 0700)
+            except OSError:
+                # Another runner process created it first
+                pass
+        return self._cache_directory
+
+    def get_access_data(self, auth_endpoint, user_section, authenticate,
+                        username=None, tenant=None):
+        """
+        @summary: Returns cached access data for the endpoint and user,
+            calling authenticate only when no unexpired entry exists
+        @param auth_endpoint: Identity endpoint the user authenticates with
+        @type auth_endpoint: String
+        @param user_section: Config section name of the user
+        @type user_section: String
+        @param authenticate: Callable returning new access data, or None if
+            authentication failed
+        @param username: Name of the user
+        @type username: String
+        @param tenant: Name or id of the tenant the user authenticates for
+        @type tenant: String
+        @return: Access data
+        @rtype: AccessResponse
+        """
+        key = self._make_key(auth_endpoint, user_section, username, tenant)
+        entry = self._entries.get(key)
+        if entry is not None and not self._is_expired(entry):
+            return entry[1]
+
+        path = self._entry_path(key)
+        with open("{0}.lock".format(path), 'a') as lock_file:
+            # Only one process authenticates while the others wait for it
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                entry = self._load(path)
+                if entry is None or self._is_expired(entry):
+                    access_data = authenticate()
+                    if access_data is None:
+                        return None
+                    entry = (self._expires_at(access_data), access_data)
+                    self._store(path, entry)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+        self._entries[key] = entry
+        return entry[1]
+
+    def invalidate(self, auth_endpoint, user_section, username=None,
+                   tenant=None):
+        """
+        @summary: Drops the entry for the endpoint and user, for example
+            after a request was rejected with the cached token
+        """
+        key = self._make_key(auth_endpoint, user_section, username, tenant)
+        self._entries.pop(key, None)
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _make_key(auth_endpoint, user_section, username, tenant):
+        return (auth_endpoint, user_section, username, tenant,
+                os.environ.get('CAFE_CONFIG_FILE_PATH'))
+
+    def _entry_path(self, key):
+        name = sha1('|'.join(str(part) for part in key)).hexdigest()
+        return os.path.join(self.cache_directory, name)
+
+    def _is_expired(self, entry):
+        return entry[0] - self.expiry_margin <= time.time()
+
+    def _expires_at(self, access_data):
+        try:
+            expires = str(access_data.token.expires)[:19]
+            return calendar.timegm(
+                time.strptime(expires, self.TOKEN_TIME_FORMAT))
+        except (AttributeError, ValueError):
+            return time.time() + self.default_lifetime
+
+    @staticmethod
+    def _load(path):
+        try:
+            with open(path, 'rb') as entry_file:
+                return pickle.load(entry_file)
+        except (IOError, EOFError, pickle.UnpicklingError):
+            return None
+
+    @staticmethod
+    def _store(path, entry):
+        temp_path = "{0}.{1}.tmp".format(path, os.getpid())
+        try:
+            # Tokens are credentials, only the current user may read them
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                         0600)
+            with os.fdopen(fd, 'wb') as entry_file:
+                pickle.dump(entry, entry_file, pickle.HIGHEST_PROTOCOL)
+            os.rename(temp_path, path)
+        except (IOError, OSError, TypeError, pickle.PicklingError):
+            # The entry is still cached in memory for this process
+            pass
+
+
+access_data_cache = AccessDataCache()
+
+# Serializes the composites built through the cache, see
+# create_cached_auth_composite
+_composite_lock = threading.Lock()
+
+
+def _get_cached_access_data(endpoint_config, user_config, authenticate):
+    endpoint_config = endpoint_config or UserAuthConfig()
+    user_config = user_config or UserConfig()
+    tenant = (getattr(user_config, 'tenant_name', None) or
+              getattr(user_config, 'tenant_id', None))
+    return access_data_cache.get_access_data(
+        getattr(endpoint_config, 'auth_endpoint', None),
+        getattr(user_config, 'SECTION_NAME', None),
+        lambda: authenticate(endpoint_config, user_config),
+        username=getattr(user_config, 'username', None), tenant=tenant)
+
+
+def get_access_data(endpoint_config=None, user_config=None):
+    """
+    @summary: Cached equivalent of AuthProvider.get_access_data
+    """
+    return _get_cached_access_data(
+        endpoint_config, user_config, AuthProvider.get_access_data)
+
+
+def create_cached_auth_composite(composite_class, *args, **kwargs):
+    """
+    @summary: Builds a cloudcafe auth composite, for ex. ImagesAuthComposite,
+        whose user authenticates once per run through the access data cache.
+        The composites authenticate with AuthProvider when they are built,
+        so AuthProvider is routed to the cache for the duration of the
+        constructor call only.
+    @param composite_class: Auth composite to build
+    @type composite_class: Class
+    @return: The auth composite, built with the given arguments
+    """
+    with _composite_lock:
+        authenticate = AuthProvider.get_access_data
+
+        def get_cached_access_data(endpoint_config=None, user_config=None):
+            return _get_cached_access_data(
+                endpoint_config, user_config, authenticate)
+
+        AuthProvider.get_access_data = staticmethod(get_cached_access_data)
+        try:
+            return composite_class(*args, **kwargs)
+        finally:
+            AuthProvider.get_access_data = staticmethod(authenticate)
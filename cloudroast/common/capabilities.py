@@ -0,0 +1,134 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import cPickle as pickle
+import fcntl
+import os
+import unittest
+from functools import wraps
+from hashlib import sha1
+
+from cloudroast.common.run_cache import get_run_cache_directory
+
+
+class CapabilityRegistry(object):
+    """
+    @summary: Process wide cache of capability discovery results, such as
+        the configured swift features or the compute extensions. Each
+        discovery call is made once per run; results are kept in memory and
+        pickled to a directory of the current run so its parallel runner
+        processes share them. A new run discovers everything again.
+    """
+
+    def __init__(self, cache_directory=None):
+        """
+        @param cache_directory: Directory shared by the runner processes,
+            defaults to a capability_cache directory of the current run in
+            the engine temp directory
+        @type cache_directory: String
+        """
+        self._cache_directory = cache_directory
+        self._entries = {}
+
+    @property
+    def cache_directory(self):
+        if self._cache_directory is None:
+            self._cache_directory = get_run_cache_directory(
+                'capability_cache')
+        return self._cache_directory
+
+    def get(self, name, discover):
+        """
+        @summary: Returns the cached result for the capability, calling
+            discover only when it was not called yet in this run. Results
+            are cached per capability name and cafe config file.
+        @param name: Name of the capability
+        @type name: String
+        @param discover: Callable returning the capability. Exceptions are
+            not cached and propagate to the caller.
+        @return: Result of discover
+        """
+        key = (name, os.environ.get('CAFE_CONFIG_FILE_PATH'))
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry[0]
+
+        path = self._entry_path(key)
+        with open("{0}.lock".format(path), 'a') as lock_file:
+            # Only one process discovers while the others wait for it
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                entry = self._load(path)
+                if entry is None:
+                    entry = (discover(),)
+                    self._store(path, entry)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+        self._entries[key] = entry
+        return entry[0]
+
+    def clear(self):
+        """
+        @summary: Drops the results cached in memory by this process
+        """
+        self._entries.clear()
+
+    def _entry_path(self, key):
+        name = sha1('|'.join(str(part) for part in key)).hexdigest()
+        return os.path.join(self.cache_directory, name)
+
+    @staticmethod
+    def _load(path):
+        try:
+            with open(path, 'rb') as entry_file:
+                return pickle.load(entry_file)
+        except (IOError, EOFError, pickle.UnpicklingError):
+            return None
+
+    @staticmethod
+    def _store(path, entry):
+        temp_path = "{0}.{1}.tmp".format(path, os.getpid())
+        try:
+            with open(temp_path, 'wb') as entry_file:
+                pickle.dump(entry, entry_file, pickle.HIGHEST_PROTOCOL)
+            os.rename(temp_path, path)
+        except (IOError, OSError, TypeError, pickle.PicklingError):
+            # The entry is still cached in memory for this process
+            pass
+
+
+capabilities = CapabilityRegistry()
+
+
+def skip_unless(get_skip_reason):
+    """
+    @summary: Test decorator that decides whether to skip the test when the
+        test runs rather than when it is decorated, so importing a suite
+        does not make any discovery calls
+    @param get_skip_reason: Callable returning the reason to skip the test,
+        or None to run it
+    @type get_skip_reason: Function
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            skip_reason = get_skip_reason()
+            if skip_reason:
+                raise unittest.SkipTest(skip_reason)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
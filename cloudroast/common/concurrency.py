@@ -0,0 +1,80 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import time
+from multiprocessing.pool import ThreadPool
+
+
+class TaskResult(object):
+    """
+    @summary: Outcome of a single call made by imap_concurrently
+    """
+
+    def __init__(self, item, result=None, error=None, elapsed=None):
+        self.item = item
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return "<TaskResult item={0!r} ok={1} elapsed={2}>".format(
+            self.item, self.ok, self.elapsed)
+
+
+def _timed_call(func, item):
+    start = time.time()
+    try:
+        result = func(item)
+    except Exception as exception:
+        return TaskResult(item, error=exception, elapsed=time.time() - start)
+    return TaskResult(item, result=result, elapsed=time.time() - start)
+
+
+def imap_concurrently(func, items, max_workers):
+    """
+    @summary: Calls func once per item on a bounded pool of threads and
+        yields the results in the order of the items as they become
+        available. Exceptions are captured on the result instead of raised.
+    @param func: Callable that takes a single item
+    @param items: Items to call func with
+    @type items: List
+    @param max_workers: Maximum number of calls in flight
+    @type max_workers: Integer
+    @return: Generator of TaskResult
+    """
+    items = list(items)
+    if not items:
+        return
+    pool = ThreadPool(processes=max(1, min(max_workers, len(items))))
+    try:
+        for task in pool.imap(lambda item: _timed_call(func, item), items):
+            yield task
+    finally:
+        pool.close()
+        pool.join()
+
+
+def map_concurrently(func, items, max_workers):
+    """
+    @summary: Same as imap_concurrently, but waits for all the calls
+    @return: Results in the order of the items
+    @rtype: List of TaskResult
+    """
+    return list(imap_concurrently(func, items, max_workers))
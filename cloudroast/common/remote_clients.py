@@ -0,0 +1,92 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+class RemoteClientCache(object):
+    """
+    @summary: Reuses remote instance clients, and the SSH sessions they hold,
+        for as long as they stay connected. Clients are keyed by server id,
+        ip address and credentials, so a rebuild that changes the admin
+        password gets a new client. Call forget after a server is rebuilt,
+        resized or deleted, and clear when the fixture is done.
+    """
+
+    def __init__(self, server_behaviors):
+        """
+        @param server_behaviors: Behaviors used to create new clients
+        @type server_behaviors: ServerBehaviors
+        """
+        self.server_behaviors = server_behaviors
+        self._clients = {}
+
+    def get_remote_instance_client(self, server, config=None,
+                                   ip_address=None, username=None,
+                                   password=None, key=None,
+                                   auth_strategy=None):
+        """
+        @summary: Returns a connected client for the server, reusing a cached
+            one when it is still connected. Takes the same arguments as
+            ServerBehaviors.get_remote_instance_client.
+        @return: Remote instance client
+        """
+        cache_key = (server.id, ip_address, username,
+                     password or getattr(server, 'admin_pass', None), key,
+                     auth_strategy)
+        client = self._clients.get(cache_key)
+        if client is not None:
+            if self._is_connected(client):
+                return client
+            self._close(self._clients.pop(cache_key))
+
+        client = self.server_behaviors.get_remote_instance_client(
+            server, config, ip_address=ip_address, username=username,
+            password=password, key=key, auth_strategy=auth_strategy)
+        self._clients[cache_key] = client
+        return client
+
+    def forget(self, server_id):
+        """
+        @summary: Closes and drops every cached client for a server
+        @param server_id: Id of the rebuilt, resized or deleted server
+        @type server_id: String
+        """
+        for cache_key in [cache_key for cache_key in self._clients
+                          if cache_key[0] == server_id]:
+            self._close(self._clients.pop(cache_key))
+
+    def clear(self):
+        """
+        @summary: Closes and drops every cached client
+        """
+        for client in self._clients.values():
+            self._close(client)
+        self._clients = {}
+
+    @staticmethod
+    def _is_connected(client):
+        try:
+            return client.can_authenticate()
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(client):
+        ssh_client = getattr(client, 'ssh_client', None)
+        try:
+            ssh_client.close()
+        except Exception:
+            # The session is already gone
+            pass
@@ -0,0 +1,53 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+from hashlib import sha1
+
+from cafe.engine.config import EngineConfig
+
+
+def get_run_id():
+    """
+    @summary: Identifies the current test run. The runner sets a log path
+        per run that its parallel worker processes inherit; without it, the
+        process group of the runner and its workers is used.
+    @rtype: String
+    """
+    log_path = os.environ.get('CAFE_TEST_LOG_PATH')
+    if log_path:
+        return sha1(log_path).hexdigest()
+    return 'pgrp-{0}'.format(os.getpgrp())
+
+
+def get_run_cache_directory(name):
+    """
+    @summary: Returns a directory of the engine temp directory private to the
+        current user and shared only by the processes of the current run,
+        creating it if needed
+    @param name: Name of the cache
+    @type name: String
+    @rtype: String
+    """
+    directory = os.path.join(
+        EngineConfig().temp_directory, name, get_run_id())
+    if not os.path.isdir(directory):
+        try:
+            os.makedirs(directory, 0700)
+        except OSError:
+            # Another runner process created it first
+            pass
+    return directory
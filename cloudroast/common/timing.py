@@ -0,0 +1,102 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import math
+import time
+
+
+def percentile(values, percent):
+    """
+    @summary: Returns the nearest rank percentile of the values
+    @param values: Values to take the percentile of
+    @type values: List
+    @param percent: Percentile to return, between 0 and 100
+    @type percent: Float
+    @return: The percentile, or None if there are no values
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = int(math.ceil(percent / 100.0 * len(ordered)))
+    return ordered[max(rank, 1) - 1]
+
+
+class LatencyRecorder(object):
+    """
+    @summary: Collects the latency of repeated calls and summarizes them as
+        percentiles and throughput
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.latencies = []
+        self.items = 0
+        self.started_at = None
+        self.finished_at = None
+
+    def call(self, func, *args, **kwargs):
+        """
+        @summary: Calls func with the arguments, recording how long it took
+        @return: The result of func
+        """
+        start = time.time()
+        if self.started_at is None:
+            self.started_at = start
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.finished_at = time.time()
+            self.latencies.append(self.finished_at - start)
+
+    def add_items(self, count):
+        """
+        @summary: Counts items handled by the recorded calls, for example
+            the objects returned by a listing, towards the throughput
+        """
+        self.items += count
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0
+        return self.finished_at - self.started_at
+
+    def summary(self):
+        """
+        @summary: Summarizes the recorded calls
+        @return: Count, p50, p99 and max latency in seconds, and calls and
+            items per second
+        @rtype: Dictionary
+        """
+        elapsed = self.elapsed
+        return {
+            'name': self.name,
+            'count': len(self.latencies),
+            'p50': percentile(self.latencies, 50),
+            'p99': percentile(self.latencies, 99),
+            'max': max(self.latencies) if self.latencies else None,
+            'calls_per_second': (
+                len(self.latencies) / elapsed if elapsed else None),
+            'items_per_second': self.items / elapsed if elapsed else None}
+
+    def __str__(self):
+        summary = self.summary()
+        if not summary['count']:
+            return "{0}: no calls".format(self.name)
+        return (
+            "{name}: {count} calls, p50 {p50:.3f}s, p99 {p99:.3f}s, "
+            "max {max:.3f}s, {calls_per_second:.1f} calls/s, "
+            "{items_per_second:.1f} items/s".format(**summary))
@@ -0,0 +1,53 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import time
+
+
+def poll_until(func, condition=bool, timeout=60, interval=1, max_interval=10,
+               backoff=2, ignored_exceptions=()):
+    """
+    @summary: Calls func until condition holds for its result or the timeout
+        expires, sleeping between calls with exponential backoff
+    @param func: Callable taking no arguments
+    @param condition: Callable taking the result of func, defaults to the
+        truth value of the result
+    @param timeout: Seconds after which the last result is returned even if
+        condition does not hold
+    @type timeout: Number
+    @param interval: Seconds to sleep after the first call
+    @type interval: Number
+    @param max_interval: Upper bound for the seconds slept between calls
+    @type max_interval: Number
+    @param backoff: Factor the interval grows by after each call
+    @type backoff: Number
+    @param ignored_exceptions: Exceptions raised by func that count as the
+        condition not holding yet; they are raised again on timeout
+    @type ignored_exceptions: Tuple
+    @return: The last result of func
+    """
+    end_time = time.time() + timeout
+    while True:
+        try:
+            result = func()
+        except ignored_exceptions:
+            if time.time() >= end_time:
+                raise
+        else:
+            if condition(result) or time.time() >= end_time:
+                return result
+        time.sleep(max(0, min(interval, end_time - time.time())))
+        interval = min(interval * backoff, max_interval)
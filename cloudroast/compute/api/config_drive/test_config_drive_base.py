@@ -119,11 +119,10 @@ class ConfigDriveTest(ComputeFixture):
         """
         Verify that config drive size is in expected tolerance
 
-        Get a remote instance client for the server created during test set up.
-        Mount the config drive on the server. Use the remote client to get the
-        size of the config drive directory. Validate that size of the config
-        drive directory is within the tolerance values set during test
-        configuration.
+        Get a snapshot of the config drive of the server created during test
+        set up, which records the size of the mounted config drive directory.
+        Validate that size of the config drive directory is within the
+        tolerance values set during test configuration.
 
         The following assertions occur:
             - The size of the config drive directory is greater than or equal to
@@ -131,20 +130,13 @@ class ConfigDriveTest(ComputeFixture):
             - The size of the config drive directory is less than or equal to
               the config drive maximum size set during test configuration.
         """
-        remote_client = self.server_behaviors.get_remote_instance_client(
-            self.server, self.servers_config, key=self.key.private_key)
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server, servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
-        kb_size = remote_client.get_directory_details(
-            self.config_drive_config.base_path_to_mount)
+        snapshot = self.get_config_drive_snapshot(
+            self.server, key=self.key.private_key)
         self.assertGreaterEqual(
-            kb_size.size, self.config_drive_config.min_size,
+            snapshot.size, self.config_drive_config.min_size,
             msg='New image less than minimum configured tolerance')
         self.assertLessEqual(
-            kb_size.size, self.config_drive_config.max_size,
+            snapshot.size, self.config_drive_config.max_size,
             msg='New image exceeds maximum configured tolerance')
 
     @tags(type='smoke', net='yes')
@@ -152,24 +144,17 @@ class ConfigDriveTest(ComputeFixture):
         """
         User data should match the user data set during server creation
 
-        Get a remote instance client for the server created during test set up.
-        Mount the config drive on the server. Use the remote client to get the
-        details of the user data set during test set up. Validate that the
-        contents of the user data match the contents set during test set up.
+        Get a snapshot of the config drive of the server created during test
+        set up. Validate that the contents of the user data on the snapshot
+        match the contents set during test set up.
 
         The following assertions occur:
             - The contents of the config drive user data on the server created
               during test set up are equal to the user_data_contents set during
               test set up.
         """
-        remote_client = self.server_behaviors.get_remote_instance_client(
-            self.server, self.servers_config, key=self.key.private_key)
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server, servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
-        user_data = remote_client.get_file_details(
-            file_path=self.user_data_filepath).content
+        snapshot = self.get_config_drive_snapshot(
+            self.server, key=self.key.private_key)
+        user_data = snapshot.get_file_content(self.user_data_filepath)
         self.assertEqual(user_data, self.user_data_contents,
                          msg="Userdata does not match expected one")
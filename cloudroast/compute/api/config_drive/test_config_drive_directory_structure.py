@@ -73,29 +73,23 @@ class ConfigDriveDirectoryTest(ComputeFixture):
         """
         A server with config drive enabled should have 'openstack' directories
 
-        Get a remote instance client for the server created during test set up.
-        Mount the config drive on the server. Use the remote client to validate
-        that the '/openstack/latest' directory and the /openstack/latest
-        directory are at the base path to mount directory set during test
-        configuration.
+        Get a snapshot of the config drive of the server created during test
+        set up. Use the snapshot to validate that the '/openstack/latest'
+        directory and the /openstack/latest directory are at the base path to
+        mount directory set during test configuration.
 
         The following assertions occur:
             - The '/openstack/latest' directory is present in the config drive
             - The '/openstack/content' directory is present in the config drive
         """
-        remote_client = self.server_behaviors.get_remote_instance_client(
-            self.server, self.servers_config, key=self.key.private_key)
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server, servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
-        dir_openstack_present = remote_client.is_directory_present(
+        snapshot = self.get_config_drive_snapshot(
+            self.server, key=self.key.private_key)
+        dir_openstack_present = snapshot.is_directory_present(
             directory_path='{0}/openstack/latest'.format(
                 self.config_drive_config.base_path_to_mount))
         self.assertTrue(dir_openstack_present,
                         msg="Directory openstack is present")
-        dir_openstack_content_present = remote_client.is_directory_present(
+        dir_openstack_content_present = snapshot.is_directory_present(
             directory_path='{0}/openstack/content'.format(
                 self.config_drive_config.base_path_to_mount))
         self.assertTrue(dir_openstack_content_present,
@@ -106,22 +100,16 @@ class ConfigDriveDirectoryTest(ComputeFixture):
         """
         A server with config drive enabled should have ec2 directories
 
-        Get a remote instance client for the server created during test set up.
-        Mount the config drive on the server. Use the remote client to validate
-        that the '/ec2/latest' directory is at the base path to mount directory
-        set during test configuration.
+        Get a snapshot of the config drive of the server created during test
+        set up. Use the snapshot to validate that the '/ec2/latest' directory
+        is at the base path to mount directory set during test configuration.
 
         The following assertions occur:
             - The '/ec2/latest' directory is present in the config drive
         """
-        remote_client = self.server_behaviors.get_remote_instance_client(
-            self.server, self.servers_config, key=self.key.private_key)
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server, servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
-        dir_openstack_present = remote_client.is_directory_present(
+        snapshot = self.get_config_drive_snapshot(
+            self.server, key=self.key.private_key)
+        dir_openstack_present = snapshot.is_directory_present(
             directory_path='{0}/ec2/latest'.format(
                 self.config_drive_config.base_path_to_mount))
         self.assertTrue(dir_openstack_present,
@@ -132,23 +120,16 @@ class ConfigDriveDirectoryTest(ComputeFixture):
         """
         User data should not be present unless it was set during server creation
 
-        Get a remote instance client for the server created during test set up.
-        Mount the config drive on the server. Attempting to use the remote client
-        to get the details of the config drive user data should result in a
-        'FileNotFound' error.
+        Get a snapshot of the config drive of the server created during test
+        set up. Attempting to get the config drive user data from the snapshot
+        should result in a 'FileNotFound' error.
 
         The following assertions occur:
             - Attempting to get the file contents of the user data file on
               the server created during set up should raise a 'FileNotFound'
               error
         """
-        remote_client = self.server_behaviors.get_remote_instance_client(
-            self.server, self.servers_config, key=self.key.private_key)
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server, servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
+        snapshot = self.get_config_drive_snapshot(
+            self.server, key=self.key.private_key)
         with self.assertRaises(FileNotFoundException):
-            remote_client.get_file_details(
-                file_path=self.user_data_filepath).content
+            snapshot.get_file_content(self.user_data_filepath)
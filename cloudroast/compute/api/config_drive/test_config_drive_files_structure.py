@@ -72,9 +72,9 @@ class ConfigDriveFilesTest(ComputeFixture):
         """
         Verify OpenStack metadata on config drive
 
-        Mount the config drive on the server. Get the OpenStack metadata on the
-        server and validate that the values of the OpenStack metadata match the
-        expected values.
+        Get a snapshot of the config drive of the server. Get the OpenStack
+        metadata from the snapshot and validate that the values of the
+        OpenStack metadata match the expected values.
 
         The following assertions occur:
             - The server's admin password is equal to the admin password in the
@@ -96,14 +96,10 @@ class ConfigDriveFilesTest(ComputeFixture):
               server created during test set up
         """
         message = "Expected {0} to be {1}, was {2}."
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server, servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
-        openstack_meta = self.config_drive_behaviors.get_openstack_metadata(
-            self.server, self.servers_config, key=self.key.private_key,
-            filepath=self.config_drive_config.openstack_meta_filepath)
+        snapshot = self.get_config_drive_snapshot(
+            self.server, key=self.key.private_key)
+        openstack_meta = snapshot.get_openstack_metadata(
+            self.config_drive_config.openstack_meta_filepath)
         self.assertEqual(self.server.admin_pass, openstack_meta.admin_pass,
                          msg=message.format('Password mismatch',
                                             self.server.admin_pass,
@@ -141,9 +137,9 @@ class ConfigDriveFilesTest(ComputeFixture):
         """
         Verify ec2 metadata on config drive
 
-        Mount the config drive on the server. Get the ec2 metadata on the
-        server and validate that the values of the ec2 metadata match the
-        expected values.
+        Get a snapshot of the config drive of the server. Get the ec2 metadata
+        from the snapshot and validate that the values of the ec2 metadata
+        match the expected values.
 
         The following assertions occur:
             - The ami id in the ec2 metadata is not None
@@ -162,14 +158,10 @@ class ConfigDriveFilesTest(ComputeFixture):
               public key created during test set up.
         """
         message = "Expected {0} to be {1}, was {2}."
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server, servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
-        ec_meta = self.config_drive_behaviors.get_ec_metadata(
-            self.server, self.servers_config, key=self.key.private_key,
-            filepath=self.config_drive_config.ec_meta_filepath)
+        snapshot = self.get_config_drive_snapshot(
+            self.server, key=self.key.private_key)
+        ec_meta = snapshot.get_ec_metadata(
+            self.config_drive_config.ec_meta_filepath)
         self.assertIsNotNone(ec_meta.ami_id,
                              msg="ami_id was not set in the response")
         self.assertIsNotNone(ec_meta.ami_launch_index,
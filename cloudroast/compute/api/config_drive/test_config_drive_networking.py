@@ -45,14 +45,10 @@ class ConfigDriveFilesTest(ComputeFixture):
             key_name=cls.key.name).entity
         cls.resources.add(cls.server.id,
                           cls.servers_client.delete_server)
-        cls.config_drive_behaviors.mount_config_drive(
-            server=cls.server, servers_config=cls.servers_config,
-            key=cls.key.private_key,
-            source_path=cls.config_drive_config.mount_source_path,
-            destination_path=cls.config_drive_config.base_path_to_mount)
-        cls.vendor_meta = cls.config_drive_behaviors.get_vendor_metadata(
-            cls.server, cls.servers_config, key=cls.key.private_key,
-            filepath=cls.config_drive_config.vendor_meta_filepath)
+        snapshot = cls.get_config_drive_snapshot(
+            cls.server, key=cls.key.private_key)
+        cls.vendor_meta = snapshot.get_vendor_metadata(
+            cls.config_drive_config.vendor_meta_filepath)
 
     @tags(type='smoke', net='yes')
     def test_config_drive_network_metadata_dns_services(self):
@@ -49,23 +49,19 @@ class RebootServerHardTests(ComputeFixture):
                   from test configuration.
 
         The following actions are performed during this set up:
-            - A remote instance client is set up for the previously created
-              server
-            - The config drive is mounted at the base path set during test
-              configuration on the previously created server
-            - Using the remote client, the config drive user data is recorded
-            - Using the remote client, the size of the config drive is recorded
-            - The OpenStack metadata of the previously created server is
-              recorded prior to reboot
+            - The config drive of the previously created server is mounted at
+              the base path set during test configuration and pulled in a
+              single snapshot
+            - From the snapshot, the config drive user data, the size of the
+              config drive and the OpenStack metadata are recorded prior to
+              reboot
             - The previously created server is hard rebooted
-            - A fresh remote instance client is set up for the rebooted server
-            - A fresh remote instance client is set up again for the rebooted
-              server
-            - The config drive is mounted at the base path set during test
-              configuration on the rebooted server
-            - Using the remote instance client, it is determined whether the
-              directory '/openstack/content' is present at the base path to
-              mount set during test configuration
+            - The config drive of the rebooted server is mounted again and
+              a fresh snapshot is pulled
+            - From the fresh snapshot, it is determined whether the directory
+              '/openstack/content' is present at the base path to mount set
+              during test configuration, and the OpenStack metadata is
+              recorded after reboot
         """
         super(RebootServerHardTests, cls).setUpClass()
         # set variables
@@ -88,44 +84,27 @@ class RebootServerHardTests(ComputeFixture):
         cls.resources.add(cls.server.id, cls.servers_client.delete_server)
         cls.user_data_filepath = '{0}/openstack/latest/user_data'.format(
             cls.config_drive_config.base_path_to_mount)
-        remote_client = cls.server_behaviors.get_remote_instance_client(
-            cls.server, cls.servers_config, key=cls.key.private_key)
-
-        # Mount config drive
-        cls.config_drive_behaviors.mount_config_drive(
-            server=cls.server, servers_config=cls.servers_config,
-            key=cls.key.private_key,
-            source_path=cls.config_drive_config.mount_source_path,
-            destination_path=cls.config_drive_config.base_path_to_mount)
-        cls.user_data = remote_client.get_file_details(
-            file_path=cls.user_data_filepath).content
-        cls.kb_size = remote_client.get_directory_details(
-            cls.config_drive_config.base_path_to_mount)
 
-        cls.openstack_meta_before_reboot = (
-            cls.config_drive_behaviors.get_openstack_metadata(
-                cls.server, cls.servers_config, key=cls.key.private_key,
-                filepath=cls.config_drive_config.openstack_meta_filepath))
+        # Snapshot the config drive
+        snapshot = cls.get_config_drive_snapshot(
+            cls.server, key=cls.key.private_key)
+        cls.user_data = snapshot.get_file_content(cls.user_data_filepath)
+        cls.kb_size = snapshot.size
+        cls.openstack_meta_before_reboot = snapshot.get_openstack_metadata(
+            cls.config_drive_config.openstack_meta_filepath)
 
         # reboot server
         cls.server_behaviors.reboot_and_await(
             cls.server.id, NovaServerRebootTypes.HARD)
-        remote_client = cls.server_behaviors.get_remote_instance_client(
-            cls.server, config=cls.servers_config, key=cls.key.private_key)
 
-        # Mount config drive
-        cls.user_data_filepath = '{0}/openstack/latest/user_data'.format(
-            cls.config_drive_config.base_path_to_mount)
-        remote_client = cls.server_behaviors.get_remote_instance_client(
-            cls.server, cls.servers_config, key=cls.key.private_key)
-        cls.config_drive_behaviors.mount_config_drive(
-            server=cls.server, servers_config=cls.servers_config,
-            key=cls.key.private_key,
-            source_path=cls.config_drive_config.mount_source_path,
-            destination_path=cls.config_drive_config.base_path_to_mount)
-        cls.dir_openstack_content_present = remote_client.is_directory_present(
-            directory_path='{0}/openstack/content'.format(
+        # Snapshot the config drive again, remounting it
+        snapshot = cls.get_config_drive_snapshot(
+            cls.server, key=cls.key.private_key, refresh=True)
+        cls.dir_openstack_content_present = snapshot.is_directory_present(
+            '{0}/openstack/content'.format(
                 cls.config_drive_config.base_path_to_mount))
+        cls.openstack_meta_after_reboot = snapshot.get_openstack_metadata(
+            cls.config_drive_config.openstack_meta_filepath)
 
     def test_directory_present_after_hard_reboot(self):
         """
@@ -146,9 +125,10 @@ class RebootServerHardTests(ComputeFixture):
         OpenStack metadata should remain consistent through a hard reboot
 
         Get the OpenStack metadata of the server created and hard rebooted
-        during test setup. Validate that the metadata values after a reboot
-        matches the metadata that was recorded during test set up before the
-        reboot. Validate that the metadata contains select key value pairs.
+        during test setup, recorded from the config drive snapshots. Validate
+        that the metadata values after a reboot matches the metadata that was
+        recorded during test set up before the reboot. Validate that the
+        metadata contains select key value pairs.
 
         The following assertions occur:
             - The metadata recorded during test set up prior to the reboot is
@@ -171,10 +151,6 @@ class RebootServerHardTests(ComputeFixture):
               reboot
         """
         message = "Expected {0} to be {1}, was {2}."
-        self.openstack_meta_after_reboot = (
-            self.config_drive_behaviors.get_openstack_metadata(
-                self.server, self.servers_config, key=self.key.private_key,
-                filepath=self.config_drive_config.openstack_meta_filepath))
         self.assertEqual(
             self.openstack_meta_after_reboot,
             self.openstack_meta_before_reboot,
@@ -56,15 +56,12 @@ class ConfigDriveRebuildTest(ComputeFixture):
                   from test configuration.
 
         The following actions are performed during this set up:
-            - A remote instance client is set up for the previously created
-              server
-            - The config drive is mounted at the base path set during test
-              configuration on the previously created server
-            - The details of the mounted config drive are retrieved and the
-              config drive user data, size of the config drive and the open
-              stack metadata prior to the server rebuild are recorded.
-            - The OpenStack metadata of the previously created server is
-              recorded prior to rebuild
+            - The config drive of the previously created server is mounted at
+              the base path set during test configuration and pulled in a
+              single snapshot
+            - From the snapshot, the config drive user data, size of the
+              config drive and the open stack metadata prior to the server
+              rebuild are recorded.
             - The previously created server is rebuilt using:
                 - The alt image id from test configuration
                 - The keypair previously created
@@ -74,15 +71,14 @@ class ConfigDriveRebuildTest(ComputeFixture):
                 - The metadata previously created
                 - Remaining values required for creating a server will come
                   from test configuration.
-            - A fresh remote instance client is set up for the rebuilt server
-            - The config drive is mounted at the base path set during test
-              configuration on the rebuilt server
-            - The details of the mounted config drive are retrieved and the
-              config drive user data, size of the config drive and the open
-              stack metadata after the server rebuild are recorded.
-            - Using the remote instance client, it is determined whether the
-              directory '/openstack/content' is present at the base path to
-              mount set during test configuration
+            - The config drive of the rebuilt server is mounted and a fresh
+              snapshot is pulled
+            - From the fresh snapshot, the config drive user data, size of the
+              config drive and the open stack metadata after the server
+              rebuild are recorded.
+            - From the fresh snapshot, it is determined whether the directory
+              '/openstack/content' is present at the base path to mount set
+              during test configuration
         """
         super(ConfigDriveRebuildTest, cls).setUpClass()
 
@@ -104,24 +100,15 @@ class ConfigDriveRebuildTest(ComputeFixture):
         cls.server = response.entity
         cls.user_data_filepath = '{0}/openstack/latest/user_data'.format(
             cls.config_drive_config.base_path_to_mount)
-        remote_client = cls.server_behaviors.get_remote_instance_client(
-            cls.server, cls.servers_config, key=cls.key.private_key)
         cls.resources.add(cls.server.id, cls.servers_client.delete_server)
 
-        # Mount config drive
-        cls.config_drive_behaviors.mount_config_drive(
-            server=cls.server, servers_config=cls.servers_config,
-            key=cls.key.private_key,
-            source_path=cls.config_drive_config.mount_source_path,
-            destination_path=cls.config_drive_config.base_path_to_mount)
-
-        test_values = cls.config_drive_behaviors.get_config_drive_details(
-            cls.user_data_filepath, cls.config_drive_config.base_path_to_mount,
-            cls.server, cls.servers_config, cls.key.private_key,
+        # Snapshot the config drive
+        snapshot = cls.get_config_drive_snapshot(
+            cls.server, key=cls.key.private_key)
+        cls.user_data = snapshot.get_file_content(cls.user_data_filepath)
+        cls.kb_size = snapshot.size
+        cls.openstack_meta_before_rebuild = snapshot.get_openstack_metadata(
             cls.config_drive_config.openstack_meta_filepath)
-        cls.user_data = test_values[0]
-        cls.kb_size = test_values[1]
-        cls.openstack_meta_before_rebuild = test_values[2]
 
         # Rebuild server
         cls.flavor = response.entity
@@ -131,26 +118,18 @@ class ConfigDriveRebuildTest(ComputeFixture):
         cls.server_behaviors.wait_for_server_status(
             cls.server.id, NovaServerStatusTypes.ACTIVE)
         cls.server = cls.server_response.entity
-        remote_client = cls.server_behaviors.get_remote_instance_client(
-            cls.server, cls.servers_config, key=cls.key.private_key)
-
-        # Mount config drive
-        cls.config_drive_behaviors.mount_config_drive(
-            server=cls.server, servers_config=cls.servers_config,
-            key=cls.key.private_key,
-            source_path=cls.config_drive_config.mount_source_path,
-            destination_path=cls.config_drive_config.base_path_to_mount)
-
-        test_values = cls.config_drive_behaviors.get_config_drive_details(
-            cls.user_data_filepath, cls.config_drive_config.base_path_to_mount,
-            cls.server, cls.servers_config, cls.key.private_key,
+
+        # Snapshot the config drive of the rebuilt server
+        snapshot = cls.get_config_drive_snapshot(
+            cls.server, key=cls.key.private_key, refresh=True)
+        cls.user_data_after = snapshot.get_file_content(
+            cls.user_data_filepath)
+        cls.kb_size_after = snapshot.size
+        cls.openstack_meta_after_rebuild = snapshot.get_openstack_metadata(
             cls.config_drive_config.openstack_meta_filepath)
-        cls.user_data_after = test_values[0]
-        cls.kb_size_after = test_values[1]
-        cls.openstack_meta_after_rebuild = test_values[2]
 
-        cls.dir_openstack_content_present = remote_client.is_directory_present(
-            directory_path='{0}/openstack/content'.format(
+        cls.dir_openstack_content_present = snapshot.is_directory_present(
+            '{0}/openstack/content'.format(
                 cls.config_drive_config.base_path_to_mount))
 
     def test_verify_user_data(self):
@@ -182,9 +161,9 @@ class ConfigDriveRebuildTest(ComputeFixture):
               or equal to the config drive maximum size set during test
               configuration.
         """
-        self.assertGreaterEqual(self.kb_size_after.size,
+        self.assertGreaterEqual(self.kb_size_after,
                                 self.config_drive_config.min_size)
-        self.assertLessEqual(self.kb_size_after.size,
+        self.assertLessEqual(self.kb_size_after,
                              self.config_drive_config.max_size)
 
     def test_directory_present_after_rebuild(self):
@@ -18,7 +18,6 @@ import base64
 from cloudcafe.common.tools.datagen import rand_name
 from cloudroast.compute.fixtures import ComputeFixture
 from cloudcafe.compute.common.types import NovaServerStatusTypes
-from cloudcafe.compute.common.types import InstanceAuthStrategies
 
 
 class ConfigDriveRescueTests(ComputeFixture):
@@ -49,28 +48,23 @@ class ConfigDriveRescueTests(ComputeFixture):
                   from test configuration.
 
         The following actions are performed during this set up:
-            - A remote instance client is set up for the previously created
-              server
-            - The config drive is mounted at the base path set during test
-              configuration on the previously created server
-            - The details of the mounted config drive are retrieved and the
-              config drive user data, size of the config drive and the open
-              stack metadata prior to the server rebuild are recorded.
-            - The OpenStack metadata of the previously created server is
-              recorded prior to rebuild
+            - The config drive of the previously created server is mounted at
+              the base path set during test configuration and pulled in a
+              single snapshot
+            - From the snapshot, the config drive user data, size of the
+              config drive and the open stack metadata prior to the server
+              rescue are recorded.
             - The previously created server is rescued and enters state 'RESCUE'
             - The previously resued server is unrescued and enters state
               'ACTIVE'
-            - A fresh remote instance client is set up for the rescued and
-              unrescued server
-            - The config drive is mounted at the base path set during test
-              configuration on the rebuilt server
-            - Using the remote instance client, it is determined whether the
-              directory '/openstack/content' is present at the base path to
-              mount set during test configuration
-            - The details of the mounted config drive are retrieved and the
-              config drive user data, size of the config drive and the open
-              stack metadata after the server rebuild are recorded.
+            - The config drive of the unrescued server is mounted again and
+              a fresh snapshot is pulled
+            - From the fresh snapshot, it is determined whether the directory
+              '/openstack/content' is present at the base path to mount set
+              during test configuration
+            - From the fresh snapshot, the config drive user data, size of the
+              config drive and the open stack metadata after the server rescue
+              are recorded.
         """
         super(ConfigDriveRescueTests, cls).setUpClass()
 
@@ -100,22 +94,14 @@ class ConfigDriveRescueTests(ComputeFixture):
         cls.user_data_filepath = '{0}/openstack/latest/user_data'.format(
             cls.config_drive_config.base_path_to_mount)
 
-        # mount drive
-        remote_client = cls.server_behaviors.get_remote_instance_client(
-            cls.server, cls.servers_config, key=cls.key.private_key)
-        cls.config_drive_behaviors.mount_config_drive(
-            server=cls.server, servers_config=cls.servers_config,
-            key=cls.key.private_key,
-            source_path=cls.config_drive_config.mount_source_path,
-            destination_path=cls.config_drive_config.base_path_to_mount)
-
-        test_values = cls.config_drive_behaviors.get_config_drive_details(
-            cls.user_data_filepath, cls.config_drive_config.base_path_to_mount,
-            cls.server, cls.servers_config, cls.key.private_key,
+        # Snapshot the config drive
+        snapshot = cls.get_config_drive_snapshot(
+            cls.server, key=cls.key.private_key)
+        cls.user_data_before_rescue = snapshot.get_file_content(
+            cls.user_data_filepath)
+        cls.kb_size_before_rescue = snapshot.size
+        cls.openstack_meta_before_rescue = snapshot.get_openstack_metadata(
             cls.config_drive_config.openstack_meta_filepath)
-        cls.user_data_before_rescue = test_values[0]
-        cls.kb_size_before_rescue = test_values[1]
-        cls.openstack_meta_before_rescue = test_values[2]
 
         # Verify that a server can enter and exit rescue mode
         rescue_response = cls.rescue_client.rescue(cls.server.id)
@@ -130,29 +116,18 @@ class ConfigDriveRescueTests(ComputeFixture):
         # Exit rescue mode
         cls.unrescue_response = cls.rescue_client.unrescue(cls.server.id)
         cls.server_behaviors.wait_for_server_status(cls.server.id, 'ACTIVE')
-        remote_client = cls.server_behaviors.get_remote_instance_client(
-            cls.server, cls.servers_config,
-            auth_strategy=InstanceAuthStrategies.PASSWORD)
 
-        # Mount config drive
-        cls.user_data_filepath = '{0}/openstack/latest/user_data'.format(
-            cls.config_drive_config.base_path_to_mount)
-        cls.config_drive_behaviors.mount_config_drive(
-            server=cls.server, servers_config=cls.servers_config,
-            key=cls.key.private_key,
-            source_path=cls.config_drive_config.mount_source_path,
-            destination_path=cls.config_drive_config.base_path_to_mount)
-        cls.dir_openstack_content_present = remote_client.is_directory_present(
-            directory_path='{0}/openstack/content'.format(
+        # Snapshot the config drive again, remounting it
+        snapshot = cls.get_config_drive_snapshot(
+            cls.server, key=cls.key.private_key, refresh=True)
+        cls.dir_openstack_content_present = snapshot.is_directory_present(
+            '{0}/openstack/content'.format(
                 cls.config_drive_config.base_path_to_mount))
-
-        test_values = cls.config_drive_behaviors.get_config_drive_details(
-            cls.user_data_filepath, cls.config_drive_config.base_path_to_mount,
-            cls.server, cls.servers_config, cls.key.private_key,
+        cls.user_data_after_rescue = snapshot.get_file_content(
+            cls.user_data_filepath)
+        cls.kb_size_after_rescue = snapshot.size
+        cls.openstack_meta_after_rescue = snapshot.get_openstack_metadata(
             cls.config_drive_config.openstack_meta_filepath)
-        cls.user_data_after_rescue = test_values[0]
-        cls.kb_size_after_rescue = test_values[1]
-        cls.openstack_meta_after_rescue = test_values[2]
 
     def test_unresecue_response(self):
         """
@@ -16,8 +16,6 @@ limitations under the License.
 import cloudcafe.compute.common.exceptions as exceptions
 from cafe.drivers.unittest.decorators import tags
 from cloudcafe.common.tools.datagen import rand_name
-from cloudcafe.compute.common.types import NovaImageStatusTypes
-from cloudcafe.compute.common.types import NovaServerStatusTypes
 from cloudroast.compute.fixtures import ComputeFixture
 
 
@@ -30,7 +28,8 @@ class ServerListTest(ComputeFixture):
 
         The following resources are created during the setup
             - Networking, default network from ComputeFixture
-            - 2 servers with the same configuration (waits for active)
+            - 2 servers with the same configuration (built together,
+              waits for active)
             - Image creation from first server (waits for active)
             - 3rd server from image created in step above (waits for active)
         """
@@ -40,44 +39,19 @@ class ServerListTest(ComputeFixture):
         if cls.servers_config.default_network:
             networks = [{'uuid': cls.servers_config.default_network}]
 
-        cls.name = rand_name("server")
-        first_response = cls.servers_client.create_server(
-            name=cls.name, image_ref=cls.image_ref,
-            flavor_ref=cls.flavor_ref, networks=networks).entity
-        cls.resources.add(first_response.id,
-                          cls.servers_client.delete_server)
-
-        cls.name = rand_name("server")
-        second_response = cls.servers_client.create_server(
-            name=cls.name, image_ref=cls.image_ref,
-            flavor_ref=cls.flavor_ref, networks=networks).entity
-        cls.resources.add(second_response.id,
-                          cls.servers_client.delete_server)
-
-        cls.server = cls.server_behaviors.wait_for_server_status(
-            first_response.id, NovaServerStatusTypes.ACTIVE).entity
-        cls.second_server = cls.server_behaviors.wait_for_server_status(
-            second_response.id, NovaServerStatusTypes.ACTIVE).entity
+        cls.server, cls.second_server = cls.provision_resources([
+            cls.server_build(networks=networks),
+            cls.server_build(networks=networks)])
 
         # Create a unique image
-        other_image_name = rand_name('image')
-        resp = cls.servers_client.create_image(
-            cls.second_server.id, other_image_name)
-        assert resp.status_code == 202
-        cls.other_image_id = cls.parse_image_id(resp)
-        cls.resources.add(cls.other_image_id, cls.images_client.delete_image)
-
-        cls.image_behaviors.wait_for_image_status(
-            cls.other_image_id, NovaImageStatusTypes.ACTIVE)
+        cls.other_image_id = cls.provision_resources([
+            cls.image_build(cls.second_server.id)])[0].id
 
         cls.name = rand_name("server")
-        third_response = cls.servers_client.create_server(
-            name=cls.name, image_ref=cls.other_image_id,
-            flavor_ref=cls.flavor_ref_alt, networks=networks).entity
-        cls.resources.add(third_response.id,
-                          cls.servers_client.delete_server)
-        cls.third_server = cls.server_behaviors.wait_for_server_status(
-            third_response.id, NovaServerStatusTypes.ACTIVE).entity
+        cls.third_server, = cls.provision_resources([
+            cls.server_build(name=cls.name, image_ref=cls.other_image_id,
+                             flavor_ref=cls.flavor_ref_alt,
+                             networks=networks)])
 
     @tags(type='smoke', net='no')
     def test_get_server(self):
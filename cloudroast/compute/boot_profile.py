@@ -0,0 +1,350 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import atexit
+import json
+import logging
+import re
+import time
+
+from cloudcafe.compute.common.clients.ping import PingClient
+from cloudcafe.compute.common.types import NovaServerStatusTypes
+
+from cloudroast.common.timing import percentile
+from cloudroast.common.waiting import poll_until
+
+# Boot milestones, in the order a server reaches them
+MILESTONES = ('accepted', 'build', 'active', 'ping', 'ssh')
+
+CLOUD_INIT_STATUS_PATH = '/var/lib/cloud/data/status.json'
+CLOUD_INIT_FINAL_STAGE = 'modules-final'
+CONSOLE_OUTPUT_LENGTH = 500
+
+# Seconds to wait for cloud-init to finish once the server is reachable,
+# after which the stages done so far are reported
+CLOUD_INIT_TIMEOUT = 120
+
+# cloud-init logs a line to the console when each stage starts and when it
+# is done, with the uptime of the server
+CONSOLE_STAGE_PATTERN = re.compile(
+    r"Cloud-init v\. \S+ running '([^']+)' at .*?Up ([\d.]+) seconds")
+CONSOLE_FINISHED_PATTERN = re.compile(
+    r"Cloud-init v\. \S+ finished at .*?Up ([\d.]+) seconds")
+
+
+def parse_cloud_init_status(content):
+    """
+    @summary: Reads the stage durations from the status.json file cloud-init
+        writes on the server
+    @param content: Content of the status file
+    @type content: String
+    @return: Seconds each finished stage took, keyed by stage name
+    @rtype: Dictionary
+    """
+    status = json.loads(content).get('v1', {})
+    stages = {}
+    for name, stage in status.items():
+        if not isinstance(stage, dict):
+            continue
+        if stage.get('start') is None or stage.get('finished') is None:
+            continue
+        stages[name] = stage['finished'] - stage['start']
+    return stages
+
+
+def parse_console_output(output):
+    """
+    @summary: Reads the stage durations from the cloud-init lines of the
+        console output of a server. A stage lasts until the next one starts,
+        the last one until cloud-init is finished.
+    @param output: Console output of the server
+    @type output: String
+    @return: Seconds each finished stage took, keyed by stage name, and the
+        uptime cloud-init finished at as 'finished'
+    @rtype: Dictionary
+    """
+    markers = [(match.start(), match.group(1), float(match.group(2)))
+               for match in CONSOLE_STAGE_PATTERN.finditer(output)]
+    markers.extend(
+        (match.start(), None, float(match.group(1)))
+        for match in CONSOLE_FINISHED_PATTERN.finditer(output))
+    markers.sort()
+
+    stages = {}
+    for (_, name, up), (_, _, next_up) in zip(markers, markers[1:]):
+        if name is not None:
+            stages[name] = next_up - up
+    if markers and markers[-1][1] is None:
+        stages['finished'] = markers[-1][2]
+    return stages
+
+
+class BootProfile(object):
+    """
+    @summary: Times a server took to reach each boot milestone, counted from
+        the create request, and the cloud-init stage durations
+    """
+
+    def __init__(self, server_id, image_ref, flavor_ref, requested_at):
+        self.server_id = server_id
+        self.image_ref = image_ref
+        self.flavor_ref = flavor_ref
+        self.requested_at = requested_at
+        # Server entity once it is active, with the admin password
+        self.server = None
+        self.milestones = {}
+        self.cloud_init = {}
+        self.cloud_init_source = None
+
+    def mark(self, milestone, at=None):
+        self.milestones[milestone] = at if at is not None else time.time()
+
+    @property
+    def timings(self):
+        """
+        @return: Seconds from the create request to each reached milestone
+        @rtype: Dictionary
+        """
+        return dict((milestone, at - self.requested_at)
+                    for milestone, at in self.milestones.items())
+
+    def __str__(self):
+        timings = self.timings
+        reached = ', '.join(
+            '{0} {1:.1f}s'.format(milestone, timings[milestone])
+            for milestone in MILESTONES if milestone in timings)
+        summary = "Boot of server {0} (image {1}, flavor {2}): {3}".format(
+            self.server_id, self.image_ref, self.flavor_ref,
+            reached or 'no milestones')
+        if self.cloud_init_source is None:
+            return summary
+        stages = ', '.join(
+            '{0} {1:.1f}s'.format(name, seconds)
+            for name, seconds in sorted(self.cloud_init.items()))
+        return "{0}; cloud-init from {1}: {2}".format(
+            summary, self.cloud_init_source, stages)
+
+
+class BootProfiler(object):
+    """
+    @summary: Follows a server from its create request until it is active,
+        recording when it was first seen building and became active. When
+        asked to profile the network, it then waits for the server to answer
+        a ping and accept a login, and reads the cloud-init stage timings
+        from the server, or from its console output when SSH is not available
+        or cloud-init does not write a status file. Milestones that are never
+        reached are left out of the profile rather than raising, callers
+        assert on what they need.
+    """
+
+    def __init__(self, servers_client, console_output_client,
+                 remote_clients, servers_config, interval=1):
+        """
+        @param remote_clients: Cache the SSH clients are taken from
+        @type remote_clients: RemoteClientCache
+        @param interval: Seconds between polls, which bounds the precision
+            of the timings
+        @type interval: Number
+        """
+        self.servers_client = servers_client
+        self.console_output_client = console_output_client
+        self.remote_clients = remote_clients
+        self.servers_config = servers_config
+        self.interval = interval
+
+    def _poll(self, func, timeout, condition=bool):
+        return poll_until(func, condition=condition, timeout=timeout,
+                          interval=self.interval,
+                          max_interval=self.interval, backoff=1)
+
+    def profile(self, server, image_ref, flavor_ref, requested_at,
+                accepted_at, key=None, timeout=None, profile_network=False):
+        """
+        @summary: Profiles the boot of a server that was just requested
+        @param server: Server from the create response, with its admin_pass
+        @type server: Server object
+        @param requested_at: Time the create request was sent
+        @type requested_at: Float
+        @param accepted_at: Time the create response was received
+        @type accepted_at: Float
+        @param key: Private key to log in with, if the server has a keypair
+        @type key: String
+        @param timeout: Seconds to wait for each milestone, defaults to the
+            configured server boot timeout
+        @type timeout: Number
+        @param profile_network: Also wait for the server to answer a ping
+            and accept a login, and read its cloud-init stages, which needs
+            a network the test runner can reach the server on
+        @type profile_network: Boolean
+        @rtype: BootProfile
+        """
+        timeout = timeout or self.servers_config.server_boot_timeout
+        profile = BootProfile(server.id, image_ref, flavor_ref, requested_at)
+        profile.mark('accepted', accepted_at)
+
+        active_server = self._wait_for_active(profile, server, timeout)
+        if active_server is None:
+            return profile
+        active_server.admin_pass = server.admin_pass
+        profile.server = active_server
+        if not profile_network:
+            return profile
+
+        if self._wait_for_ping(profile, active_server, timeout):
+            remote_client = self._wait_for_ssh(
+                profile, active_server, key, timeout)
+        else:
+            remote_client = None
+        self._read_cloud_init(profile, remote_client)
+        return profile
+
+    def _wait_for_active(self, profile, server, timeout):
+        def get_status():
+            entity = self.servers_client.get_server(server.id).entity
+            if (entity.status == NovaServerStatusTypes.BUILD and
+                    'build' not in profile.milestones):
+                profile.mark('build')
+            return entity
+
+        server = self._poll(
+            get_status, timeout=timeout,
+            condition=lambda entity: entity.status in (
+                NovaServerStatusTypes.ACTIVE, NovaServerStatusTypes.ERROR))
+        if server.status != NovaServerStatusTypes.ACTIVE:
+            return None
+        profile.mark('active')
+        return server
+
+    def _wait_for_ping(self, profile, server, timeout):
+        address = server.addresses.get_by_name(
+            self.servers_config.network_for_ssh)
+        if self.servers_config.ip_address_version_for_ssh == 4:
+            ip = address.ipv4
+        else:
+            ip = address.ipv6
+        if self._poll(lambda: PingClient.ping(ip), timeout):
+            profile.mark('ping')
+            return True
+        return False
+
+    def _wait_for_ssh(self, profile, server, key, timeout):
+        def connect():
+            try:
+                client = self.remote_clients.get_remote_instance_client(
+                    server, self.servers_config, key=key)
+                return client if client.can_authenticate() else None
+            except Exception:
+                return None
+
+        remote_client = self._poll(connect, timeout)
+        if remote_client is not None:
+            profile.mark('ssh')
+        return remote_client
+
+    def _read_cloud_init(self, profile, remote_client):
+        if remote_client is not None:
+            def read_status():
+                try:
+                    return parse_cloud_init_status(
+                        remote_client.ssh_client.execute_command(
+                            'cat {0}'.format(CLOUD_INIT_STATUS_PATH)).stdout)
+                except Exception:
+                    # cloud-init is too old to write the status file
+                    return None
+
+            stages = self._poll(
+                read_status, CLOUD_INIT_TIMEOUT,
+                condition=lambda stages: (
+                    stages is None or CLOUD_INIT_FINAL_STAGE in stages))
+            if stages:
+                profile.cloud_init = stages
+                profile.cloud_init_source = 'guest'
+                return
+
+        def read_console():
+            console = self.console_output_client.get_console_output(
+                profile.server_id, CONSOLE_OUTPUT_LENGTH).entity
+            return parse_console_output(getattr(console, 'output', '') or '')
+
+        stages = self._poll(
+            read_console, CLOUD_INIT_TIMEOUT,
+            condition=lambda stages: 'finished' in stages)
+        if stages:
+            profile.cloud_init = stages
+            profile.cloud_init_source = 'console'
+
+
+class BootTimingReport(object):
+    """
+    @summary: Collects boot profiles of the whole run and summarizes them per
+        image and flavor. The summary is logged when the process exits.
+    """
+
+    def __init__(self):
+        self.profiles = []
+        self.log = logging.getLogger(__name__)
+        atexit.register(self.log_summary)
+
+    def add(self, profile):
+        self.profiles.append(profile)
+
+    def summary(self):
+        """
+        @return: Per (image, flavor) pair, the number of boots and the p50,
+            p90 and max seconds of each milestone and cloud-init stage
+        @rtype: Dictionary
+        """
+        groups = {}
+        for profile in self.profiles:
+            groups.setdefault(
+                (profile.image_ref, profile.flavor_ref), []).append(profile)
+
+        summary = {}
+        for group, profiles in groups.items():
+            values = {}
+            for profile in profiles:
+                for name, seconds in profile.timings.items():
+                    values.setdefault(name, []).append(seconds)
+                for name, seconds in profile.cloud_init.items():
+                    values.setdefault(
+                        'cloud-init ' + name, []).append(seconds)
+            summary[group] = {
+                'count': len(profiles),
+                'timings': dict(
+                    (name, {'p50': percentile(seconds, 50),
+                            'p90': percentile(seconds, 90),
+                            'max': max(seconds)})
+                    for name, seconds in values.items())}
+        return summary
+
+    def __str__(self):
+        lines = []
+        for (image_ref, flavor_ref), group in sorted(self.summary().items()):
+            lines.append("image {0}, flavor {1}: {2} boots".format(
+                image_ref, flavor_ref, group['count']))
+            timings = group['timings']
+            names = [milestone for milestone in MILESTONES
+                     if milestone in timings]
+            names.extend(sorted(set(timings) - set(MILESTONES)))
+            for name in names:
+                lines.append(
+                    "    {0}: p50 {p50:.1f}s, p90 {p90:.1f}s, "
+                    "max {max:.1f}s".format(name, **timings[name]))
+        return '\n'.join(lines)
+
+    def log_summary(self):
+        if self.profiles:
+            self.log.info("Boot timings:\n{0}".format(self))
@@ -14,9 +14,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import unittest
 from unittest.suite import TestSuite
 
 from cafe.drivers.unittest.decorators import tags
+from cloudcafe.common.tools.check_dict import get_value
 from cloudcafe.common.tools.datagen import rand_name
 from cloudcafe.compute.common.types import NovaServerStatusTypes
 
@@ -28,6 +30,7 @@ def load_tests(loader, standard_tests, pattern):
     suite = TestSuite()
     suite.addTest(CreateServerBurnIn("test_create_server"))
     suite.addTest(CreateServerBurnIn("test_can_ping_created_server"))
+    suite.addTest(CreateServerBurnIn("test_time_to_usable_server"))
     return suite
 
 
@@ -36,19 +39,16 @@ class CreateServerBurnIn(ComputeFixture):
     @classmethod
     def setUpClass(cls):
         super(CreateServerBurnIn, cls).setUpClass()
-        name = rand_name("server")
-        networks = None
-        if cls.servers_config.default_network:
-            networks = [{'uuid': cls.servers_config.default_network}]
         cls.key = cls.keypairs_client.create_keypair(rand_name("key")).entity
         cls.resources.add(cls.key.name,
                           cls.keypairs_client.delete_keypair)
-        cls.create_resp = cls.servers_client.create_server(
-            name, cls.image_ref, cls.flavor_ref,
-            key_name=cls.key.name, networks=networks)
+        cls.create_resp, cls.boot_profile = cls.create_profiled_server(
+            key=cls.key,
+            profile_network=get_value('profile-network') == 'true')
         cls.server = cls.create_resp.entity
-        cls.resources.add(cls.server.id,
-                          cls.servers_client.delete_server)
+        time_to_ssh_slo = get_value('time-to-ssh-slo')
+        cls.time_to_ssh_slo = (
+            float(time_to_ssh_slo) if time_to_ssh_slo else None)
 
     @tags(type='burn-in', net='no')
     def test_create_server(self):
@@ -62,3 +62,19 @@ class CreateServerBurnIn(ComputeFixture):
         remote_client = self.server_behaviors.get_remote_instance_client(
             server, self.servers_config, key=self.key.private_key)
         self.assertTrue(remote_client.can_authenticate())
+
+    @tags(type='burn-in', net='yes')
+    @unittest.skipUnless(get_value('profile-network') == 'true',
+                         'set profile-network to true to time the boot '
+                         'until the server accepts SSH logins')
+    def test_time_to_usable_server(self):
+        timings = self.boot_profile.timings
+        self.assertIn('ssh', timings,
+                      msg="Server never accepted SSH logins: {0}".format(
+                          self.boot_profile))
+        if self.time_to_ssh_slo is not None:
+            self.assertLessEqual(
+                timings['ssh'], self.time_to_ssh_slo,
+                msg="Server took {0:.1f}s to accept SSH logins, more than "
+                    "the {1}s objective".format(
+                        timings['ssh'], self.time_to_ssh_slo))
@@ -0,0 +1,155 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import base64
+import pipes
+import posixpath
+import tarfile
+from StringIO import StringIO
+
+from cloudcafe.compute.common.exceptions import FileNotFoundException
+from cloudcafe.compute.extensions.config_drive.models.\
+    config_drive_openstack_meta import OpenStackMeta
+from cloudcafe.compute.extensions.config_drive.models.\
+    config_drive_ec2_meta import EC2Meta
+from cloudcafe.compute.extensions.config_drive.models.\
+    config_drive_vendor_meta import VendorMetadata
+
+# Mounts the config drive unless it already is, prints its size in KB and
+# then the drive and the extra paths as a base64 encoded tar.gz archive
+SNAPSHOT_COMMAND = (
+    "mkdir -p {mount}; mountpoint -q {mount} || mount {source} {mount}; "
+    "du -sk {mount} | cut -f1; "
+    "tar -czhf - -C / {paths} 2> /dev/null | base64")
+
+
+class ConfigDriveSnapshot(object):
+    """
+    @summary: Local copy of the mounted config drive of a server, and of
+        any other paths asked for, pulled with a single remote command.
+        Directory, file, user data and metadata checks then run against the
+        copy instead of making a remote call each.
+    """
+
+    def __init__(self, mount_path, size, archive_data):
+        """
+        @param mount_path: Path the config drive is mounted at
+        @type mount_path: String
+        @param size: Size of the mounted config drive in KB
+        @type size: Integer
+        @param archive_data: tar.gz archive of the paths, relative to /
+        @type archive_data: String
+        """
+        self.mount_path = mount_path.rstrip('/')
+        self.size = size
+        self._files = {}
+        self._directories = set()
+
+        archive = tarfile.open(fileobj=StringIO(archive_data), mode='r:gz')
+        for member in archive.getmembers():
+            path = posixpath.normpath('/' + member.name)
+            if member.isdir():
+                self._directories.add(path)
+            elif member.isfile():
+                self._files[path] = archive.extractfile(member).read()
+            else:
+                continue
+            # Parent directories are implied by their content
+            parent = posixpath.dirname(path)
+            while parent not in self._directories and parent != '/':
+                self._directories.add(parent)
+                parent = posixpath.dirname(parent)
+        archive.close()
+
+    @classmethod
+    def pull(cls, remote_client, source_path, mount_path, extra_paths=None):
+        """
+        @summary: Mounts the config drive if needed and pulls it, with the
+            extra paths, as one compressed archive
+        @param remote_client: Remote instance client of the server
+        @type remote_client: LinuxClient
+        @param source_path: Device of the config drive
+        @type source_path: String
+        @param mount_path: Path to mount the config drive at
+        @type mount_path: String
+        @param extra_paths: Other absolute paths of the server to include,
+            for ex. files created by cloud-init. Missing ones are skipped.
+        @type extra_paths: List
+        @rtype: ConfigDriveSnapshot
+        """
+        paths = [mount_path] + list(extra_paths or [])
+        command = SNAPSHOT_COMMAND.format(
+            mount=pipes.quote(mount_path), source=pipes.quote(source_path),
+            paths=' '.join(pipes.quote(path.strip('/')) for path in paths))
+        output = remote_client.ssh_client.execute_command(command).stdout
+        size, _, encoded_archive = output.strip().partition('\n')
+        return cls(mount_path, int(size),
+                   base64.b64decode(''.join(encoded_archive.split())))
+
+    def _resolve(self, path):
+        if not path.startswith('/'):
+            path = posixpath.join(self.mount_path, path)
+        return posixpath.normpath(path)
+
+    def is_directory_present(self, directory_path):
+        """
+        @param directory_path: Absolute path, or path in the config drive
+        @type directory_path: String
+        @rtype: Boolean
+        """
+        return self._resolve(directory_path) in self._directories
+
+    def is_file_present(self, file_path):
+        """
+        @param file_path: Absolute path, or path in the config drive
+        @type file_path: String
+        @rtype: Boolean
+        """
+        return self._resolve(file_path) in self._files
+
+    def get_file_content(self, file_path):
+        """
+        @param file_path: Absolute path, or path in the config drive
+        @type file_path: String
+        @return: Content of the file
+        @rtype: String
+        @raise FileNotFoundException: The file was not in the snapshot
+        """
+        path = self._resolve(file_path)
+        if path not in self._files:
+            raise FileNotFoundException(
+                "{0} is not on the config drive snapshot".format(path))
+        return self._files[path]
+
+    def get_openstack_metadata(self, filepath):
+        """
+        @rtype: OpenStackMeta
+        """
+        return OpenStackMeta.deserialize(
+            self.get_file_content(filepath), 'json')
+
+    def get_ec_metadata(self, filepath):
+        """
+        @rtype: EC2Meta
+        """
+        return EC2Meta.deserialize(self.get_file_content(filepath), 'json')
+
+    def get_vendor_metadata(self, filepath):
+        """
+        @rtype: VendorMetadata
+        """
+        return VendorMetadata.deserialize(
+            self.get_file_content(filepath), 'json')
@@ -14,32 +14,37 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import unittest
-
 from cloudcafe.compute.composites import ComputeComposite
 
+from cloudroast.common.capabilities import capabilities, skip_unless
+
+
+def _discover_extensions():
+    """
+    @summary: Returns the names of the extensions listed by compute
+    @rtype: List
+    """
+    compute = ComputeComposite()
+    list_extensions_response = compute.extension.client.list_extensions()
+    if not list_extensions_response.entity:
+        raise Exception('List Exceptions API call malfunctioned. '
+                        'Please see logs for details.')
+    return [element.name for element in list_extensions_response.entity]
+
 
 def requires_extension(*extensions):
     """
     @summary: Requires decorator main purpose skips execution of test if the
-    extension is not found in list extensions call
+    extension is not found in list extensions call. Extensions are listed
+    once per run, when the first decorated test runs.
     @param extensions: List of Extensions that the test requires
     @type extensions: List
     """
-    def decorator(func):
-        compute = ComputeComposite()
-        rescue_client = compute.extension.client
-        list_extensions_response = rescue_client.list_extensions()
-        name_list = set()
-        if list_extensions_response.entity:
-            for element in list_extensions_response.entity:
-                name_list.add(element.name)
-            if set(extensions).issubset(name_list) is False:
-                return unittest.skip("Required extensions are not present for "
-                                     "running this test")(func)
-            else:
-                return func
-        else:
-            raise Exception('List Exceptions API call malfunctioned. '
-                            'Please see logs for details.')
-    return decorator
+    def get_skip_reason():
+        name_list = set(capabilities.get(
+            'compute_extensions', _discover_extensions))
+        if not set(extensions).issubset(name_list):
+            return ("Required extensions are not present for "
+                    "running this test")
+        return None
+    return skip_unless(get_skip_reason)
@@ -65,10 +65,10 @@ class CloudInitActionsTest(ComputeFixture):
         """
         Verify the User Data Script Input Format is working on rebuild.
 
-        Will mount the config drive then get the remote instance to be able
-        to get the file details.  After verifying the contents of the file
-        are as expected, verify that the user data directory exists and the
-        time.txt file is in the directory.
+        Will pull a snapshot of the config drive and of the files created on
+        the instance, to get the file details from.  After verifying the
+        contents of the file are as expected, verify that the user data
+        directory exists and the time.txt file is in the directory.
 
         The following assertions occur:
             - 202 status code response from the rebuild server call.
@@ -78,30 +78,24 @@ class CloudInitActionsTest(ComputeFixture):
             - The time.txt file is present in the user data directory.
         """
         self.assertEqual(202, self.server_response.status_code)
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server_after_rebuild,
-            servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
-        remote_client = self.server_behaviors.get_remote_instance_client(
-            self.server_after_rebuild, self.servers_config,
-            key=self.key.private_key)
-        instance_user_data = remote_client.get_file_details(
+        snapshot = self.get_config_drive_snapshot(
+            self.server_after_rebuild, key=self.key.private_key,
+            extra_paths=[self.cloud_init_config.user_data_created_directory])
+        instance_user_data = snapshot.get_file_content(
             self.user_data_filepath)
-        self.assertEqual(instance_user_data.content,
+        self.assertEqual(instance_user_data,
                          self.user_data_contents,
                          msg='Cloud Init User data provided script does not'
                              'match with what is stored in config drive'
                              'to be {0}, was {1}'.format(
                                  self.user_data_contents,
-                                 instance_user_data.content))
-        dir_script_present = remote_client.is_directory_present(
+                                 instance_user_data))
+        dir_script_present = snapshot.is_directory_present(
             directory_path=self.cloud_init_config.user_data_created_directory)
         self.assertTrue(dir_script_present,
                         msg="Directory that was created by the script was "
                             "not present")
-        file_script_present = remote_client.is_file_present(
+        file_script_present = snapshot.is_file_present(
             '{0}/time.txt'.format(
                 self.cloud_init_config.user_data_created_directory))
         self.assertTrue(file_script_present,
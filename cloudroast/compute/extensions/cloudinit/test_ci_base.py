@@ -30,7 +30,7 @@ class CloudInitBaseTest(ComputeFixture):
 
         The following resources are created during this setup:
             - Creates a keypair.
-            - Creates an active server.
+            - Creates an active server, profiling its boot.
         """
         super(CloudInitBaseTest, cls).setUpClass()
         init_st = cls.config_drive_behaviors.read_cloud_init_for_config_drive(
@@ -40,25 +40,25 @@ class CloudInitBaseTest(ComputeFixture):
         cls.key = cls.keypairs_client.create_keypair(rand_name("key")).entity
         cls.resources.add(cls.key.name,
                           cls.keypairs_client.delete_keypair)
-        cls.server_response = cls.server_behaviors.create_active_server(
-            config_drive=True,
-            key_name=cls.key.name,
+        cls.server_response, cls.boot_profile = cls.create_profiled_server(
+            key=cls.key, profile_network=True, config_drive=True,
             user_data=user_data)
-        cls.server = cls.server_response.entity
+        cls.server = cls.boot_profile.server
+        if cls.server is None:
+            cls.assertClassSetupFailure(
+                'Server never became active: {0}'.format(cls.boot_profile))
         cls.user_data_filepath = '{0}/openstack/latest/user_data'.format(
             cls.config_drive_config.base_path_to_mount)
-        cls.resources.add(cls.server.id,
-                          cls.servers_client.delete_server)
 
     @tags(type='smoke', net='yes')
     def test_user_data_input_format(self):
         """
         Verify the User Data Script Input Format is working as expected.
 
-        Will mount the config drive then get the remote instance to be able
-        to get the file details.  After verifying the contents of the file
-        are as expected, verify that the user data directory exists and the
-        time.txt file is in the directory.
+        Will pull a snapshot of the config drive and of the files created on
+        the instance, to get the file details from.  After verifying the
+        contents of the file are as expected, verify that the user data
+        directory exists and the time.txt file is in the directory.
 
         The following assertions occur:
             - 200 status code response from the create server call.
@@ -68,25 +68,21 @@ class CloudInitBaseTest(ComputeFixture):
             - The time.txt file is present in the user data directory.
         """
         message = "Expected {0} to be {1}, was {2}."
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server, servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
-        remote_client = self.server_behaviors.get_remote_instance_client(
-            self.server, self.servers_config, key=self.key.private_key)
-        instanse_user_data = remote_client.get_file_details(
+        snapshot = self.get_config_drive_snapshot(
+            self.server, key=self.key.private_key,
+            extra_paths=[self.cloud_init_config.user_data_created_directory])
+        instanse_user_data = snapshot.get_file_content(
             self.user_data_filepath)
-        dir_script_present = remote_client.is_directory_present(
+        dir_script_present = snapshot.is_directory_present(
             directory_path=self.cloud_init_config.user_data_created_directory)
         self.assertTrue(dir_script_present,
                         msg="Directory that was created by the script present")
-        self.assertEqual(instanse_user_data.content,
+        self.assertEqual(instanse_user_data,
                          self.user_data_contents,
                          msg=message.format('Script do not match',
-                                            instanse_user_data.content,
+                                            instanse_user_data,
                                             self.user_data_contents))
-        file_script_present = remote_client.is_file_present(
+        file_script_present = snapshot.is_file_present(
             '{0}/time.txt'.format(
                 self.cloud_init_config.user_data_created_directory))
         self.assertTrue(file_script_present,
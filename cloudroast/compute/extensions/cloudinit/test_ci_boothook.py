@@ -55,10 +55,10 @@ class CloudInitBoothookTest(ComputeFixture):
         """
         Verify the Cloud Boothook Input Format is working as expected.
 
-        Will mount the config drive then get the remote instance to be able
-        to get the file details.  After verifying the contents of the file
-        are as expected, verify that the user data directory exists and the
-        part-001 file is in the directory.
+        Will pull a snapshot of the config drive and of the files created on
+        the instance, to get the file details from.  After verifying the
+        contents of the file are as expected, verify that the user data
+        directory exists and the part-001 file is in the directory.
 
         The following assertions occur:
             - 200 status code response from the create server call.
@@ -68,27 +68,24 @@ class CloudInitBoothookTest(ComputeFixture):
             - The content of the part-001 file has a word.
         """
         message = "Expected {0} to be {1}, was {2}."
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server, servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
-        remote_client = self.server_behaviors.get_remote_instance_client(
-            self.server, self.servers_config, key=self.key.private_key)
-        instanse_user_data = remote_client.get_file_details(
+        snapshot = self.get_config_drive_snapshot(
+            self.server, key=self.key.private_key,
+            extra_paths=["/var/lib/cloud/instances/{0}".format(
+                self.server.id)])
+        instanse_user_data = snapshot.get_file_content(
             self.user_data_filepath)
-        self.assertEqual(instanse_user_data.content,
+        self.assertEqual(instanse_user_data,
                          self.user_data_contents,
                          msg=message.format('Configuration do not match',
-                                            instanse_user_data.content,
+                                            instanse_user_data,
                                             self.user_data_contents))
-        boothook_file_present = remote_client.is_file_present(
+        boothook_file_present = snapshot.is_file_present(
             "/var/lib/cloud/instances/{0}/boothooks/part-001".format(
                 self.server.id))
         self.assertTrue(boothook_file_present,
                         msg="Boothook file present on the instance")
-        boothook = remote_client.get_file_details(
+        boothook = snapshot.get_file_content(
             "/var/lib/cloud/instances/{0}/boothooks/part-001".format(
-                self.server.id)).content
+                self.server.id))
         self.assertIn('hello_boothook!', boothook,
                       msg="boothook script is processed")
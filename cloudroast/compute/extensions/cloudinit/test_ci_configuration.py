@@ -55,10 +55,11 @@ class CloudInitConfigTest(ComputeFixture):
         """
         Verify the Cloud Config Input Format is working as expected.
 
-        Will mount the config drive and then get the remote instance to be
-        able to get the file details.  After verifying the contents of the
-        file are as expected, verify that status of manage etc hosts is true
-        and that the hosts file was configured with a pre defined node.
+        Will pull a snapshot of the config drive and of the files checked on
+        the instance, to get the file details from.  After verifying the
+        contents of the file are as expected, verify that status of manage etc
+        hosts is true and that the hosts file was configured with a pre defined
+        node.
 
         The following assertions occur:
             - 200 status code response from the create server call.
@@ -68,19 +69,15 @@ class CloudInitConfigTest(ComputeFixture):
             - The expected node is in the /etc/hosts file.
         """
         message = "Expected {0} to be {1}, was {2}."
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server, servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
-        remote_client = self.server_behaviors.get_remote_instance_client(
-            self.server, self.servers_config, key=self.key.private_key)
-        instanse_user_data = remote_client.get_file_details(
+        snapshot = self.get_config_drive_snapshot(
+            self.server, key=self.key.private_key,
+            extra_paths=['/etc/hosts'])
+        instanse_user_data = snapshot.get_file_content(
             self.user_data_filepath)
-        self.assertEqual(instanse_user_data.content,
+        self.assertEqual(instanse_user_data,
                          self.user_data_contents,
                          msg=message.format('Configuration do not match',
-                                            instanse_user_data.content,
+                                            instanse_user_data,
                                             self.user_data_contents))
         dir_cloud_config_present = self.config_drive_behaviors.\
             status_of_manage_etc_hosts(server=self.server,
@@ -88,6 +85,6 @@ class CloudInitConfigTest(ComputeFixture):
                                        key=self.key.private_key)
         self.assertTrue(dir_cloud_config_present,
                         msg="Managed etc hosts was enabled from script")
-        hosts = remote_client.get_file_details('/etc/hosts').content
+        hosts = snapshot.get_file_content('/etc/hosts')
         self.assertIn('mynode', hosts, msg="Managed etc hosts was enabled "
                       "from script")
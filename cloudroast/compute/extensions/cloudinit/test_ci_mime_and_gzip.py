@@ -55,11 +55,11 @@ class CloudInitMimeGzipTest(ComputeFixture):
         """
         Verify the Gzip Mime Format is working as expected.
 
-        Will mount the config drive and then get the remote instance to be
-        able to get the file details.  After verifying the contents of the
-        file are as expected, verify that status of manage etc hosts is true
-        and that the hosts file was configured with a pre defined node.  Also,
-        verify clouduser is setup in the passwd and group files.
+        Will pull a snapshot of the config drive and of the files checked on
+        the instance, to get the file details from.  After verifying the
+        contents of the file are as expected, verify that status of manage etc
+        hosts is true and that the hosts file was configured with a pre defined
+        node.  Also, verify clouduser is setup in the passwd and group files.
 
         The following assertions occur:
             - 200 status code response from the create server call.
@@ -72,19 +72,15 @@ class CloudInitMimeGzipTest(ComputeFixture):
             - "clouduser" is in the group file.
         """
         message = "Expected {0} to be {1}, was {2}."
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server, servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
-        remote_client = self.server_behaviors.get_remote_instance_client(
-            self.server, self.servers_config, key=self.key.private_key)
-        instanse_user_data = remote_client.get_file_details(
+        snapshot = self.get_config_drive_snapshot(
+            self.server, key=self.key.private_key,
+            extra_paths=['/etc/hosts', '/etc/passwd', '/etc/group'])
+        instanse_user_data = snapshot.get_file_content(
             self.user_data_filepath)
-        self.assertEqual(instanse_user_data.content,
+        self.assertEqual(instanse_user_data,
                          self.user_data_contents,
                          msg=message.format('Script do not match',
-                                            instanse_user_data.content,
+                                            instanse_user_data,
                                             self.user_data_contents))
         # Verification of Configuration part of mime
         dir_cloud_config_present = self.config_drive_behaviors.\
@@ -93,15 +89,15 @@ class CloudInitMimeGzipTest(ComputeFixture):
                                        key=self.key.private_key)
         self.assertTrue(dir_cloud_config_present,
                         msg="Managed etc hosts was enabled from script")
-        hosts = remote_client.get_file_details('/etc/hosts').content
+        hosts = snapshot.get_file_content('/etc/hosts')
         self.assertIn('mynode', hosts, msg="Managed etc hosts was enabled "
                       "from script")
         # Verification of user data script of mime
-        users = remote_client.get_file_details("/etc/passwd").content
+        users = snapshot.get_file_content("/etc/passwd")
         self.assertIn('clouduser:x', users,
                       msg="User is not present")
         self.assertIn('/home/clouduser', users,
                       msg="User is not present")
-        user_groups = remote_client.get_file_details("/etc/group").content
+        user_groups = snapshot.get_file_content("/etc/group")
         self.assertIn('clouduser', user_groups,
                       msg="User is not present")
@@ -55,9 +55,9 @@ class CloudInitPartHandlerTest(ComputeFixture):
         """
         Verify the Cloud Part Handler Input Format is working as expected.
 
-        Will mount the config drive and then get the remote instance to be
-        able to get the file details.  After verifying the contents of the
-        file are as expected, it will verify pre-defined files
+        Will pull a snapshot of the config drive and of the files checked on
+        the instance, to get the file details from.  After verifying the
+        contents of the file are as expected, it will verify pre-defined files
         and their contents.
 
         The following assertions occur:
@@ -68,28 +68,25 @@ class CloudInitPartHandlerTest(ComputeFixture):
             - "My handler is beginning" is in the file obj.pkl.
         """
         message = "Expected {0} to be {1}, was {2}."
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server, servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
-        remote_client = self.server_behaviors.get_remote_instance_client(
-            self.server, self.servers_config, key=self.key.private_key)
-        instanse_user_data = remote_client.get_file_details(
+        snapshot = self.get_config_drive_snapshot(
+            self.server, key=self.key.private_key,
+            extra_paths=["/var/lib/cloud/instances/{0}".format(
+                self.server.id)])
+        instanse_user_data = snapshot.get_file_content(
             self.user_data_filepath)
-        self.assertEqual(instanse_user_data.content,
+        self.assertEqual(instanse_user_data,
                          self.user_data_contents,
                          msg=message.format('Configuration do not match',
-                                            instanse_user_data.content,
+                                            instanse_user_data,
                                             self.user_data_contents))
         file = "/var/lib/cloud/instances/{0}/handlers/part-handler-000.pyc".\
             format(self.server.id)
-        part_handler_file_present = remote_client.is_file_present(
+        part_handler_file_present = snapshot.is_file_present(
             file)
         self.assertTrue(part_handler_file_present,
                         msg="Part Handler file present on the instance")
-        part_handler = remote_client.get_file_details(
+        part_handler = snapshot.get_file_content(
             "/var/lib/cloud/instances/{0}/obj.pkl".format(
-                self.server.id)).content
+                self.server.id))
         self.assertIn('my handler is beginning', str(part_handler),
                       msg="part handler script is processed")
@@ -55,10 +55,10 @@ class CloudInitUpstartTest(ComputeFixture):
         """
         Verify the Cloud Config Input Format is working as expected.
 
-        Will mount the config drive and then get the remote instance to be
-        able to get the file details.  After verifying the contents of the
-        file are as expected, it will verify the pre-defined files
-        and their contents.
+        Will pull a snapshot of the config drive and of the files checked on
+        the instance, to get the file details from.  After verifying the
+        contents of the file are as expected, it will verify the pre-defined
+        files and their contents.
 
         The following assertions occur:
             - 200 status code response from the create server call.
@@ -68,27 +68,24 @@ class CloudInitUpstartTest(ComputeFixture):
             - "HELLO WORLD: $UPSTART_JOB" is in the file obj.pkl.
         """
         message = "Expected {0} to be {1}, was {2}."
-        self.config_drive_behaviors.mount_config_drive(
-            server=self.server, servers_config=self.servers_config,
-            key=self.key.private_key,
-            source_path=self.config_drive_config.mount_source_path,
-            destination_path=self.config_drive_config.base_path_to_mount)
-        remote_client = self.server_behaviors.get_remote_instance_client(
-            self.server, self.servers_config, key=self.key.private_key)
-        instanse_user_data = remote_client.get_file_details(
+        snapshot = self.get_config_drive_snapshot(
+            self.server, key=self.key.private_key,
+            extra_paths=["/var/lib/cloud/instances/{0}".format(
+                self.server.id)])
+        instanse_user_data = snapshot.get_file_content(
             self.user_data_filepath)
-        self.assertEqual(instanse_user_data.content,
+        self.assertEqual(instanse_user_data,
                          self.user_data_contents,
                          msg=message.format('Configuration do not match',
-                                            instanse_user_data.content,
+                                            instanse_user_data,
                                             self.user_data_contents))
-        include_file_present = remote_client.is_file_present(
+        include_file_present = snapshot.is_file_present(
             "/var/lib/cloud/instances/{0}/obj.pkl".format(
                 self.server.id))
         self.assertTrue(include_file_present,
                         msg="Include obj.pkl present on the instance")
-        hosts = remote_client.get_file_details(
+        hosts = snapshot.get_file_content(
             "/var/lib/cloud/instances/{0}/obj.pkl".format(
-                self.server.id)).content
+                self.server.id))
         self.assertIn('HELLO WORLD: $UPSTART_JOB', hosts,
                       msg="include script is processed")
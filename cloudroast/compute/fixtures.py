@@ -14,20 +14,196 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import atexit
 import time
 import sys
 
 from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.common.resources import ResourcePool
+from cloudcafe.common.tools.datagen import rand_name
 from cloudcafe.compute.config import ComputeEndpointConfig, \
     MarshallingConfig
 from cloudcafe.compute.composites import ComputeComposite, \
     ComputeAdminComposite, ComputeIntegrationComposite
 from cloudcafe.compute.common.exception_handler import ExceptionHandler
 from cloudcafe.compute.common.clients.ping import PingClient
-from cloudcafe.compute.common.exceptions import ServerUnreachable
+from cloudcafe.compute.common.exceptions import ServerUnreachable, \
+    BuildErrorException
+from cloudcafe.compute.common.types import NovaServerStatusTypes, \
+    NovaImageStatusTypes
 from cloudcafe.objectstorage.composites import ObjectStorageComposite
 from cloudcafe.blockstorage.volumes_api.common.config import VolumesAPIConfig
+from cloudcafe.blockstorage.volumes_api.common.models import statuses as \
+    volume_statuses
+
+from cloudroast.common.remote_clients import RemoteClientCache
+from cloudroast.compute.boot_profile import BootProfiler, BootTimingReport
+from cloudroast.compute.config_drive_snapshot import ConfigDriveSnapshot
+
+
+class SharedServerPool(object):
+    """
+    @summary: Process wide pool of active servers keyed by their build
+        configuration. Servers in the pool are leased to test classes that
+        only inspect them and are deleted when the process exits.
+    """
+
+    KEYPAIR = 'keypair'
+
+    def __init__(self):
+        self.servers = {}
+        self.keypairs = {}
+        self.resources = ResourcePool()
+        atexit.register(self.resources.release)
+
+    @staticmethod
+    def make_key(image_ref, flavor_ref, networks=None, key_type=None):
+        """
+        @summary: Builds the pool key for a server configuration
+        @param networks: Networks for the server
+        @type networks: List
+        @param key_type: None for password access or SharedServerPool.KEYPAIR
+            for a server built with a pool owned keypair
+        @type key_type: String
+        @return: Hashable (image, flavor, networks, key type) key
+        @rtype: Tuple
+        """
+        network_ids = frozenset(
+            network.get('uuid') for network in networks or [])
+        return image_ref, flavor_ref, network_ids, key_type
+
+    def warm(self, compute, configurations):
+        """
+        @summary: Builds every configuration not already in the pool. All
+            builds are requested before waiting on any of them.
+        @param compute: Composite used to build the servers
+        @type compute: ComputeComposite
+        @param configurations: Keyword arguments accepted by make_key
+        @type configurations: List of dictionaries
+        """
+        pending = {}
+        for configuration in configurations:
+            key = self.make_key(**configuration)
+            if key in self.servers or key in pending:
+                continue
+            pending[key] = self._request_server(
+                compute, configuration.get('networks'), *key)
+
+        for key, created_server in pending.items():
+            server = compute.servers.behaviors.wait_for_server_status(
+                created_server.id, NovaServerStatusTypes.ACTIVE).entity
+            server.admin_pass = created_server.admin_pass
+            self.servers[key] = server
+
+    def lease(self, compute, image_ref, flavor_ref, networks=None,
+              key_type=None):
+        """
+        @summary: Returns an active server for the configuration, building
+            it only if the pool does not hold one yet. Leased servers must
+            not be modified by the caller.
+        @return: The server and the keypair it was built with, if any
+        @rtype: Tuple
+        """
+        configuration = {'image_ref': image_ref, 'flavor_ref': flavor_ref,
+                         'networks': networks, 'key_type': key_type}
+        self.warm(compute, [configuration])
+        key = self.make_key(**configuration)
+        return self.servers[key], self.keypairs.get(key)
+
+    def _request_server(self, compute, networks, image_ref, flavor_ref,
+                        network_ids, key_type):
+        key_name = None
+        if key_type == self.KEYPAIR:
+            keypair = compute.keypairs.client.create_keypair(
+                rand_name("pool_key")).entity
+            self.resources.add(
+                keypair.name, compute.keypairs.client.delete_keypair)
+            self.keypairs[(image_ref, flavor_ref, network_ids, key_type)] = \
+                keypair
+            key_name = keypair.name
+
+        server = compute.servers.client.create_server(
+            rand_name("pool_server"), image_ref, flavor_ref,
+            key_name=key_name, networks=networks).entity
+        self.resources.add(server.id, compute.servers.client.delete_server)
+        return server
+
+
+shared_server_pool = SharedServerPool()
+boot_timing_report = BootTimingReport()
+
+
+class ResourceBuild(object):
+    """
+    @summary: A single server, volume or image build submitted through
+        ComputeFixture.provision_resources
+    """
+
+    def __init__(self, description, create, get, ready_status, error_status,
+                 delete, id_attr='id', get_id=None):
+        """
+        @param description: Name of the build used in failure reports
+        @type description: String
+        @param create: Callable that requests the build and returns the
+            create response
+        @param get: Callable that takes the resource id and returns the
+            current entity
+        @param delete: Callable that takes the resource id and deletes it
+        @param id_attr: Name of the id attribute on the created entity
+        @type id_attr: String
+        @param get_id: Callable that takes the create response and returns
+            the resource id, for responses without an entity
+        """
+        self.description = description
+        self.ready_status = ready_status
+        self.error_status = error_status
+        self.id_attr = id_attr
+        self._get_id = get_id
+        self._create = create
+        self._get = get
+        self._delete = delete
+        self.created = None
+        self.id = None
+        self.entity = None
+        self.error = None
+
+    @property
+    def done(self):
+        return self.entity is not None or self.error is not None
+
+    def submit(self, resources):
+        try:
+            response = self._create()
+        except Exception as exception:
+            self.error = "Create request failed: {0}".format(exception)
+            return
+        if not response.ok or (
+                self._get_id is None and response.entity is None):
+            raise BuildErrorException(
+                "Create request for {0} failed with status code {1}".format(
+                    self.description, response.status_code))
+        self.created = response.entity
+        if self._get_id is not None:
+            self.id = self._get_id(response)
+        else:
+            self.id = getattr(self.created, self.id_attr)
+        resources.add(self.id, self._delete)
+
+    def poll(self):
+        try:
+            entity = self._get(self.id)
+        except Exception as exception:
+            self.error = "Status request failed: {0}".format(exception)
+            return
+        if entity is None:
+            self.error = "Status request returned no entity"
+        elif entity.status == self.error_status:
+            self.error = "Build went to {0} status".format(entity.status)
+        elif entity.status == self.ready_status:
+            admin_pass = getattr(self.created, 'admin_pass', None)
+            if admin_pass:
+                entity.admin_pass = admin_pass
+            self.entity = entity
 
 
 class ComputeFixture(BaseTestFixture):
@@ -93,6 +269,12 @@ class ComputeFixture(BaseTestFixture):
         cls.flavors_client.add_exception_handler(cls.compute_exception_handler)
         cls.resources = ResourcePool()
         cls.addClassCleanup(cls.resources.release)
+        cls.remote_clients = RemoteClientCache(cls.server_behaviors)
+        cls.addClassCleanup(cls.remote_clients.clear)
+        cls.config_drive_snapshots = {}
+        cls.boot_profiler = BootProfiler(
+            cls.servers_client, cls.console_output_client,
+            cls.remote_clients, cls.servers_config)
 
     @classmethod
     def tearDownClass(cls):
@@ -108,6 +290,194 @@ class ComputeFixture(BaseTestFixture):
                 self.resources.resources = []
         super(ComputeFixture, self).tearDownClass()
 
+    @classmethod
+    def lease_server(cls, image_ref=None, flavor_ref=None, networks=None,
+                     key_type=None):
+        """
+        @summary: Leases an active server from the shared server pool. Only
+            use this from classes that do not modify the server.
+        @param image_ref: Image id, defaults to the primary image
+        @type image_ref: String
+        @param flavor_ref: Flavor id, defaults to the primary flavor
+        @type flavor_ref: String
+        @param networks: Networks, defaults to the configured default network
+        @type networks: List
+        @param key_type: None or SharedServerPool.KEYPAIR
+        @type key_type: String
+        @return: The server and the keypair it was built with, if any
+        @rtype: Tuple
+        """
+        if networks is None and cls.servers_config.default_network:
+            networks = [{'uuid': cls.servers_config.default_network}]
+        return shared_server_pool.lease(
+            cls.compute, image_ref=image_ref or cls.image_ref,
+            flavor_ref=flavor_ref or cls.flavor_ref, networks=networks,
+            key_type=key_type)
+
+    @classmethod
+    def server_build(cls, name=None, image_ref=None, flavor_ref=None,
+                     **kwargs):
+        """
+        @summary: Describes a server build for provision_resources
+        @param kwargs: Additional arguments for the create server request
+        @return: Build that waits for the server to become active
+        @rtype: ResourceBuild
+        """
+        name = name or rand_name("server")
+
+        def create():
+            return cls.servers_client.create_server(
+                name, image_ref or cls.image_ref,
+                flavor_ref or cls.flavor_ref, **kwargs)
+
+        return ResourceBuild(
+            "server {0}".format(name), create,
+            lambda server_id: cls.servers_client.get_server(server_id).entity,
+            NovaServerStatusTypes.ACTIVE, NovaServerStatusTypes.ERROR,
+            cls.servers_client.delete_server)
+
+    @classmethod
+    def image_build(cls, server_id, name=None):
+        """
+        @summary: Describes an image build from a server for
+            provision_resources
+        @param server_id: Server to create the image from
+        @type server_id: String
+        @return: Build that waits for the image to become active
+        @rtype: ResourceBuild
+        """
+        name = name or rand_name("image")
+
+        def create():
+            return cls.servers_client.create_image(server_id, name)
+
+        return ResourceBuild(
+            "image {0}".format(name), create,
+            lambda image_id: cls.images_client.get_image(image_id).entity,
+            NovaImageStatusTypes.ACTIVE, NovaImageStatusTypes.ERROR,
+            cls.images_client.delete_image, get_id=cls.parse_image_id)
+
+    @classmethod
+    def provision_resources(cls, builds, timeout=None, interval=None,
+                            raise_on_failure=True):
+        """
+        @summary: Submits all builds, then polls them together from a single
+            loop until each one is ready, has failed or the timeout expires
+        @param builds: Builds created by server_build, image_build or
+            volume_build
+        @type builds: List of ResourceBuild
+        @param timeout: Seconds to wait for all builds, defaults to the
+            configured server build timeout
+        @type timeout: Integer
+        @param interval: Seconds between polls, defaults to the configured
+            server status interval
+        @type interval: Integer
+        @param raise_on_failure: Raise after polling if any build failed.
+            A rejected create request raises right away regardless.
+        @type raise_on_failure: Boolean
+        @return: Entities of the builds in the order given, None for
+            builds that failed
+        @rtype: List
+        """
+        timeout = timeout or cls.servers_config.server_build_timeout
+        interval = interval or cls.servers_config.server_status_interval
+
+        for build in builds:
+            build.submit(cls.resources)
+
+        end_time = time.time() + timeout
+        pending = [build for build in builds if not build.done]
+        while pending:
+            for build in pending:
+                build.poll()
+            pending = [build for build in pending if not build.done]
+            if pending and time.time() >= end_time:
+                for build in pending:
+                    build.error = "Not ready after {0} seconds".format(
+                        timeout)
+                break
+            if pending:
+                time.sleep(interval)
+
+        failures = ["{0}: {1}".format(build.description, build.error)
+                    for build in builds if build.error]
+        if failures and raise_on_failure:
+            raise BuildErrorException(
+                "{0} of {1} builds failed: {2}".format(
+                    len(failures), len(builds), '; '.join(failures)))
+        return [build.entity for build in builds]
+
+    @classmethod
+    def create_profiled_server(cls, name=None, image_ref=None,
+                               flavor_ref=None, key=None,
+                               profile_network=False, **kwargs):
+        """
+        @summary: Creates a server and profiles its boot until it is active,
+            or until it accepts SSH logins when profile_network is set. The
+            profile is logged and added to the per image and flavor boot
+            timing report of the run.
+        @param key: Keypair to build the server with
+        @type key: Keypair object
+        @param profile_network: Also profile the ping, SSH and cloud-init
+            milestones, for tests that can reach the server
+        @type profile_network: Boolean
+        @return: The create server response and the boot profile
+        @rtype: Tuple
+        """
+        image_ref = image_ref or cls.image_ref
+        flavor_ref = flavor_ref or cls.flavor_ref
+        if key is not None:
+            kwargs['key_name'] = key.name
+        if 'networks' not in kwargs and cls.servers_config.default_network:
+            kwargs['networks'] = [
+                {'uuid': cls.servers_config.default_network}]
+
+        requested_at = time.time()
+        create_resp = cls.servers_client.create_server(
+            name or rand_name("server"), image_ref, flavor_ref, **kwargs)
+        accepted_at = time.time()
+        server = create_resp.entity
+        cls.resources.add(server.id, cls.servers_client.delete_server)
+
+        profile = cls.boot_profiler.profile(
+            server, image_ref, flavor_ref, requested_at, accepted_at,
+            key=key.private_key if key is not None else None,
+            profile_network=profile_network)
+        boot_timing_report.add(profile)
+        cls.fixture_log.info(str(profile))
+        return create_resp, profile
+
+    @classmethod
+    def get_config_drive_snapshot(cls, server, key=None, extra_paths=None,
+                                  refresh=False):
+        """
+        @summary: Mounts the config drive of a server and pulls it, with the
+            extra paths, in a single remote call. Snapshots are cached per
+            server, pass refresh after the server is rebooted, rebuilt or
+            rescued to pull a new one.
+        @param server: Server with config drive enabled
+        @type server: Server object
+        @param key: Private key of the server keypair
+        @type key: String
+        @param extra_paths: Other absolute paths of the server to include
+        @type extra_paths: List
+        @param refresh: Pull a new snapshot even if one is cached
+        @type refresh: Boolean
+        @rtype: ConfigDriveSnapshot
+        """
+        cache_key = (server.id, tuple(extra_paths or []))
+        snapshot = cls.config_drive_snapshots.get(cache_key)
+        if snapshot is None or refresh:
+            if refresh:
+                cls.remote_clients.forget(server.id)
+            remote_client = cls.remote_clients.get_remote_instance_client(
+                server, cls.servers_config, key=key)
+            snapshot = ConfigDriveSnapshot.pull(
+                remote_client, cls.config_drive_config.mount_source_path,
+                cls.config_drive_config.base_path_to_mount, extra_paths)
+            cls.config_drive_snapshots[cache_key] = snapshot
+        return snapshot
+
     @classmethod
     def parse_image_id(cls, image_response):
         """
@@ -257,6 +627,28 @@ class BlockstorageIntegrationFixture(ComputeFixture):
         cls.blockstorage_client = volumes.client
         cls.blockstorage_behavior = volumes.behaviors
 
+    @classmethod
+    def volume_build(cls, size=None, volume_type=None, **kwargs):
+        """
+        @summary: Describes a volume build for provision_resources
+        @param kwargs: Additional arguments for the create volume request
+        @return: Build that waits for the volume to become available
+        @rtype: ResourceBuild
+        """
+        size = size or cls.volume_size
+        volume_type = volume_type or cls.volume_type
+
+        def create():
+            return cls.blockstorage_client.create_volume(
+                size, volume_type, **kwargs)
+
+        return ResourceBuild(
+            "volume of size {0}".format(size), create,
+            lambda volume_id: cls.blockstorage_client.get_volume_info(
+                volume_id).entity,
+            volume_statuses.Volume.AVAILABLE, volume_statuses.Volume.ERROR,
+            cls.blockstorage_client.delete_volume, id_attr='id_')
+
 
 class ObjectstorageIntegrationFixture(ComputeFixture):
 
@@ -270,10 +662,16 @@ class ObjectstorageIntegrationFixture(ComputeFixture):
 
 class ServerFromImageFixture(ComputeFixture):
 
+    # Classes that never modify their server can set this to lease one from
+    # the shared server pool instead of building their own
+    lease_shared_server = False
+
     @classmethod
     def create_server(cls, flavor_ref=None, key_name=None, image_ref=None):
         """
-        @summary:Creates a server from image and waits for active status
+        @summary:Creates a server from image and waits for active status.
+            If the class leases shared servers and no key name is given, an
+            active server is leased from the shared server pool instead.
         @param flavor_ref: The flavor used to build the server.
         @type key_name: String
         @param key_name: Generated key for the instance
@@ -284,6 +682,10 @@ class ServerFromImageFixture(ComputeFixture):
             the server domain object
         @rtype: Request Response Object
         """
+        if cls.lease_shared_server and key_name is None:
+            cls.server, _ = cls.lease_server(
+                image_ref=image_ref, flavor_ref=flavor_ref)
+            return cls.server
         cls.server_response = cls.server_behaviors.create_active_server(
             flavor_ref=flavor_ref, key_name=key_name, image_ref=image_ref)
         cls.server = cls.server_response.entity
@@ -309,15 +711,19 @@ class ServerFromVolumeV1Fixture(BlockstorageIntegrationFixture):
         failures = []
         attempts = cls.servers_config.resource_build_attempts
         for attempt in range(attempts):
-            try:
-                cls.volume = cls.blockstorage_behavior.create_available_volume(
-                    size=cls.volume_size,
-                    volume_type=cls.volume_type,
-                    image_ref=cls.image_ref)
-            except Exception as ex:
-                if '507' in ex.message:
-                    time.sleep(cls.servers_config.server_status_interval)
-                failures.append(ex.message)
+            build = cls.volume_build(image_ref=cls.image_ref)
+            cls.volume, = cls.provision_resources(
+                [build], timeout=cls.volume_create_timeout,
+                interval=cls.poll_frequency, raise_on_failure=False)
+            if cls.volume:
+                break
+            if '507' in build.error:
+                time.sleep(cls.servers_config.server_status_interval)
+            failures.append(build.error)
+        else:
+            raise BuildErrorException(
+                "Volume for boot from volume server failed to build after "
+                "{0} attempts: {1}".format(attempts, '; '.join(failures)))
         # Creating block device mapping used for server creation
         cls.block_device_mapping_matrix = [{
             "volume_id": cls.volume.id_,
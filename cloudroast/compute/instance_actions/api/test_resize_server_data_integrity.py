@@ -67,7 +67,7 @@ class ResizeServerDataIntegrityTests(object):
             self.server.id, 'resize_migrating',
             self.servers_config.server_build_timeout)
         # Inject sample file
-        remote_client = self.server_behaviors.get_remote_instance_client(
+        remote_client = self.remote_clients.get_remote_instance_client(
             self.server, self.servers_config, key=self.key.private_key)
         prototype_file = remote_client.create_file(
             file_name='tst.txt',
@@ -82,8 +82,11 @@ class ResizeServerDataIntegrityTests(object):
         self.server_behaviors.wait_for_server_status(
             server_to_resize.id, NovaServerStatusTypes.ACTIVE)
 
+        # The session opened during the resize does not survive it
+        self.remote_clients.forget(server_to_resize.id)
+
         # Check if the file exist after resize confirm
-        remote_client = self.server_behaviors.get_remote_instance_client(
+        remote_client = self.remote_clients.get_remote_instance_client(
             self.server, self.servers_config, key=self.key.private_key)
         file = remote_client.get_file_details(
             file_path='{0}/tst.txt'.format(
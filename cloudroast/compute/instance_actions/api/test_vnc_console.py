@@ -124,6 +124,8 @@ class ServerVncConsoleTests(object):
 class ServerFromImageVncConsoleTests(ServerFromImageFixture,
                                      ServerVncConsoleTests):
 
+    lease_shared_server = True
+
     @classmethod
     def setUpClass(cls):
         """
@@ -23,6 +23,8 @@ from cloudcafe.identity.v2_0.tokens_api.client import TokenAPI_Client
 from cloudcafe.identity.v2_0.tokens_api.behaviors import TokenAPI_Behaviors
 from cloudcafe.identity.v2_0.tokens_api.config import TokenAPI_Config
 
+from cloudroast.common.auth_cache import access_data_cache
+
 
 class DBaaSFixture(BaseTestFixture):
     """
@@ -51,10 +53,14 @@ class DBaaSFixture(BaseTestFixture):
                                        identity_config.serialize_format,
                                        identity_config.deserialize_format)
         token_behaviors = TokenAPI_Behaviors(token_client)
-        access_data = token_behaviors.get_access_data(
-            identity_config.username,
-            identity_config.password,
-            identity_config.tenant_name)
+        access_data = access_data_cache.get_access_data(
+            identity_config.endpoint, identity_config.SECTION_NAME,
+            lambda: token_behaviors.get_access_data(
+                identity_config.username,
+                identity_config.password,
+                identity_config.tenant_name),
+            username=identity_config.username,
+            tenant=identity_config.tenant_name)
         dbaas_service = access_data.get_service(identity_config.endpoint)
         cls.auth_url = "{0}/v2.0/tokens".format(identity_config.endpoint)
         #check for role
@@ -23,10 +23,15 @@ from cloudcafe.designate.v1.domain_api.client import DomainAPIClient
 from cloudcafe.designate.v1.server_api.client import ServerAPIClient
 from cloudcafe.designate.behaviors import DomainBehaviors
 from cloudcafe.designate.behaviors import ServerBehaviors
+from cloudroast.common.concurrency import map_concurrently
+from cloudroast.common.timing import percentile
 
 
 class DesignateFixture(BaseTestFixture):
 
+    # Maximum number of calls in flight when verifying listed resources
+    fan_out_workers = 10
+
     @classmethod
     def setUpClass(cls):
         super(DesignateFixture, cls).setUpClass()
@@ -50,6 +55,40 @@ class DesignateFixture(BaseTestFixture):
     def tearDownClass(cls):
         cls.resources.release()
 
+    def verify_concurrently(self, call, items, expected_status=200,
+                            max_workers=None):
+        """
+        Calls call once per item, with at most max_workers calls in flight
+        (fan_out_workers by default), and fails listing every item whose
+        call raised or returned an unexpected status code. The latency
+        percentiles of the calls are logged and returned with the responses.
+        """
+        results = map_concurrently(call, items,
+                                   max_workers or self.fan_out_workers)
+
+        latencies = [result.elapsed for result in results]
+        latency = dict(
+            ('p{0}'.format(percent), percentile(latencies, percent))
+            for percent in (50, 90, 99))
+        if results:
+            self.fixture_log.info(
+                '{0} calls to {1}: p50 {p50:.3f}s, p90 {p90:.3f}s, '
+                'p99 {p99:.3f}s'.format(
+                    len(results), getattr(call, '__name__', call),
+                    **latency))
+
+        failures = []
+        for result in results:
+            if not result.ok:
+                failures.append('{0}: {1!r}'.format(result.item, result.error))
+            elif result.result.status_code != expected_status:
+                failures.append('{0}: status code {1}'.format(
+                    result.item, result.result.status_code))
+        self.assertFalse(
+            failures, '{0} of {1} calls failed:\n{2}'.format(
+                len(failures), len(results), '\n'.join(failures)))
+        return [result.result for result in results], latency
+
 
 class ServersFixture(DesignateFixture):
 
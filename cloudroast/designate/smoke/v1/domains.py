@@ -32,9 +32,8 @@ class DomainTest(DomainsFixture):
         self.assertGreater(len(list_resp.entity), 0)
 
         domains = list_resp.entity
-        for domain in domains:
-            get_resp = self.domain_client.get_domain(domain.id)
-            self.assertEquals(get_resp.status_code, 200)
+        self.verify_concurrently(self.domain_client.get_domain,
+                                 [domain.id for domain in domains])
 
     @tags('smoke', 'positive')
     def test_create_domain(self):
@@ -75,3 +74,5 @@ class DomainTest(DomainsFixture):
 
         servers = list_resp.entity
         self.assertGreater(len(servers), 0)
+        self.verify_concurrently(self.server_client.get_server,
+                                 [server.id for server in servers])
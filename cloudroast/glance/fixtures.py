@@ -16,7 +16,6 @@ limitations under the License.
 
 from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.auth.config import UserAuthConfig
-from cloudcafe.auth.provider import AuthProvider
 from cloudcafe.common.resources import ResourcePool
 from cloudcafe.compute.config import ComputeEndpointConfig
 from cloudcafe.compute.flavors_api.config import FlavorsConfig
@@ -41,6 +40,8 @@ from cloudcafe.objectstorage.objectstorage_api.config import (
     ObjectStorageAPIConfig)
 
 from cloudroast.blockstorage.volumes_api.fixtures import VolumesTestFixture
+from cloudroast.common.auth_cache import (
+    create_cached_auth_composite, get_access_data)
 from cloudroast.compute.fixtures import ComputeFixture
 from cloudroast.objectstorage.fixtures import ObjectStorageFixture
 
@@ -53,10 +54,13 @@ class ImagesFixture(BaseTestFixture):
         super(ImagesFixture, cls).setUpClass()
         cls.resources = ResourcePool()
 
-        cls.user_one = ImagesAuthComposite()
-        cls.user_two = ImagesAuthCompositeAltOne()
-        cls.user_three = ImagesAuthCompositeAltTwo()
-        cls.user_admin = ImagesAuthCompositeAdmin()
+        # Each user authenticates once per run rather than once per class
+        cls.user_one = create_cached_auth_composite(ImagesAuthComposite)
+        cls.user_two = create_cached_auth_composite(ImagesAuthCompositeAltOne)
+        cls.user_three = create_cached_auth_composite(
+            ImagesAuthCompositeAltTwo)
+        cls.user_admin = create_cached_auth_composite(
+            ImagesAuthCompositeAdmin)
 
         cls.images = ImagesComposite(cls.user_one)
         cls.images_alt_one = ImagesComposite(cls.user_two)
@@ -90,7 +94,7 @@ class ImagesIntegrationFixture(ComputeFixture, ImagesFixture,
         servers_config = ServersConfig()
         user_config_alt_one = AltOneUserConfig()
 
-        access_data_alt_one = AuthProvider.get_access_data(
+        access_data_alt_one = get_access_data(
             auth_endpoint_config, user_config_alt_one)
 
         # Create compute clients and behaviors for alt_one user
@@ -18,7 +18,6 @@ import re
 
 from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.auth.config import UserAuthConfig, UserConfig
-from cloudcafe.auth.provider import AuthProvider
 from cloudcafe.common.resources import ResourcePool
 from cloudcafe.compute.common.exception_handler import ExceptionHandler
 from cloudcafe.compute.config import ComputeEndpointConfig
@@ -43,6 +42,8 @@ from cloudcafe.objectstorage.objectstorage_api.client import (
 from cloudcafe.objectstorage.objectstorage_api.config import (
     ObjectStorageAPIConfig)
 
+from cloudroast.common.auth_cache import get_access_data
+
 
 class ImagesFixture(BaseTestFixture):
     """@summary: Fixture for Cloud Images api"""
@@ -128,7 +129,8 @@ class ImagesFixture(BaseTestFixture):
             user_list[user][cls.CONFIG] = UserConfig(section_name=user)
             user_list[user][cls.CONFIG].SECTION_NAME = user
 
-            access_data = AuthProvider.get_access_data(
+            # Authenticate each user once per run rather than once per class
+            access_data = get_access_data(
                 cls.endpoint_config,
                 user_config=user_list[user][cls.CONFIG])
             # If authentication fails, fail immediately
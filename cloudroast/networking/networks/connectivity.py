@@ -0,0 +1,347 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pipes
+import re
+
+from cloudroast.common.waiting import poll_until
+
+PROBE_SCRIPT_NAME = 'connectivity_probe.sh'
+
+# Shipped once per server, every check is then a single remote command
+PROBE_SCRIPT = r'''#!/bin/sh
+dir=$(dirname "$0")
+action=$1
+family=
+if [ "$2" = "6" ]; then
+    family=-6
+fi
+shift 2
+case $action in
+listen-tcp)
+    for port in "$@"; do
+        nohup nc $family -l $port > /dev/null 2>&1 &
+    done
+    ;;
+listen-udp)
+    for port in "$@"; do
+        pkill -f "nc.* -u -l $port\$" > /dev/null 2>&1
+        rm -f "$dir/udp_$port"
+        nohup nc $family -u -l $port > "$dir/udp_$port" 2> /dev/null &
+    done
+    ;;
+send-tcp)
+    ip=$1
+    shift
+    nc -z -n -v $family $ip "$@" -w 2
+    ;;
+send-udp)
+    ip=$1
+    port=$2
+    printf '%s' "$3" | nc $family -u -n -v $ip $port -w 3
+    ;;
+read-udp)
+    cat "$dir/udp_$1"
+    ;;
+esac
+'''
+
+TCP_SUCCEEDED_REGEX = re.compile(
+    r'(?P<port>\d+) port \[(?P<protocol>\w+)/[^\]]*\] succeeded!')
+TCP_FAILED_REGEX = re.compile(
+    r'(?P<port>\d+) \((?P<protocol>\w+)\) (?P<status>timed out|failed): .*')
+
+
+class ProbeResult(object):
+    """
+    @summary: Outcome of a single port check
+    """
+
+    def __init__(self, protocol, port, ok, output, received=None):
+        self.protocol = protocol
+        self.port = str(port)
+        self.ok = ok
+        self.output = output
+        self.received = received
+
+    def __repr__(self):
+        return '<ProbeResult {0}/{1} ok={2}>'.format(
+            self.protocol, self.port, self.ok)
+
+
+class ConnectivityProbe(object):
+    """
+    @summary: Runs TCP and UDP port checks between servers with a probe script
+        that is shipped once per server and ssh session, so each check costs
+        a single remote command instead of several file and netcat round
+        trips
+    """
+
+    def __init__(self, dir_path='/root'):
+        """
+        @param dir_path: directory on the servers for the probe script and
+            the data received by UDP listeners
+        @type dir_path: str
+        """
+        self.dir_path = dir_path
+        self.script_path = '{0}/{1}'.format(
+            dir_path.rstrip('/'), PROBE_SCRIPT_NAME)
+        self._installed = set()
+
+    def install(self, remote_client):
+        """
+        @summary: Ships the probe script to the server, unless it was already
+            shipped over the same ssh session
+        @param remote_client: remote client of the server
+        @type remote_client: cloudcafe.compute.common.clients.
+                             remote_instance.linux.linux_client.LinuxClient
+        """
+        key = (remote_client.ip_address, id(remote_client.ssh_client))
+        if key in self._installed:
+            return
+        install_cmd = ("mkdir -p {dir_path} && cat > {script_path} << "
+                       "'PROBE_EOF'\n{script}PROBE_EOF\n"
+                       "chmod +x {script_path}").format(
+                           dir_path=pipes.quote(self.dir_path),
+                           script_path=pipes.quote(self.script_path),
+                           script=PROBE_SCRIPT)
+        remote_client.ssh_client.execute_command(install_cmd)
+        self._installed.add(key)
+
+    def run(self, remote_client, action, ip_version, *args):
+        """
+        @summary: Runs a probe script action on the server
+        @return: ssh command response
+        """
+        self.install(remote_client)
+        probe_cmd = ' '.join(
+            [pipes.quote(self.script_path), action, str(ip_version)] +
+            [pipes.quote(str(arg)) for arg in args])
+        return remote_client.ssh_client.execute_command(probe_cmd)
+
+    def listen(self, remote_client, protocol, ports, ip_version=4):
+        """
+        @summary: Starts background listeners on the server ports, the data
+            received by UDP listeners is kept for read_udp
+        @param protocol: tcp or udp
+        @type protocol: str
+        @param ports: ports to listen on
+        @type ports: list
+        @return: ssh command response
+        """
+        return self.run(remote_client, 'listen-{0}'.format(protocol),
+                        ip_version, *ports)
+
+    def check_tcp_ports(self, remote_client, ip_address, ports,
+                        ip_version=4):
+        """
+        @summary: Checks all the TCP ports from the server in a single command
+        @param remote_client: remote client of the sending server
+        @param ip_address: address to check the ports of
+        @type ip_address: str
+        @param ports: ports or port ranges, for ex. ['442-445']
+        @type ports: list
+        @return: results by port, with the netcat output line of each port
+        @rtype: dict(str: ProbeResult)
+        """
+        response = self.run(remote_client, 'send-tcp', ip_version,
+                            ip_address, *ports)
+        results = {}
+        for line in response.stderr.splitlines():
+            succeeded = TCP_SUCCEEDED_REGEX.search(line)
+            failed = TCP_FAILED_REGEX.search(line)
+            match = succeeded or failed
+            if match:
+                results[match.group('port')] = ProbeResult(
+                    match.group('protocol'), match.group('port'),
+                    succeeded is not None, match.group(0))
+        return results
+
+    def check_udp_port(self, listener_client, sender_client, listener_ip,
+                       port, data, ip_version=4):
+        """
+        @summary: Sends data over UDP from the sender to a listener started on
+            the listener server, and reads back what the listener received
+        @param listener_client: remote client of the listening server
+        @param sender_client: remote client of the sending server
+        @param listener_ip: address of the listener
+        @type listener_ip: str
+        @param port: UDP port
+        @type port: str
+        @param data: data to send
+        @type data: str
+        @return: result with the sender netcat output and the received data
+        @rtype: ProbeResult
+        """
+        self.listen(listener_client, 'udp', [port], ip_version)
+        sent = self.run(sender_client, 'send-udp', ip_version, listener_ip,
+                        port, data)
+        ok = (listener_ip in sent.stderr and str(port) in sent.stderr and
+              'succeeded!' in sent.stderr)
+        received = self.run(listener_client, 'read-udp', ip_version, port)
+        return ProbeResult('udp', port, ok, sent.stderr,
+                           received=received.stdout.strip())
+
+
+class FailoverTiming(object):
+    """
+    @summary: Convergence time and packet loss of a single failover, measured
+        from the moment it was triggered
+    """
+
+    def __init__(self, expected, converged, convergence_time, probes, lost):
+        self.expected = expected
+        self.converged = converged
+        self.convergence_time = convergence_time
+        self.probes = probes
+        self.lost = lost
+
+    @property
+    def packet_loss(self):
+        """
+        @summary: Percentage of the probes sent until convergence that got
+            no answer
+        """
+        if not self.probes:
+            return 0.0
+        return 100.0 * self.lost / self.probes
+
+    def __str__(self):
+        if not self.converged:
+            return 'failover to {0} did not converge, {1}/{2} lost'.format(
+                self.expected, self.lost, self.probes)
+        return ('failover to {0} converged in {1:.2f}s, {2}/{3} probes lost '
+                '({4:.1f}%)').format(self.expected, self.convergence_time,
+                                     self.lost, self.probes,
+                                     self.packet_loss)
+
+
+class FailoverMonitor(object):
+    """
+    @summary: Probes an address continuously from a server while failovers
+        are triggered, so the time each failover takes to converge and the
+        probes lost meanwhile are measured on the server itself instead of
+        waiting a fixed time
+    """
+
+    PROBE_INTERVAL = 0.2
+
+    def __init__(self, ssh_client, probe_cmd, answers, dir_path='/root'):
+        """
+        @param ssh_client: ssh client of the server probing the address
+        @param probe_cmd: command printing the name of whoever answers on the
+            address, for ex. a curl of the shared ip
+        @type probe_cmd: str
+        @param answers: names the servers behind the address answer with,
+            any other output of the probe command counts as a lost probe
+        @type answers: list(str)
+        @param dir_path: directory on the server for the probe log
+        @type dir_path: str
+        """
+        self.ssh_client = ssh_client
+        self.probe_cmd = probe_cmd
+        self.answers = answers
+        self.log_path = '{0}/failover_probe.log'.format(dir_path.rstrip('/'))
+        self.run_path = '{0}/failover_probe.run'.format(dir_path.rstrip('/'))
+
+    def start(self):
+        """
+        @summary: Starts probing in the background, one probe every
+            PROBE_INTERVAL seconds, logging the time and answer of each
+        """
+        loop = ('while [ -e {run} ]; do '
+                'answer=$({probe} 2>&1 | tr -d "\\n"); '
+                'echo "$(date +%s.%N) $answer" >> {log}; '
+                'sleep {interval}; done').format(
+                    run=pipes.quote(self.run_path), probe=self.probe_cmd,
+                    log=pipes.quote(self.log_path),
+                    interval=self.PROBE_INTERVAL)
+        self.ssh_client.execute_command(
+            'rm -f {log}; touch {run}; nohup sh -c {loop} '
+            '> /dev/null 2>&1 &'.format(
+                log=pipes.quote(self.log_path),
+                run=pipes.quote(self.run_path), loop=pipes.quote(loop)))
+
+    def stop(self):
+        self.ssh_client.execute_command(
+            'rm -f {0}'.format(pipes.quote(self.run_path)))
+
+    def mark(self):
+        """
+        @summary: Marks the moment a failover is triggered in the probe log
+        """
+        self.ssh_client.execute_command(
+            'echo "MARK $(date +%s.%N)" >> {0}'.format(
+                pipes.quote(self.log_path)))
+
+    def _last_answer(self):
+        response = self.ssh_client.execute_command(
+            'tail -n 1 {0}'.format(pipes.quote(self.log_path)))
+        return response.stdout.strip().partition(' ')[2]
+
+    def wait_for_answer(self, expected, timeout):
+        """
+        @summary: Waits until the address answers with the expected name and
+            measures the failover since the last mark
+        @param expected: answer once the failover converged, for ex. the name
+            of the server that should own the address
+        @type expected: str
+        @param timeout: seconds to wait for the failover to converge
+        @type timeout: int
+        @rtype: FailoverTiming
+        """
+        poll_until(self._last_answer, lambda answer: answer == expected,
+                   timeout=timeout, interval=1, max_interval=2)
+        response = self.ssh_client.execute_command(
+            'cat {0}'.format(pipes.quote(self.log_path)))
+        return self.parse_log(response.stdout, expected, self.answers)
+
+    @staticmethod
+    def parse_log(log, expected, answers):
+        """
+        @summary: Measures the failover after the last mark of the probe log.
+            It converged with the first answer of the expected name that
+            later probes keep getting; probes that got none of the answers,
+            from the mark until then, are lost.
+        @rtype: FailoverTiming
+        """
+        marked_at = None
+        probes = []
+        for line in log.splitlines():
+            timestamp, _, answer = line.strip().partition(' ')
+            if timestamp == 'MARK':
+                marked_at = float(answer)
+                probes = []
+                continue
+            try:
+                probes.append((float(timestamp), answer.strip()))
+            except ValueError:
+                # Partially written line
+                continue
+
+        converged_index = len(probes)
+        while (converged_index > 0 and
+               probes[converged_index - 1][1] == expected):
+            converged_index -= 1
+        converged = marked_at is not None and converged_index < len(probes)
+
+        window = probes[:converged_index + 1] if converged else probes
+        lost = len([answer for _, answer in window
+                    if answer not in answers])
+        convergence_time = (probes[converged_index][0] - marked_at
+                            if converged else None)
+        return FailoverTiming(expected, converged, convergence_time,
+                              len(window), lost)
@@ -15,6 +15,7 @@ limitations under the License.
 """
 import operator
 import re
+import time
 
 from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.common.resources import ResourcePool
@@ -44,6 +45,14 @@ from cloudcafe.networking.networks.extensions.security_groups_api.models.\
     response import SecurityGroup, SecurityGroupRule
 from cloudcafe.networking.networks.personas import ServerPersona
 
+from cloudroast.common.concurrency import map_concurrently
+from cloudroast.common.remote_clients import RemoteClientCache
+from cloudroast.common.waiting import poll_until
+from cloudroast.networking.networks.connectivity import ConnectivityProbe
+
+# Maximum number of port updates in flight at once
+PORT_UPDATE_WORKERS = 8
+
 
 class NetworkingFixture(BaseTestFixture):
     """
@@ -1003,6 +1012,15 @@ class NetworkingComputeFixture(NetworkingSecurityGroupsFixture):
         # Using the serversCleanup method
         cls.addClassCleanup(cls.serversCleanUp)
 
+        # Remote instance clients reused across the tests of the class
+        cls.remote_clients = RemoteClientCache(cls.servers.behaviors)
+        cls.addClassCleanup(cls.remote_clients.clear)
+
+        # Port checks between servers, the probe script is kept at the
+        # default_file_path of the servers config, or at /root by default
+        cls.connectivity_probe = ConnectivityProbe(
+            cls.servers.config.default_file_path or '/root')
+
     @classmethod
     def serversCleanUp(cls):
         """
@@ -1159,7 +1177,8 @@ class NetworkingComputeFixture(NetworkingSecurityGroupsFixture):
 
     @classmethod
     def update_server_ports_w_sec_groups(cls, port_ids, security_groups,
-                                         raise_exception=True):
+                                         raise_exception=True,
+                                         wait_for_ready=False, probe=None):
         """
         @summary: Updates server ports with security groups
         @param port_ids: ports to update
@@ -1168,12 +1187,160 @@ class NetworkingComputeFixture(NetworkingSecurityGroupsFixture):
         @type security_groups: list(str)
         @param raise_exception: raise exception port was not updated
         @type raise_exception: bool
-        """
+        @param wait_for_ready: wait for the ports data plane to be ready,
+            see update_ports_w_sec_groups
+        @type wait_for_ready: bool
+        @param probe: (optional) readiness probe, see
+            update_ports_w_sec_groups
+        @type probe: callable
+        @return: port update timing report
+        @rtype: list(dict)
+        """
+        ports_to_update = [{'port_ids': port_ids,
+                            'security_groups': security_groups}]
+        return cls.update_ports_w_sec_groups(
+            ports_to_update=ports_to_update, raise_exception=raise_exception,
+            wait_for_ready=wait_for_ready, probe=probe)
 
-        for port_id in port_ids:
+    @classmethod
+    def update_ports_w_sec_groups(cls, ports_to_update, raise_exception=True,
+                                  wait_for_ready=True, probe=None,
+                                  timeout=None, fallback_delay=None):
+        """
+        @summary: Updates a batch of ports with security groups concurrently
+            and waits for each port to be ready in the data plane, instead of
+            updating them one by one and sleeping the data plane delay.
+            A port is ready when it is ACTIVE with the requested security
+            groups and, if given, the probe returns True for it.
+        @param ports_to_update: port ids and the security groups to add to
+            them, for ex. [{'port_ids': [port_id], 'security_groups': [id]}]
+        @type ports_to_update: list(dict)
+        @param raise_exception: raise exception if a port was not updated
+        @type raise_exception: bool
+        @param wait_for_ready: wait for the ports to be ready
+        @type wait_for_ready: bool
+        @param probe: (optional) callable taking a port id that returns True
+            once traffic through the port follows its security groups
+        @type probe: callable
+        @param timeout: seconds to wait for each port to be ready, by default
+            the security groups data plane delay
+        @type timeout: int
+        @param fallback_delay: (optional) seconds to sleep once after the
+            update if any port did not get ready, for ex. the data plane delay
+        @type fallback_delay: int
+        @return: one dict per port with its port_id, security_groups,
+            update_time and ready_time in seconds and whether it is ready
+        @rtype: list(dict)
+        """
+        if timeout is None:
+            timeout = cls.sec.config.data_plane_delay
+
+        port_updates = [(port_id, ports['security_groups'])
+                        for ports in ports_to_update
+                        for port_id in ports['port_ids']]
+
+        def update_port(port_update):
+            port_id, security_groups = port_update
+            start = time.time()
             cls.ports.behaviors.update_port(
                 port_id=port_id, security_groups=security_groups,
                 raise_exception=raise_exception)
+            updated = time.time()
+            ready = (not wait_for_ready or cls._wait_for_port_ready(
+                port_id, security_groups, probe, timeout))
+            return {'port_id': port_id, 'security_groups': security_groups,
+                    'update_time': updated - start,
+                    'ready_time': time.time() - updated, 'ready': ready}
+
+        results = map_concurrently(
+            update_port, port_updates, PORT_UPDATE_WORKERS)
+
+        errors = [result for result in results if not result.ok]
+        if errors and raise_exception:
+            raise errors[0].error
+
+        report = [result.result for result in results if result.ok]
+        for port_report in report:
+            cls.fixture_log.debug(
+                'port {port_id} updated in {update_time:.2f}s, ready: '
+                '{ready} in {ready_time:.2f}s'.format(**port_report))
+            if not port_report['ready']:
+                cls.fixture_log.warning(
+                    'port {0} not ready after {1}s'.format(
+                        port_report['port_id'], timeout))
+
+        if fallback_delay and not all(
+                port_report['ready'] for port_report in report):
+            cls.fixture_log.debug(
+                'data plane delay {0}'.format(fallback_delay))
+            time.sleep(fallback_delay)
+        return report
+
+    @classmethod
+    def tcp_egress_blocked_probe(cls, port_targets, blocked_port, key=None):
+        """
+        @summary: Builds a probe for update_ports_w_sec_groups that is True
+            once a TCP connection from the server of a port to a port its
+            egress rules do not allow times out. Before the rules are applied
+            the target refuses the connection instead.
+        @param port_targets: port ids as keys and as values the server of the
+            port, the address to ssh to it at, the address to connect to and
+            its IP version, for ex. {port_id: (server, ssh_ip, ip, 4)}
+        @type port_targets: dict
+        @param blocked_port: port outside of the egress rules
+        @type blocked_port: str
+        @param key: private key of the servers keypair
+        @type key: str
+        @return: probe taking a port id
+        @rtype: callable
+        """
+        def probe(port_id):
+            server, ssh_ip, ip_address, ip_version = port_targets[port_id]
+            remote_client = cls.remote_clients.get_remote_instance_client(
+                server=server, ip_address=ssh_ip, username=cls.ssh_username,
+                key=key, auth_strategy=cls.auth_strategy)
+            results = cls.connectivity_probe.check_tcp_ports(
+                remote_client, ip_address, [blocked_port],
+                ip_version=ip_version)
+            result = results.get(str(blocked_port))
+            return (result is not None and not result.ok and
+                    'timed out' in result.output)
+        return probe
+
+    @classmethod
+    def _wait_for_port_ready(cls, port_id, security_groups, probe, timeout):
+        """
+        @summary: Polls the port until it is ACTIVE with the security groups
+            and the probe, if any, returns True for it
+        @return: whether the port got ready within the timeout
+        @rtype: bool
+        """
+        end_time = time.time() + timeout
+
+        def port_applied(get_port_req):
+            if get_port_req.failures:
+                return False
+            port = get_port_req.response.entity
+            return (port.status == 'ACTIVE' and
+                    set(port.security_groups) == set(security_groups))
+
+        get_port_req = poll_until(
+            lambda: cls.ports.behaviors.get_port(port_id=port_id),
+            port_applied, timeout=timeout)
+        if not port_applied(get_port_req):
+            return False
+        if probe is None:
+            return True
+
+        def probe_port():
+            try:
+                return probe(port_id)
+            except Exception:
+                # The data plane may not let the probe through yet
+                return False
+
+        return bool(poll_until(
+            probe_port, timeout=max(0, end_time - time.time())))
 
     def verify_remote_clients_auth(self, servers, remote_clients,
                                    sec_groups=None):
@@ -1268,72 +1435,24 @@ class NetworkingComputeFixture(NetworkingSecurityGroupsFixture):
                               'XXXXXXXSecurity Groups UDP testing'
         @type expected_data: str
         """
-        file_name = 'udp_transfer'
-
-        # Can be set as the default_file_path property in the config
-        # file servers section, or to be set to /root by default
-        dir_path = self.servers.config.default_file_path or '/root'
-        file_path = '/{0}/{1}'.format(dir_path, file_name)
+        result = self.connectivity_probe.check_udp_port(
+            listener_client=listener_client, sender_client=sender_client,
+            listener_ip=listener_ip, port=port, data=file_content,
+            ip_version=ip_version)
 
-        # Deleting the file if it exists
-        if sender_client.is_file_present(file_path=file_path):
-            sender_client.delete_file(file_path=file_path)
-        if listener_client.is_file_present(file_path=file_path):
-            listener_client.delete_file(file_path=file_path)
+        # Sending the data to the listener
+        tkmsg = ('Unexpected UDP send output:\n{0}\nTo {1} port {2}\n'
+                 'At sender server: {3}\n').format(
+                     result.output, listener_ip, port,
+                     sender_client.ip_address)
+        self.assertTrue(result.ok, tkmsg)
 
-        # Listener and sender commands
-        if ip_version == 6:
-            lnc_cmd = 'nc -6 -u -l {0} > {1}'.format(port, file_name)
-            snc_cmd = 'nc -6 -u -n -v {0} {1} -w 3 < {2}'.format(listener_ip,
-                                                                 port,
-                                                                 file_name)
-        else:
-            lnc_cmd = 'nc -u -l {0} > {1}'.format(port, file_name)
-            snc_cmd = 'nc -u -n -v {0} {1} -w 3 < {2}'.format(listener_ip,
-                                                              port,
-                                                              file_name)
-
-        # Creating the file to transfer for UDP testing
-        sender_client.create_file(file_name=file_name,
-                                  file_content=file_content,
-                                  file_path=dir_path)
-
-        file_created = sender_client.is_file_present(file_path=file_path)
-        fcmsg = 'Unable to create remote file {0} at {1} sender server'.format(
-            file_path, sender_client.ip_address)
-        self.assertTrue(file_created, fcmsg)
-
-        # Opening listener port to receive file contents
-        set_listener = listener_client.ssh_client.execute_shell_command(
-            lnc_cmd)
-        listener_ok = lnc_cmd in set_listener.stdout
-        lkmsg = ('Unexpected shell command output:\n{0}\nRunning command:'
-                 ' {1}\nAt listener server: {2}\n').format(
-                     set_listener, lnc_cmd, listener_client.ip_address)
-        self.assertTrue(listener_ok, lkmsg)
-
-        # Transmitting file
-        t = sender_client.ssh_client.execute_command(snc_cmd)
-        t_ok = (listener_ip in t.stderr and port in t.stderr and
-                'succeeded!' in t.stderr)
-        tkmsg = ('Unexpected shell command output:\n{0}\nRunning command:'
-                 ' {1}\nAt sender server: {2}\n').format(
-                     t, snc_cmd, sender_client.ip_address)
-        self.assertTrue(t_ok, tkmsg)
-
-        # Checking file was created by running the listener command
-        fp = listener_client.is_file_present(file_path=file_path)
-        fpmsg = 'File {0} missing at listener server {1}'.format(
-            file_path, listener_client.ip_address)
-        self.assertTrue(fp, fpmsg)
-
-        # Getting the file contents in the listener
-        fd = listener_client.get_file_details(file_path=file_path)
+        # Getting the data received by the listener
         fdmsg = ('Unexpected data: {0} \ninstead of the expected: {1} \n'
                  'at listener server {2} on port {3}').format(
-                     fd.content, expected_data, listener_client.ip_address,
-                     port)
-        self.assertEqual(fd.content, expected_data, fdmsg)
+                     result.received, expected_data,
+                     listener_client.ip_address, port)
+        self.assertEqual(result.received, expected_data, fdmsg)
 
     def verify_tcp_connectivity(self, listener_client, sender_client,
                                 listener_ip, port1, port2, port_range,
@@ -1362,39 +1481,23 @@ class NetworkingComputeFixture(NetworkingSecurityGroupsFixture):
         @type expected_data: list
         """
 
-        if ip_version == 6:
-
-            # Security group rule has default ports 992-995
-            lnc_cmd = 'nc -6 -l {0} & nc -6 -l {1} &'.format(port1, port2)
-            snc_cmd = 'nc -z -n -v -6 {0} {1} -w 2'.format(
-                listener_ip, port_range)
-        else:
-
-            # Security group rule has default ports 443-445
-            lnc_cmd = 'nc -l {0} & nc -l {1} &'.format(port1, port2)
-            snc_cmd = 'nc -z -n -v {0} {1} -w 2'.format(listener_ip,
-                                                        port_range)
-
-        set_listener = listener_client.ssh_client.execute_shell_command(
-            lnc_cmd)
-        listener_ok = lnc_cmd in set_listener.stdout
-        msg = ('Unexpected shell command output:\n{0}\nRunning command:'
-               ' {1}\nAt server: {2}\n').format(set_listener, lnc_cmd,
-                                                listener_client.ip_address)
-        self.assertTrue(listener_ok, msg)
-
-        check_ports = sender_client.ssh_client.execute_command(snc_cmd)
+        self.connectivity_probe.listen(
+            listener_client, 'tcp', [port1, port2], ip_version=ip_version)
+        results = self.connectivity_probe.check_tcp_ports(
+            sender_client, listener_ip, [port_range], ip_version=ip_version)
+        check_ports = '\n'.join(
+            results[port].output for port in sorted(results, key=int))
 
         for data in expected_data:
-            verify_data = data in check_ports.stderr
-            msg = ('Running at {listener_ip} listener command: {lnc_cmd}\n'
-                   'Running at {sender_ip} sender command: {snc_cmd}\n'
+            verify_data = data in check_ports
+            msg = ('Listening at {listener_ip} on ports {port1} and {port2}\n'
+                   'Checking from {sender_ip} ports {port_range}\n'
                    'Received unexpected response:\n{response}\n'
                    'Without the expected data:\n{exp_response}\n'
                    '').format(listener_ip=listener_client.ip_address,
-                              lnc_cmd=lnc_cmd,
+                              port1=port1, port2=port2,
                               sender_ip=sender_client.ip_address,
-                              snc_cmd=snc_cmd, response=check_ports,
+                              port_range=port_range, response=check_ports,
                               exp_response=expected_data)
             self.assertTrue(verify_data, msg)
 
@@ -20,6 +20,7 @@ from cloudcafe.networking.networks.common.constants import PortTypes
 from cloudcafe.networking.networks.common.tools.connectivity \
     import Connectivity
 from cloudcafe.networking.networks.personas import ServerPersona
+from cloudroast.common.waiting import poll_until
 from cloudroast.networking.networks.fixtures import NetworkingComputeFixture
 
 
@@ -214,12 +215,13 @@ class AutoPortUpdateTest(NetworkingComputeFixture):
         msg = 'udp rule create response missing job ID: {0}'.format(resp)
         self.assertTrue(job_id, msg)
 
-        # Auto port update data plane delay
+        # Checking there is UDP connectivity available, polling for up to
+        # the auto port update data plane delay
         self.fixture_log.debug(self.data_plane_delay_msg)
-        time.sleep(self.data_plane_delay)
-
-        # Checking there is UDP connectivity available
-        conn_resp = conn.verify_personas_conn(**udp_args)
+        conn_resp = poll_until(
+            lambda: conn.verify_personas_conn(**udp_args),
+            lambda resp: resp[0][self.connection],
+            timeout=self.data_plane_delay)
         udp_res = conn_resp[0][self.connection]
         self.assertTrue(udp_res, conn_resp)
 
@@ -262,7 +264,9 @@ class AutoPortUpdateTest(NetworkingComputeFixture):
         conn = Connectivity(self.sp1, self.sp3)
         self.icmp_args.update(port_type=port_type, ip_version=ip_version)
 
-        # Auto port update data plane delay
+        # Auto port update data plane delay for the rules removed at set up.
+        # A missing connection can not be told apart from a rule that is not
+        # removed yet, so this is a fixed wait instead of a poll.
         self.fixture_log.debug(self.data_plane_delay_msg)
         time.sleep(self.data_plane_delay)
 
@@ -300,23 +304,30 @@ class AutoPortUpdateTest(NetworkingComputeFixture):
         log_msg = 'Created tcp rules: {0}'.format(tcp_rule)
         self.fixture_log.info(log_msg)
 
-        # Auto port update data plane delay
+        # Auto port update data plane delay, update on Isolated networks may
+        # require more time
         self.fixture_log.debug(self.data_plane_delay_msg)
-        time.sleep(self.data_plane_delay)
-
+        data_plane_timeout = self.data_plane_delay
         if port_type == PortTypes.ISOLATED:
-            time.sleep(self.data_plane_delay)
+            data_plane_timeout += self.data_plane_delay
 
         # Testing icmp is now available
-        rp = conn.verify_personas_conn(**self.icmp_args)
+        rp = poll_until(
+            lambda: conn.verify_personas_conn(**self.icmp_args),
+            lambda resp: resp[0][self.connection],
+            timeout=data_plane_timeout)
         result = rp[0]
         ping_res = result[self.connection]
         self.assertTrue(ping_res, rp)
 
         # Testing SSH is now available
         rc1 = self.sp1.remote_client
-        ssh = conn.scan_tcp_port(sender_client=rc1, listener_ip=public_ip,
-                                 ip_version=ip_version)
+        ssh = poll_until(
+            lambda: conn.scan_tcp_port(
+                sender_client=rc1, listener_ip=public_ip,
+                ip_version=ip_version),
+            lambda resp: resp[self.connection],
+            timeout=data_plane_timeout)
         ssh_res = ssh[self.connection]
         self.assertTrue(ssh_res, ssh)
 
@@ -13,8 +13,6 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-import time
-
 from cafe.drivers.unittest.decorators import tags
 from cloudroast.networking.networks.fixtures import NetworkingComputeFixture
 
@@ -150,26 +148,39 @@ class SecurityGroupsEgressIPv4Test(NetworkingComputeFixture):
                                          cls.spi.inet_port_ids[0]],
                             'security_groups': [cls.security_group_ids[1]]}]
 
-        for ports in ports_to_update:
-            cls.update_server_ports_w_sec_groups(
-                port_ids=ports['port_ids'],
-                security_groups=ports['security_groups'])
-
-        # Wait time for security groups to be enabled on server ports
-        delay_msg = 'data plane delay {0}'.format(
-            cls.sec.config.data_plane_delay)
-        cls.fixture_log.debug(delay_msg)
-        time.sleep(cls.sec.config.data_plane_delay)
+        # The egress rules are enforced once TCP connections from the
+        # senders to a port outside of the rules time out, instead of being
+        # refused by the listener
+        port_targets = {}
+        for persona, server in [(cls.sp, cls.sender),
+                                (cls.spi, cls.icmp_sender)]:
+            ssh_ip = persona.pnet_fix_ipv4[0]
+            port_targets[persona.pnet_port_ids[0]] = (
+                server, ssh_ip, cls.lp.pnet_fix_ipv4[0], 4)
+            port_targets[persona.snet_port_ids[0]] = (
+                server, ssh_ip, cls.lp.snet_fix_ipv4[0], 4)
+            port_targets[persona.inet_port_ids[0]] = (
+                server, ssh_ip, cls.lp.inet_fix_ipv4[0], 4)
+        probe = cls.tcp_egress_blocked_probe(
+            port_targets=port_targets, blocked_port='442',
+            key=cls.keypair.private_key)
+
+        # Updating the ports concurrently and waiting for each of them to
+        # be enforced on the data plane, the data plane delay is only slept
+        # if a port did not get there
+        cls.port_update_report = cls.update_ports_w_sec_groups(
+            ports_to_update=ports_to_update, probe=probe,
+            fallback_delay=cls.sec.config.data_plane_delay)
 
     def setUp(self):
-        """ Creating the remote clients """
+        """ Getting the remote clients, reused across the class tests """
         super(SecurityGroupsEgressIPv4Test, self).setUp()
-        self.fixture_log.debug('Creating the Remote Clients')
-        self.lp_rc = self.servers.behaviors.get_remote_instance_client(
+        self.fixture_log.debug('Getting the Remote Clients')
+        self.lp_rc = self.remote_clients.get_remote_instance_client(
             server=self.listener, ip_address=self.lp.pnet_fix_ipv4[0],
             username=self.ssh_username, key=self.keypair.private_key,
             auth_strategy=self.auth_strategy)
-        self.op_rc = self.servers.behaviors.get_remote_instance_client(
+        self.op_rc = self.remote_clients.get_remote_instance_client(
             server=self.other_sender, ip_address=self.op.pnet_fix_ipv4[0],
             username=self.ssh_username, key=self.keypair.private_key,
             auth_strategy=self.auth_strategy)
@@ -177,11 +188,11 @@ class SecurityGroupsEgressIPv4Test(NetworkingComputeFixture):
         self.fixture_log.debug('Sender Remote Clients require ingress and '
                                'egress rules working for ICMP and ingress '
                                'rules for TCP')
-        self.sp_rc = self.servers.behaviors.get_remote_instance_client(
+        self.sp_rc = self.remote_clients.get_remote_instance_client(
             server=self.sender, ip_address=self.sp.pnet_fix_ipv4[0],
             username=self.ssh_username, key=self.keypair.private_key,
             auth_strategy=self.auth_strategy)
-        self.spi_rc = self.servers.behaviors.get_remote_instance_client(
+        self.spi_rc = self.remote_clients.get_remote_instance_client(
             server=self.icmp_sender, ip_address=self.spi.pnet_fix_ipv4[0],
             username=self.ssh_username, key=self.keypair.private_key,
             auth_strategy=self.auth_strategy)
@@ -16,15 +16,17 @@ limitations under the License.
 
 from IPy import IP
 import re
-import time
 
 from cafe.drivers.unittest.decorators import tags
+from cloudcafe.common.tools.check_dict import get_value
 from cloudcafe.compute.extensions.ip_associations_api.composites \
     import IPAssociationsComposite
 from cloudcafe.networking.networks.extensions.ip_addresses_api.composites \
     import IPAddressesComposite
 from cloudcafe.networking.networks.extensions.security_groups_api.composites \
     import SecurityGroupsComposite
+from cloudroast.common.waiting import poll_until
+from cloudroast.networking.networks.connectivity import FailoverMonitor
 from cloudroast.networking.networks.fixtures import NetworkingComputeFixture
 from cloudroast.networking.networks.scenario.common import \
     ScenarioMixin
@@ -37,6 +39,11 @@ class SharedIPsTest(NetworkingComputeFixture, ScenarioMixin):
 
     PRIVATE_KEY_PATH = '/root/pkey'
 
+    # Seconds to wait for the expected server to answer on the shared ip
+    # after the cluster is built or an interface is toggled
+    CLUSTER_STABILIZE_TIMEOUT = 240
+    NO_ROUTE_ERROR = 'port 80: No route to host'
+
     @classmethod
     def setUpClass(cls):
         super(SharedIPsTest, cls).setUpClass()
@@ -44,6 +51,17 @@ class SharedIPsTest(NetworkingComputeFixture, ScenarioMixin):
         cls.ip_associations = IPAssociationsComposite()
         cls.security_groups = SecurityGroupsComposite()
 
+        # Failover SLOs, the seconds a failover may take to converge and the
+        # percentage of probes it may lose meanwhile. Without a packet loss
+        # SLO, the loss is only logged.
+        cls.failover_convergence_slo = float(
+            get_value('failover-convergence-slo') or
+            cls.CLUSTER_STABILIZE_TIMEOUT)
+        failover_packet_loss_slo = get_value('failover-packet-loss-slo')
+        cls.failover_packet_loss_slo = (
+            float(failover_packet_loss_slo) if failover_packet_loss_slo
+            else None)
+
     def _create_isolated_network(self):
         network, subnet = self._create_network_with_subnet('isolated',
                                                            self.base_cidr)
@@ -73,9 +91,6 @@ class SharedIPsTest(NetworkingComputeFixture, ScenarioMixin):
                                    self._get_server_ip(self.master),
                                    ssh_client)
 
-        # Wait for cluster to stabilize
-        time.sleep(60)
-
         # Copy the private key of the keypair created previously to the slave
         # server. This will enable failing and restoring interfaces in the
         # master slave
@@ -197,22 +212,35 @@ class SharedIPsTest(NetworkingComputeFixture, ScenarioMixin):
         self.failed_networks.extend(self.delete_networks)
         self.failed_subnets.extend(self.delete_subnets)
 
-    def _do_get_from_shared_ip(self, server):
+    def _wait_for_shared_ip_owner(self, server):
+        """
+        Polls the shared ip from the client until the server answers, an
+        unexpected error is returned or the cluster stabilize timeout expires.
+        Returns the last curl response.
+        """
         cmd = self._get_curl_command()
-        for i in range(3):
-            ssh_client = self._get_remote_client(self.client).ssh_client
-            response = ssh_client.execute_command(cmd)
-            if not response.stderr:
-                self.assertEqual(response.stdout.strip(),
-                                 server.entity.name.replace('_', '-'))
-                return
-            else:
-                if 'port 80: No route to host' in response.stderr:
-                    time.sleep(60)
-                else:
-                    msg = ('Unexpected error when executing GET from shared '
-                           'ip: {}'.format(response.stderr))
-                    self.fail(msg)
+        expected_name = server.entity.name.replace('_', '-')
+        ssh_client = self._get_remote_client(self.client).ssh_client
+
+        def answered(response):
+            if response.stderr:
+                return self.NO_ROUTE_ERROR not in response.stderr
+            return response.stdout.strip() == expected_name
+
+        return poll_until(
+            lambda: ssh_client.execute_command(cmd), answered,
+            timeout=self.CLUSTER_STABILIZE_TIMEOUT)
+
+    def _do_get_from_shared_ip(self, server):
+        response = self._wait_for_shared_ip_owner(server)
+        if not response.stderr:
+            self.assertEqual(response.stdout.strip(),
+                             server.entity.name.replace('_', '-'))
+            return
+        if self.NO_ROUTE_ERROR not in response.stderr:
+            msg = ('Unexpected error when executing GET from shared '
+                   'ip: {}'.format(response.stderr))
+            self.fail(msg)
         self._mark_resources_to_keep_on_failure()
         self.fail('Timed out executing GET from shared ip. No route to host')
 
@@ -222,19 +250,60 @@ class SharedIPsTest(NetworkingComputeFixture, ScenarioMixin):
     def _restore_interface_listening_to_slave(self):
         raise NotImplementedError
 
+    def _start_failover_monitor(self):
+        """
+        Starts probing the shared ip continuously from the client, stopped
+        on cleanup.
+        """
+        self.failover_monitor = FailoverMonitor(
+            self._get_remote_client(self.client).ssh_client,
+            '{} --max-time 2'.format(self._get_curl_command()),
+            [server.entity.name.replace('_', '-')
+             for server in (self.master, self.slave)])
+        self.failover_monitor.start()
+        self.addCleanup(self.failover_monitor.stop)
+        self.failover_timings = []
+
+    def _measure_failover(self, trigger_failover, server):
+        """
+        Triggers a failover, waits for the server to answer on the shared
+        ip and checks the time it took to converge and the probes lost
+        against the failover SLOs.
+        """
+        self.failover_monitor.mark()
+        trigger_failover()
+        expected_name = server.entity.name.replace('_', '-')
+        timing = self.failover_monitor.wait_for_answer(
+            expected_name, self.CLUSTER_STABILIZE_TIMEOUT)
+        self.failover_timings.append(timing)
+        self.fixture_log.info(str(timing))
+
+        self._do_get_from_shared_ip(server)
+        msg = '{} exceeds the convergence SLO of {}s'.format(
+            timing, self.failover_convergence_slo)
+        self.assertTrue(timing.converged, msg)
+        self.assertLessEqual(timing.convergence_time,
+                             self.failover_convergence_slo, msg)
+        if self.failover_packet_loss_slo is not None:
+            msg = '{} exceeds the packet loss SLO of {}%'.format(
+                timing, self.failover_packet_loss_slo)
+            self.assertLessEqual(timing.packet_loss,
+                                 self.failover_packet_loss_slo, msg)
+
     def _test_failover(self):
         # Verify master is receiving requests sent to shared ip
         self._do_get_from_shared_ip(self.master)
+        self._start_failover_monitor()
 
         # Fail master's interface used to listen to slave and verify slave
         # responds to requests
-        self._fail_interface_listening_to_slave()
-        self._do_get_from_shared_ip(self.slave)
+        self._measure_failover(self._fail_interface_listening_to_slave,
+                               self.slave)
 
         # Restore master's interface to listen to slave  and verify it responds
         # to requests
-        self._restore_interface_listening_to_slave()
-        self._do_get_from_shared_ip(self.master)
+        self._measure_failover(self._restore_interface_listening_to_slave,
+                               self.master)
 
     def _test_execute(self):
         self._create_isolated_network()
@@ -289,9 +358,6 @@ class SharedIPsTestPublicNetworkIPv4(SharedIPsTest):
 
         self._turn_interface_off(interface, ssh_client)
 
-        # Wait for cluster to stabilize
-        time.sleep(60)
-
     def _restore_interface_listening_to_slave(self):
         ssh_client = self._get_remote_client(self.client).ssh_client
         interface = self._get_server_interface()
@@ -302,9 +368,6 @@ class SharedIPsTestPublicNetworkIPv4(SharedIPsTest):
         self._execute_command_remotely(
             self.master.entity.addresses.private.ipv4, route_cmd, ssh_client)
 
-        # Wait for cluster to stabilize
-        time.sleep(60)
-
     @tags(type='positive', net='yes')
     def test_execute_pnet_ipv4(self):
         self._test_execute()
@@ -351,8 +414,8 @@ class SharedIPsTestIsolatedNetwork(SharedIPsTest):
         interface = self._get_server_interface()
         self._turn_interface_off(interface, ssh_client)
 
-        # Wait for cluster to stabilize
-        time.sleep(60)
+        # Wait for the slave to take over the shared ip
+        self._wait_for_shared_ip_owner(self.slave)
         self._execute_command_remotely(
             self.master.entity.addresses.private.ipv4, 'ifconfig eth0:0 down',
             ssh_client)
@@ -362,9 +425,6 @@ class SharedIPsTestIsolatedNetwork(SharedIPsTest):
         interface = self._get_server_interface()
         self._turn_interface_on(interface, ssh_client)
 
-        # Wait for cluster to stabilize
-        time.sleep(60)
-
     @tags(type='positive', net='yes')
     def test_execute_isolated_net(self):
         self._test_execute()
@@ -422,9 +482,6 @@ class SharedIPsTestPublicNetworkIPv6(SharedIPsTest):
 
         self._turn_interface_off(interface, ssh_client)
 
-        # Wait for cluster to stabilize
-        time.sleep(60)
-
     def _restore_interface_listening_to_slave(self):
         split = self.shared_ip.address.split(':')
         network_prefix = '{}:{}:{}:{}::'.format(split[0], split[1], split[2],
@@ -449,9 +506,6 @@ class SharedIPsTestPublicNetworkIPv6(SharedIPsTest):
         self._execute_command_remotely(
             self.master.entity.addresses.private.ipv4, route_cmd, ssh_client)
 
-        # Wait for cluster to stabilize
-        time.sleep(60)
-
     @tags(type='positive', net='yes')
     def test_execute_pnet_ipv6(self):
         self._test_execute()
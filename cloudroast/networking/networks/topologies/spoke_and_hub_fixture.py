@@ -14,10 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 
 """
-import time
-
 from cloudcafe.networking.networks.common.proxy_mgr.proxy_mgr \
     import NetworkProxyMgr
+from cloudroast.common.waiting import poll_until
 from cloudroast.networking.networks.fixtures import NetworkingComputeFixture
 from cloudcafe.networking.networks.personas import ServerPersona
 from cloudroast.networking.networks.topologies.topology_routines \
@@ -28,7 +27,10 @@ class SpokeAndHubFixture(NetworkingComputeFixture, TopologyFixtureRoutines):
 
     NUM_OF_SPOKES = 5
     IP_VERSION = 4
-    SSH_PROVISION_DELAY = 20
+    # Maximum seconds to wait for a new server to answer pings and to accept
+    # SSH logins
+    PING_PROVISION_TIMEOUT = 60
+    SSH_PROVISION_TIMEOUT = 120
 
     @classmethod
     def setUpClass(cls):
@@ -120,8 +122,9 @@ class SpokeAndHubFixture(NetworkingComputeFixture, TopologyFixtureRoutines):
             self._build_and_register_iso_net_server(
                 svr_id_num=svr_num, iso_network=iso_net)
 
-        # Wait for final spoke server to stabilize
-        time.sleep(self.SSH_PROVISION_DELAY)
+        # Wait for the spoke servers to accept SSH logins
+        for server_dict in self.servers.itervalues():
+            self._wait_for_ssh(server_dict)
 
         # Add the generalized isolated network static route (so any isolated
         # subnets are routed out the local isolated network interface and not
@@ -197,34 +200,54 @@ class SpokeAndHubFixture(NetworkingComputeFixture, TopologyFixtureRoutines):
 
         # Wait for VM's public network to come online by pinging the server's
         # public interface
-        attempt = 0
-        max_attempts = 10
-        hub_available = False
-        while not hub_available and attempt < max_attempts:
-            attempt += 1
-            self.fixture_log.debug(
-                'Verifying hub router is online. Attempt: {0} of {1}'.format(
-                    attempt, max_attempts))
+        def ping_hub():
+            self.fixture_log.debug('Verifying hub router is online.')
             try:
-                hub_available = proxy.ping(hub_persona.pnet_fix_ipv4[0])
-
+                return proxy.ping(hub_persona.pnet_fix_ipv4[0])
             except Exception as err:
                 self.fixture_log.info('PING EXCEPTION: {0}'.format(err))
-                hub_available = False
-
-            if not hub_available:
-                time.sleep(5)
+                return False
 
-        if attempt >= max_attempts:
+        if not poll_until(ping_hub, timeout=self.PING_PROVISION_TIMEOUT):
             self.assertClassSetupFailure(
                 'Hub router (hub & spoke topology) never came online. Unable '
                 'to proceed.')
 
-        # Give the SSH daemon time to start up. The network is active,
-        # but SSH is unstable at this point in the hub's provisioning.
-        time.sleep(self.SSH_PROVISION_DELAY)
+        # The network is active, but SSH is unstable at this point in the
+        # hub's provisioning, so wait for the SSH daemon to accept logins.
+        self._wait_for_ssh(hub)
 
         # Enable the hub to do basic routing
         self.enable_ip_forwarding(hub)
 
         return hub
+
+    def _wait_for_ssh(self, svr_dict):
+        """
+        Polls the server's public address until it accepts an SSH login or
+        SSH_PROVISION_TIMEOUT expires.
+
+        :param svr_dict: dict of server info (PROXY, SERVER, PERSONA)
+
+        :return: (Boolean) - SSH login succeeded
+
+        """
+        proxy = svr_dict[TopologyFixtureRoutines.PROXY]
+        target_ip = svr_dict[TopologyFixtureRoutines.PERSONA].pnet_fix_ipv4[0]
+
+        def can_ssh():
+            try:
+                return proxy.can_ssh(
+                    target_ip=target_ip, user=self.DEFAULT_USER,
+                    password=self.ADMIN_PASS)
+            except Exception as err:
+                self.fixture_log.info('SSH EXCEPTION: {0}'.format(err))
+                return False
+
+        ssh_ready = poll_until(can_ssh, timeout=self.SSH_PROVISION_TIMEOUT)
+        if not ssh_ready:
+            self.fixture_log.error(
+                'Server at {ip} did not accept SSH logins within {timeout} '
+                'seconds'.format(ip=target_ip,
+                                 timeout=self.SSH_PROVISION_TIMEOUT))
+        return ssh_ready
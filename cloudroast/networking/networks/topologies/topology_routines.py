@@ -22,6 +22,8 @@ from cloudcafe.networking.networks.personas import ServerPersona
 
 import prettytable
 
+from cloudroast.common.concurrency import imap_concurrently
+
 
 class NetTypes(object):
 
@@ -51,6 +53,11 @@ class TopologyFixtureRoutines(object):
     # connectivity issues.
     DEFAULT_PING_COUNT = 5
 
+    # Maximum number of source hosts checking their mesh connectivity at the
+    # same time. Each source host works through its targets sequentially on
+    # its own proxy.
+    MAX_MESH_WORKERS = 10
+
     SSH = 'ssh'
     PING = 'ping'
 
@@ -326,7 +333,9 @@ class TopologyFixtureRoutines(object):
             self, servers, net_type, action, ip_version=4, **kwargs):
         """
         Performs specified action to verify network connectivity on
-        specified network. Stores results in a table for full reporting.
+        specified network. Source hosts are checked concurrently (up to
+        MAX_MESH_WORKERS at a time). Stores results in a table for full
+        reporting.
 
         :param servers: Dictionary of server information (server, proxy,
                 persona)
@@ -350,79 +359,113 @@ class TopologyFixtureRoutines(object):
         network_attr = '{net_type}_fix_ipv{version}'.format(
             net_type=net_type, version=ip_version)
 
-        result_msg = "{src} --> {dest} : {result}"
         overall_result = None
 
         # Define the stable structure
         table_header = ['{action}: {net_type}'.format(
             net_type=net_type.upper(), action=action.upper())]
-        table_rows = []
 
         svr_ids = servers.keys()
-
-        # Iterate across selected ip addresses in mesh
         for svr_id in svr_ids:
+            target_ip = getattr(servers[svr_id][self.PERSONA], network_attr)[0]
+            if target_ip not in table_header:
+                table_header.append(target_ip)
 
-            # Get source server info
-            proxy = servers[svr_id][self.PROXY]
-            persona = servers[svr_id][self.PERSONA]
-            src_ip = getattr(persona, network_attr)[0]
-            row_data = [src_ip]
-
-            # Get the requested proxy action API (ping, can_ssh)
-            action_api = getattr(proxy, action)
-
-            for target_svr_id in svr_ids:
-
-                target_ip = getattr(
-                    servers[target_svr_id][self.PERSONA], network_attr)[0]
-
-                if target_ip not in table_header:
-                    table_header.append(target_ip)
-
-                # Build the correct api signature based on the action and any
-                # extra relevant parameters provided
-                action_api_args = self._build_proxy_api_args(
-                    action=action, target_ip=target_ip, **kwargs)
-
-                # If the target current server is not the source server
-                if target_svr_id != svr_id:
-                    try:
-                        result = action_api(**action_api_args)
-
-                    # Oops, something didn't work... (e.g. SSH timeout)
-                    except Exception as err:
-                        result = False
-                        msg = 'ERROR: {0}'.format(err)
-                        row_data.append(msg)
-                        self.fixture_log.error(msg)
-
-                    # Able to execute command, so store result to put into
-                    # the table
-                    else:
-                        row_data.append(result)
-                        msg = result_msg.format(
-                            src=src_ip, dest=target_ip, result=result)
-                        self.fixture_log.info(msg)
-
-                    # Accumulate the logical result
-                    overall_result = (
-                        result if overall_result is None else
-                        overall_result & result)
-
-                # No need for the source host to ping itself.
-                else:
-                    row_data.append('---')
-
-            # Store results from source host
-            table_rows.append(row_data)
-
-        # Add results for given source host to table
         result_table = prettytable.PrettyTable(table_header)
-        [result_table.add_row(row) for row in table_rows]
+
+        def check_source(svr_id):
+            return self._action_from_network_host(
+                servers=servers, svr_id=svr_id, svr_ids=svr_ids,
+                action=action, network_attr=network_attr, **kwargs)
+
+        # Check each source host concurrently, adding its row to the table
+        # as soon as it is available
+        for task in imap_concurrently(
+                check_source, svr_ids, self.MAX_MESH_WORKERS):
+            if not task.ok:
+                raise task.error
+            source_result, row_data = task.result
+            result_table.add_row(row_data)
+            self.fixture_log.debug('{action}: {net_type} row: {row}'.format(
+                action=action.upper(), net_type=net_type.upper(),
+                row=row_data))
+
+            # Accumulate the logical result (None for a single server)
+            if source_result is not None:
+                overall_result = (
+                    source_result if overall_result is None else
+                    overall_result & source_result)
 
         return overall_result, result_table
 
+    def _action_from_network_host(
+            self, servers, svr_id, svr_ids, action, network_attr, **kwargs):
+        """
+        Performs specified action from a single source host to every other
+        host, using the source host's proxy for every target.
+
+        :param servers: Dictionary of server information (server, proxy,
+                persona)
+        :param svr_id: ID of the source server
+        :param svr_ids: IDs of all the servers in the mesh
+        :param action: Proxy API name of the validation mechanism
+        :param network_attr: Persona attribute holding the addresses to use
+        :param kwargs: Any extra arguments required for the validation
+            mechanism
+
+        :return: (tuple) [boolean] Results (None if there are no targets),
+            [list] Table row for the source host
+        """
+        result_msg = "{src} --> {dest} : {result}"
+        overall_result = None
+
+        # Get source server info
+        proxy = servers[svr_id][self.PROXY]
+        persona = servers[svr_id][self.PERSONA]
+        src_ip = getattr(persona, network_attr)[0]
+        row_data = [src_ip]
+
+        # Get the requested proxy action API (ping, can_ssh)
+        action_api = getattr(proxy, action)
+
+        for target_svr_id in svr_ids:
+
+            # No need for the source host to ping itself.
+            if target_svr_id == svr_id:
+                row_data.append('---')
+                continue
+
+            target_ip = getattr(
+                servers[target_svr_id][self.PERSONA], network_attr)[0]
+
+            # Build the correct api signature based on the action and any
+            # extra relevant parameters provided
+            action_api_args = self._build_proxy_api_args(
+                action=action, target_ip=target_ip, **kwargs)
+
+            try:
+                result = action_api(**action_api_args)
+
+            # Oops, something didn't work... (e.g. SSH timeout)
+            except Exception as err:
+                result = False
+                msg = 'ERROR: {0}'.format(err)
+                row_data.append(msg)
+                self.fixture_log.error(msg)
+
+            # Able to execute command, so store result to put into the table
+            else:
+                row_data.append(result)
+                msg = result_msg.format(
+                    src=src_ip, dest=target_ip, result=result)
+                self.fixture_log.info(msg)
+
+            # Accumulate the logical result
+            overall_result = (
+                result if overall_result is None else overall_result & result)
+
+        return overall_result, row_data
+
     def _build_proxy_api_args(self, action, target_ip, **kwargs):
         """
         Builds basic proxy args (tightly coupled with NetworkProxy class)
@@ -13,9 +13,73 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import time
+
 from cafe.drivers.unittest.decorators import memoized
 from cafe.drivers.unittest.fixtures import BaseTestFixture
+from cloudcafe.common.tools.check_dict import get_value
 from cloudcafe.objectstorage.composites import ObjectStorageComposite
+from cloudcafe.objectstorage.objectstorage_api.config \
+    import ObjectStorageAPIConfig
+
+from cloudroast.common.capabilities import capabilities, skip_unless
+from cloudroast.common.waiting import poll_until
+from cloudroast.objectstorage.local_swift import LocalObjectStorageComposite
+from cloudroast.objectstorage.seeding import ArchiveSeeder
+
+
+def use_local_swift():
+    """
+    Returns True when object storage tests should run against the in-process
+    LocalSwift stand-in instead of the configured Swift endpoint.
+    """
+    return get_value('local-swift') == 'true'
+
+
+def get_objectstorage_composite():
+    """
+    Returns the composite object storage tests use, pointing at LocalSwift
+    when local-swift is set to 'true'.
+    """
+    if use_local_swift():
+        return LocalObjectStorageComposite()
+    return ObjectStorageComposite()
+
+
+def _capability_name(name):
+    if use_local_swift():
+        return 'local_swift_{0}'.format(name)
+    return name
+
+
+def _discover_features():
+    """
+    Returns the swift features enabled in the objectstorage config file,
+    or reported by swift.
+    """
+    return get_objectstorage_composite().behaviors.get_configured_features()
+
+
+def get_configured_features():
+    """
+    Returns the configured swift features, discovered once per run.
+    """
+    return capabilities.get(
+        _capability_name('objectstorage_features'), _discover_features)
+
+
+def _discover_swift_version():
+    """
+    Returns the swift version from the objectstorage config file, falling
+    back to swift info when it is enabled. Returns None if unknown.
+    """
+    objectstorage_api_config = ObjectStorageAPIConfig()
+    swift_version = objectstorage_api_config.version
+    if not swift_version and objectstorage_api_config.use_swift_info:
+        info = get_objectstorage_composite().behaviors.get_swift_info()
+        swift_version = info.get(
+            'swift', {'version': None}).get('version', None)
+    return swift_version
 
 
 class ObjectStorageUser(object):
@@ -30,6 +94,115 @@ class ObjectStorageUser(object):
         self.roles = []
 
 
+class TempUrlKeyManager(object):
+    """
+    Tracks the TempURL keys set on an account and when each becomes usable,
+    so tests only wait for the proxy to pick up a key the first time it is
+    set. Both account key slots are used; a new key goes into an empty
+    slot or replaces the least recently used key, which leaves the other
+    key valid while it propagates.
+
+    Key state is shared by every manager in the process for the same
+    storage url.
+    """
+    KEY_HEADERS = ('X-Account-Meta-Temp-URL-Key',
+                   'X-Account-Meta-Temp-URL-Key-2')
+
+    _accounts = {}
+
+    def __init__(self, client, storage_url, key_cache_time):
+        """
+        @param client: object storage client for the account
+        @type client: ObjectStorageAPIClient
+        @param storage_url: storage url identifying the account
+        @type storage_url: string
+        @param key_cache_time: seconds a key takes to propagate once set
+        @type key_cache_time: int
+        """
+        self.client = client
+        self.storage_url = storage_url
+        self.key_cache_time = key_cache_time
+
+    @property
+    def _slots(self):
+        """
+        Returns the tracked state of each key slot, read from the account
+        the first time it is used. Keys that were set before the manager
+        tracked them are treated as already propagated.
+
+        @return: key header mapped to the key, the time it becomes usable
+                 and the time it was last used
+        @rtype: dict
+        """
+        slots = self._accounts.get(self.storage_url)
+        if slots is None:
+            response = self.client.get_account_metadata()
+            slots = {}
+            for header in self.KEY_HEADERS:
+                slots[header] = {'key': response.headers.get(header),
+                                 'usable_at': 0,
+                                 'used_at': 0}
+            self._accounts[self.storage_url] = slots
+        return slots
+
+    def set_keys(self, *keys):
+        """
+        Makes sure each of the keys, at most one per key slot, is set on the
+        account and has propagated. Keys that are already set are reused;
+        only keys that had to be set are waited for.
+
+        @param keys: TempURL keys the test will sign with
+        @type keys: strings
+        """
+        if len(keys) > len(self.KEY_HEADERS):
+            raise Exception('At most {0} TempURL keys can be set'.format(
+                len(self.KEY_HEADERS)))
+
+        slots = self._slots
+        now = time.time()
+        pending = [key for key in keys if key not in
+                   [slot['key'] for slot in slots.itervalues()]]
+        in_use = [slots[header] for header in self.KEY_HEADERS
+                  if slots[header]['key'] in keys]
+        for slot in in_use:
+            slot['used_at'] = now
+
+        for key in pending:
+            header = min(
+                [header for header in self.KEY_HEADERS
+                 if slots[header]['key'] not in keys],
+                key=lambda header: (slots[header]['key'] is not None,
+                                    slots[header]['used_at']))
+            response = self.client.set_temp_url_key(headers={header: key})
+            if not response.ok:
+                raise Exception('Could not set TempURL key.')
+            slots[header] = {'key': key,
+                             'usable_at': now + self.key_cache_time,
+                             'used_at': now}
+
+        usable_at = max([slots[header]['usable_at']
+                         for header in self.KEY_HEADERS
+                         if slots[header]['key'] in keys] or [0])
+        if usable_at > time.time():
+            time.sleep(usable_at - time.time())
+
+    def set_key(self, key):
+        """
+        Makes sure the key is set on the account and has propagated.
+
+        @param key: TempURL key the test will sign with
+        @type key: string
+        """
+        self.set_keys(key)
+
+    def forget(self):
+        """
+        Drops the tracked key state for the account, for use after keys
+        have been changed without the manager.
+        """
+        self._accounts.pop(self.storage_url, None)
+
+
 class ObjectStorageFixture(BaseTestFixture):
     """
     @summary: Base fixture for objectstorage tests
@@ -45,16 +218,8 @@ class ObjectStorageFixture(BaseTestFixture):
         Configuration of what version swift is running can be done from the
         objectstorage config file.
 
-        Note: "lambda func: func" is from the Python unit tests example
-              "25.3.6. Skipping tests and expected failures":
-
-        def skipUnlessHasattr(obj, attr):
-            if hasattr(obj, attr):
-                return lambda func: func
-
-            return unittest.skip("{!r} doesn't have {!r}".format(obj, attr))
-
-        http://docs.python.org/2/library/unittest.html
+        The version is looked up once per run, when the first decorated
+        test runs, rather than when the test is decorated.
 
         @param required_version: condition and version required to run the
                                  test. examples:
@@ -68,21 +233,16 @@ class ObjectStorageFixture(BaseTestFixture):
         @rtype: function
         """
 
-        def decorator(func):
+        def get_skip_reason():
             # TODO: This is not ideal, should change this to support
             # multiple versions
             required_version = required_versions[0]
-            objectstorage_api_config = ObjectStorageComposite().config
-            behaviors = ObjectStorageComposite().behaviors
-
-            swift_version = objectstorage_api_config.version
-            if not swift_version and objectstorage_api_config.use_swift_info:
-                info = behaviors.get_swift_info()
-                swift_version = info.get(
-                    'swift', {'version': None}).get('version', None)
+            swift_version = capabilities.get(
+                _capability_name('objectstorage_version'),
+                _discover_swift_version)
 
             if not swift_version:
-                return func
+                return None
 
             if required_version.startswith('<'):
                 required_version = required_version.lstrip('<')
@@ -98,15 +258,13 @@ class ObjectStorageFixture(BaseTestFixture):
                 extra_message = ''
 
             if compare_func(swift_version, required_version):
-                func
+                return None
 
-            setattr(func, '__unittest_skip__', True)
-            setattr(
-                func, '__unittest_skip_why__',
+            return (
                 'swift running version {0}, requires version{1}: {2}'.format(
                     swift_version, extra_message, required_version))
-            return func
-        return decorator
+
+        return skip_unless(get_skip_reason)
 
     @classmethod
     @memoized
@@ -116,51 +274,44 @@ class ObjectStorageFixture(BaseTestFixture):
         Configuration of what features are enabled can be done from the
         objectstorage config file.
 
-        Note: "lambda func: func" is from the Python unit tests example
-              "25.3.6. Skipping tests and expected failures":
-
-        def skipUnlessHasattr(obj, attr):
-            if hasattr(obj, attr):
-                return lambda func: func
-            return unittest.skip("{!r} doesn't have {!r}".format(obj, attr))
-
-        http://docs.python.org/2/library/unittest.html
+        The configured features are looked up once per run, when the first
+        decorated test runs, rather than when the test is decorated.
         """
 
-        def decorator(func):
-            objectstorage_api_config = ObjectStorageComposite().config
-            behaviors = ObjectStorageComposite().behaviors
-
-            features = behaviors.get_configured_features()
+        def get_skip_reason():
+            objectstorage_api_config = ObjectStorageAPIConfig()
+            features = get_configured_features()
 
             if features == objectstorage_api_config.ALL_FEATURES:
-                return func
+                return None
 
             if features == objectstorage_api_config.NO_FEATURES:
-                setattr(func, '__unittest_skip__', True)
-                setattr(func, '__unittest_skip_why__', 'Skipping All Features')
+                return 'Skipping All Features'
 
             features = features.split()
-            missing_reqs = False
             for req in required_features:
                 if req not in features:
-                    missing_reqs = True
-                    break
+                    return 'requires features: {0}'.format(
+                        ', '.join(required_features))
+            return None
 
-            if missing_reqs:
-                setattr(func, '__unittest_skip__', True)
-                setattr(
-                    func, '__unittest_skip_why__',
-                    'requires features: {0}'.format(
-                        ', '.join(required_features)))
+        return skip_unless(get_skip_reason)
 
-            return func
-        return decorator
+    @staticmethod
+    def is_feature_enabled(feature):
+        """
+        Returns True when the feature is configured in swift. The configured
+        features are looked up once per run.
+        """
+        features = get_configured_features()
+        if features == ObjectStorageAPIConfig().ALL_FEATURES:
+            return True
+        return feature in features.split()
 
     @classmethod
     def setUpClass(cls):
         super(ObjectStorageFixture, cls).setUpClass()
-        object_storage_api = ObjectStorageComposite()
+        object_storage_api = get_objectstorage_composite()
 
         cls.auth_info = object_storage_api.auth_info
         cls.objectstorage_api_config = object_storage_api.config
@@ -170,6 +321,22 @@ class ObjectStorageFixture(BaseTestFixture):
             cls.objectstorage_api_config.base_container_name)
         cls.client = object_storage_api.client
         cls.behaviors = object_storage_api.behaviors
+        cls.tempurl_keys = TempUrlKeyManager(
+            cls.client, cls.storage_url,
+            cls.objectstorage_api_config.tempurl_key_cache_time)
+        cls.archive_seeder = ArchiveSeeder(cls.client)
+
+    @classmethod
+    def seed_objects(cls, container_name, manifest, archive_format='tar'):
+        """
+        Creates the objects in the manifest, a list of object names or of
+        (name, size) pairs, with a single extract-archive upload.
+
+        rtype:   response
+        returns: The extract-archive response.
+        """
+        return cls.archive_seeder.seed(
+            container_name, manifest, archive_format=archive_format)
 
     def create_temp_container(self, descriptor='', headers=None):
         """
@@ -185,3 +352,19 @@ class ObjectStorageFixture(BaseTestFixture):
             self.behaviors.force_delete_containers,
             [container_name])
         return container_name
+
+    def wait_for_object_deletion(self, container_name, object_name,
+                                 timeout=None):
+        """
+        Polls an object until it is gone or the timeout, by default the
+        configured object deletion wait interval, expires.
+
+        rtype:   response
+        returns: The last get object response.
+        """
+        if timeout is None:
+            timeout = self.objectstorage_api_config.\
+                object_deletion_wait_interval
+        return poll_until(
+            lambda: self.client.get_object(container_name, object_name),
+            lambda response: response.status_code == 404, timeout=timeout)
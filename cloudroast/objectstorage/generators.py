@@ -13,36 +13,53 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import atexit
 import json
 import math
-from random import choice
+import os
+from binascii import unhexlify
+from functools import partial
+from multiprocessing.pool import ThreadPool
+from random import Random, choice
+from threading import BoundedSemaphore
 
 from hashlib import md5
 from cafe.common.unicode import UNICODE_BLOCKS, BLOCK_NAMES
 from cafe.drivers.unittest.datasets import DatasetList
-from cloudcafe.objectstorage.composites import ObjectStorageComposite
 from cloudcafe.objectstorage.objectstorage_api.config \
     import ObjectStorageAPIConfig
 
+from cloudroast.objectstorage.fixtures import (
+    get_configured_features, get_objectstorage_composite)
+
 
 CONTENT_TYPES = {
     'text': 'text/plain; charset=UTF-8'
 }
 
+# Size of the random byte blocks payloads are built from
+PAYLOAD_BLOCK_SIZE = 1024 * 1024
+
 
 class ObjectDatasetList(DatasetList):
     """
     Handles creation of differing types of objects for use with data driven
     tests.
+
+    By default each dataset provides a generate_object function which
+    uploads a new object. Tests which only read objects can ask for shared
+    objects instead; each dataset then provides a get_object function
+    which returns a reference to an object in the process wide object
+    corpus, uploading it only the first time it is asked for.
     """
 
-    def __init__(self, exclude=None):
-        object_storage_api = ObjectStorageComposite()
+    def __init__(self, exclude=None, shared=False):
+        object_storage_api = get_objectstorage_composite()
 
         api_config = object_storage_api.config
         client = object_storage_api.client
         behaviors = object_storage_api.behaviors
-        features = behaviors.get_configured_features()
+        features = get_configured_features()
 
         if features == api_config.ALL_FEATURES:
             features = ['dlo', 'slo']
@@ -52,23 +69,64 @@ class ObjectDatasetList(DatasetList):
         if exclude is None:
             exclude = []
 
-        if 'standard' not in exclude:
-            self.append_new_dataset(
-                'standard',
-                {'object_type': 'standard',
-                 'generate_object': generator.generate_object})
+        object_types = [
+            ('standard', generator.generate_object),
+            ('dlo', generator.generate_dynamic_large_object),
+            ('slo', generator.generate_static_large_object)]
+
+        for object_type, generate_object in object_types:
+            if object_type in exclude:
+                continue
+            if object_type != 'standard' and object_type not in features:
+                continue
+
+            if shared:
+                corpus = get_object_corpus(client, behaviors)
+                self.append_new_dataset(
+                    object_type,
+                    {'object_type': object_type,
+                     'get_object': partial(corpus.get_object, object_type)})
+            else:
+                self.append_new_dataset(
+                    object_type,
+                    {'object_type': object_type,
+                     'generate_object': generate_object})
+
 
-        if 'dlo' in features and 'dlo' not in exclude:
-            self.append_new_dataset(
-                'dlo',
-                {'object_type': 'dlo',
-                 'generate_object': generator.generate_dynamic_large_object})
+class StreamingPayload(object):
+    """
+    Object body that is generated a chunk at a time while it is being
+    uploaded, so only a single chunk is held in memory. The data is hashed
+    as it is produced; the md5 is complete once the payload has been
+    fully read.
+    """
 
-        if 'slo' in features and 'slo' not in exclude:
-            self.append_new_dataset(
-                'slo',
-                {'object_type': 'slo',
-                 'generate_object': generator.generate_static_large_object})
+    def __init__(self, generate_chunk, size, chunk_size=None, hashes=None):
+        """
+        @param generate_chunk: function returning generated data of the
+                               size it is called with
+        @type generate_chunk: function reference
+        @param size: total size of the payload
+        @type size: int
+        @param chunk_size: size of each chunk produced
+        @type chunk_size: int
+        @param hashes: additional hashes to update with the payload data
+        @type hashes: list of hash objects
+        """
+        self.generate_chunk = generate_chunk
+        self.size = size
+        self.chunk_size = chunk_size or PAYLOAD_BLOCK_SIZE
+        self.md5 = md5()
+        self.hashes = [self.md5] + list(hashes or [])
+
+    def __iter__(self):
+        remaining = self.size
+        while remaining > 0:
+            chunk = self.generate_chunk(min(self.chunk_size, remaining))
+            for data_hash in self.hashes:
+                data_hash.update(chunk)
+            remaining -= len(chunk)
+            yield chunk
 
 
 class ObjectStorageGenerator(object):
@@ -76,9 +134,85 @@ class ObjectStorageGenerator(object):
     Generates objects for testing.
     """
 
-    def __init__(self, client):
+    def __init__(self, client, segment_upload_workers=1):
+        """
+        @param client: object storage client used to create objects
+        @type client: ObjectStorageAPIClient
+        @param segment_upload_workers: number of large object segments
+                                       uploaded at the same time, segments
+                                       are uploaded one by one if 1
+        @type segment_upload_workers: int
+        """
         self.client = client
         self.api_config = ObjectStorageAPIConfig()
+        self.segment_upload_workers = segment_upload_workers
+        # Bounds the segments generated ahead of their upload, so only
+        # segment_upload_workers of them are held in memory at a time
+        self._segment_upload_slots = BoundedSemaphore(segment_upload_workers)
+        self._seeded_blocks = {}
+
+    def _get_segment_upload_pool(self):
+        """
+        Returns a pool to upload segments with, or None when segments
+        should be uploaded one by one.
+
+        @rtype: ThreadPool
+        """
+        if self.segment_upload_workers > 1:
+            return ThreadPool(processes=self.segment_upload_workers)
+        return None
+
+    def _start_segment_upload(self, pool, container_name, segment_name,
+                              segment_data):
+        """
+        Starts uploading a segment on the pool, or uploads it right away
+        when there is no pool. Blocks while segment_upload_workers segments
+        are already being uploaded.
+
+        @return: callable returning the response for the segment upload,
+                 blocking until the upload has completed
+        @rtype: function reference
+        """
+        if pool is None:
+            response = self.client.create_object(
+                container_name,
+                segment_name,
+                data=segment_data)
+            return lambda: response
+
+        def upload_segment():
+            try:
+                return self.client.create_object(
+                    container_name,
+                    segment_name,
+                    data=segment_data)
+            finally:
+                self._segment_upload_slots.release()
+
+        self._segment_upload_slots.acquire()
+        upload = pool.apply_async(upload_segment)
+        return upload.get
+
+    def _finish_segment_uploads(self, pool, uploads):
+        """
+        Waits for all segment uploads to complete, in segment order.
+
+        @param uploads: segment extra data and upload result pairs
+        @type uploads: list of tuples
+
+        @return: segment extra data, with the upload response added
+        @rtype: list of dicts
+        """
+        segments = []
+        try:
+            for segment_extra_data, get_response in uploads:
+                segment_extra_data['response'] = get_response()
+                segments.append(segment_extra_data)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        return segments
 
     def _get_default_data_pool(self):
         """
@@ -90,6 +224,50 @@ class ObjectStorageGenerator(object):
         return [x for x in UNICODE_BLOCKS.get_range(
             BLOCK_NAMES.basic_latin).encoded_codepoints()]
 
+    def generate_data(self, data_size, data_pool=None, seed=None):
+        """
+        Generates object data from the characters in a data pool.
+
+        Random bytes are mapped onto the data pool a block at a time rather
+        than choosing one character per call. Seeded data is built by
+        repeating a block generated once per seed and data pool, so the
+        same seed always produces the same data.
+
+        @param data_size: size of the data to generate
+        @type data_size: int
+        @param data_pool: characters to use in generating the data
+        @type data_pool: list of characters
+        @param seed: seed for repeatable data, random data if None
+        @type seed: hashable
+
+        @return: generated data
+        @rtype: string
+        """
+        if not data_pool:
+            data_pool = self._get_default_data_pool()
+
+        # Multi-byte characters can not be mapped from single random bytes
+        if any(len(character) != 1 for character in data_pool):
+            rng = Random(seed) if seed is not None else None
+            pick = rng.choice if rng else choice
+            return ''.join([pick(data_pool) for x in xrange(data_size)])
+
+        translation = ''.join(
+            [data_pool[x % len(data_pool)] for x in xrange(256)])
+
+        if seed is None:
+            return os.urandom(data_size).translate(translation)
+
+        block_key = (seed, translation)
+        block = self._seeded_blocks.get(block_key)
+        if block is None:
+            random_bits = Random(seed).getrandbits(PAYLOAD_BLOCK_SIZE * 8)
+            block = unhexlify('{0:0{1}x}'.format(
+                random_bits, PAYLOAD_BLOCK_SIZE * 2)).translate(translation)
+            self._seeded_blocks[block_key] = block
+        repeats = int(math.ceil(data_size / float(PAYLOAD_BLOCK_SIZE)))
+        return (block * repeats)[:data_size]
+
     def generate_object(self, container_name, object_name,
                         data=None, data_size=None, data_pool=None,
                         data_op=None, headers=None, params=None):
@@ -129,12 +307,8 @@ class ObjectStorageGenerator(object):
         elif data:
             data_size = len(data)
 
-        if not data_pool:
-            data_pool = self._get_default_data_pool()
-
         if not data:
-            data = ''.join(
-                [choice(data_pool) for x in xrange(data_size)])
+            data = self.generate_data(data_size, data_pool)
         extra_data = {}
         if data_op:
             (data, extra_data) = data_op(data, extra_data)
@@ -216,6 +390,10 @@ class ObjectStorageGenerator(object):
         data_md5 = md5()
         data_etag = md5()
         extra_data = {'segments': []}
+        # Segments are generated and hashed in order while the uploads
+        # complete in any order
+        pool = self._get_segment_upload_pool()
+        uploads = []
         for segment_id in [x for x in xrange(num_segments)]:
             segment_start = segment_id * segment_size
             if segment_id + 1 == num_segments:
@@ -225,8 +403,7 @@ class ObjectStorageGenerator(object):
             if data:
                 segment_data = data[segment_start:segment_end]
             else:
-                segment_data = ''.join([choice(data_pool) for x in xrange(
-                    segment_size)])
+                segment_data = self.generate_data(segment_size, data_pool)
 
             segment_md5 = md5(segment_data).hexdigest()
             segment_extra_data = {'name': segment_name,
@@ -241,12 +418,10 @@ class ObjectStorageGenerator(object):
             data_md5.update(segment_data)
             data_etag.update(segment_etag)
 
-            segment_response = self.client.create_object(
-                container_name,
-                segment_name,
-                data=segment_data)
-            segment_extra_data['response'] = segment_response
-            extra_data['segments'].append(segment_extra_data)
+            uploads.append((segment_extra_data, self._start_segment_upload(
+                pool, container_name, segment_name, segment_data)))
+
+        extra_data['segments'] = self._finish_segment_uploads(pool, uploads)
 
         default_headers = {'X-Object-Manifest': '{0}/segment.{1}'.format(
             container_name, object_name)}
@@ -327,6 +502,10 @@ class ObjectStorageGenerator(object):
         data_md5 = md5()
         data_etag = md5()
         extra_data = {'segments': []}
+        # Segments are generated and hashed in order while the uploads
+        # complete in any order
+        pool = self._get_segment_upload_pool()
+        uploads = []
         for segment_id in [x for x in xrange(num_segments)]:
             segment_start = segment_id * segment_size
             if segment_id + 1 == num_segments:
@@ -338,8 +517,7 @@ class ObjectStorageGenerator(object):
             if data:
                 segment_data = data[segment_start:segment_end]
             else:
-                segment_data = ''.join([choice(data_pool) for x in xrange(
-                    segment_size)])
+                segment_data = self.generate_data(segment_size, data_pool)
             segment_md5 = md5(segment_data).hexdigest()
             segment_extra_data = {'name': segment_name,
                                   'size': segment_size,
@@ -353,16 +531,14 @@ class ObjectStorageGenerator(object):
             data_md5.update(segment_data)
             data_etag.update(segment_etag)
 
-            segment_response = self.client.create_object(
-                container_name,
-                segment_name,
-                data=segment_data)
-            segment_extra_data['response'] = segment_response
-            extra_data['segments'].append(segment_extra_data)
+            uploads.append((segment_extra_data, self._start_segment_upload(
+                pool, container_name, segment_name, segment_data)))
 
             manifest.append({'path': segment_path, 'etag': segment_etag,
                              'size_bytes': segment_size})
 
+        extra_data['segments'] = self._finish_segment_uploads(pool, uploads)
+
         response = self.client.create_object(
             container_name,
             object_name,
@@ -374,3 +550,330 @@ class ObjectStorageGenerator(object):
                 'size': data_size,
                 'response': response,
                 'extra': extra_data}
+
+    def _get_segment_sizes(self, data_size, segment_size):
+        """
+        Splits data_size into segments of segment_size, the last segment
+        holding whatever remains.
+
+        @rtype: list of ints
+        """
+        sizes = [segment_size] * int(data_size / segment_size)
+        if data_size % segment_size:
+            sizes.append(data_size % segment_size)
+        return sizes
+
+    def _upload_streaming_segments(self, container_name, segment_names,
+                                   segment_sizes, data_pool=None,
+                                   chunk_size=None):
+        """
+        Uploads generated segments one after the other using chunked
+        transfer encoding, hashing each segment and the combined data as
+        they are produced.
+
+        @return: md5 and etag hashes of the combined data, and the extra
+                 data for each segment
+        @rtype: tuple
+        """
+        data_md5 = md5()
+        data_etag = md5()
+        segments = []
+        for segment_name, segment_size in zip(segment_names, segment_sizes):
+            payload = StreamingPayload(
+                lambda size: self.generate_data(size, data_pool),
+                segment_size, chunk_size=chunk_size, hashes=[data_md5])
+            segment_response = self.client.create_object(
+                container_name,
+                segment_name,
+                headers={'Transfer-Encoding': 'chunked'},
+                data=payload)
+
+            segment_md5 = payload.md5.hexdigest()
+            data_etag.update(segment_md5)
+            segments.append({'name': segment_name,
+                             'size': segment_size,
+                             'md5': segment_md5,
+                             'response': segment_response})
+        return data_md5, data_etag, segments
+
+    def generate_streaming_object(self, container_name, object_name,
+                                  data_size, data_pool=None,
+                                  chunk_size=None, headers=None):
+        """
+        Create a standard object without holding its data in memory. The
+        data is generated and uploaded a chunk at a time using chunked
+        transfer encoding.
+
+        @param container_name: container to create the object in
+        @type container_name: string
+        @param object_name: name of object to be created
+        @type object_name: string
+        @param data_size: size of object to be created
+        @type data_size: int
+        @param data_pool: characters to use in generating object content
+        @type data_pool: list of characters
+        @param chunk_size: size of the chunks the data is uploaded in
+        @type chunk_size: int
+        @param headers: headers to be used when creating the object
+        @type headers: dict
+
+        @return: data about the generated object
+        @type: dict
+        """
+        if not data_pool:
+            data_pool = self._get_default_data_pool()
+
+        payload = StreamingPayload(
+            lambda size: self.generate_data(size, data_pool),
+            data_size, chunk_size=chunk_size)
+
+        all_headers = {'Transfer-Encoding': 'chunked',
+                       'Content-Type': CONTENT_TYPES.get('text')}
+        all_headers.update(headers or {})
+
+        response = self.client.create_object(
+            container_name, object_name, data=payload,
+            headers=all_headers)
+
+        data_md5 = payload.md5.hexdigest()
+        return {'md5': data_md5,
+                'etag': data_md5,
+                'size': data_size,
+                'type': 'standard',
+                'response': response,
+                'extra': {}}
+
+    def generate_streaming_dynamic_large_object(self, container_name,
+                                                object_name, data_size,
+                                                segment_size=None,
+                                                data_pool=None,
+                                                chunk_size=None,
+                                                headers=None):
+        """
+        Create a dynamic large object without holding its data in memory.
+        Segments are generated and uploaded a chunk at a time, one segment
+        after the other.
+
+        @param container_name: container to create the object in
+        @type container_name: string
+        @param object_name: name of object to be created
+        @type object_name: string
+        @param data_size: size of object to be created
+        @type data_size: int
+        @param segment_size: size of each segment
+        @type segment_size: int
+        @param data_pool: characters to use in generating object content
+        @type data_pool: list of characters
+        @param chunk_size: size of the chunks the segments are uploaded in
+        @type chunk_size: int
+        @param headers: headers to be used when creating the object
+        @type headers: dict
+
+        @return: data about the generated segments and  object
+        @type: dict
+        """
+        if not data_pool:
+            data_pool = self._get_default_data_pool()
+
+        if not segment_size:
+            segment_size = self.api_config.min_slo_segment_size
+
+        segment_sizes = self._get_segment_sizes(data_size, segment_size)
+        segment_names = ['segment.{0}.{1}'.format(object_name, segment_id)
+                         for segment_id in xrange(len(segment_sizes))]
+
+        data_md5, data_etag, segments = self._upload_streaming_segments(
+            container_name, segment_names, segment_sizes,
+            data_pool=data_pool, chunk_size=chunk_size)
+
+        all_headers = {'X-Object-Manifest': '{0}/segment.{1}'.format(
+            container_name, object_name)}
+        all_headers.update(headers or {})
+
+        response = self.client.create_object(
+            container_name,
+            object_name,
+            headers=all_headers)
+
+        return {'md5': data_md5.hexdigest(),
+                'etag': data_etag.hexdigest(),
+                'size': data_size,
+                'type': 'dlo',
+                'response': response,
+                'extra': {'segments': segments}}
+
+    def generate_streaming_static_large_object(self, container_name,
+                                               object_name, data_size,
+                                               segment_size=None,
+                                               data_pool=None,
+                                               chunk_size=None,
+                                               headers=None):
+        """
+        Create a static large object without holding its data in memory.
+        Segments are generated and uploaded a chunk at a time, one segment
+        after the other, and the manifest is written from their hashes.
+
+        @param container_name: container to create the object in
+        @type container_name: string
+        @param object_name: name of object to be created
+        @type object_name: string
+        @param data_size: size of object to be created
+        @type data_size: int
+        @param segment_size: size of each segment
+        @type segment_size: int
+        @param data_pool: characters to use in generating object content
+        @type data_pool: list of characters
+        @param chunk_size: size of the chunks the segments are uploaded in
+        @type chunk_size: int
+        @param headers: headers to be used when creating the object
+        @type headers: dict
+
+        @return: data about the generated segments and  object
+        @type: dict
+        """
+        if not data_pool:
+            data_pool = self._get_default_data_pool()
+
+        if not segment_size:
+            segment_size = self.api_config.min_slo_segment_size
+
+        segment_sizes = self._get_segment_sizes(data_size, segment_size)
+        segment_names = ['{0}.{1}'.format(object_name, segment_id)
+                         for segment_id in xrange(len(segment_sizes))]
+
+        data_md5, data_etag, segments = self._upload_streaming_segments(
+            container_name, segment_names, segment_sizes,
+            data_pool=data_pool, chunk_size=chunk_size)
+
+        manifest = [{'path': '/{0}/{1}'.format(container_name,
+                                               segment['name']),
+                     'etag': segment['md5'],
+                     'size_bytes': segment['size']}
+                    for segment in segments]
+
+        response = self.client.create_object(
+            container_name,
+            object_name,
+            data=json.dumps(manifest),
+            params={'multipart-manifest': 'put'}, headers=headers)
+
+        return {'md5': data_md5.hexdigest(),
+                'etag': data_etag.hexdigest(),
+                'size': data_size,
+                'type': 'slo',
+                'response': response,
+                'extra': {'segments': segments}}
+
+
+class ObjectCorpus(object):
+    """
+    Content addressed cache of objects uploaded once per process into a
+    single container, for tests which only read objects. Objects are keyed
+    by their type and the md5 of their data, so any test asking for the
+    same content gets the same object. The container is deleted when the
+    process exits.
+
+    Tests must not modify or delete corpus objects.
+    """
+
+    def __init__(self, client, behaviors):
+        self.client = client
+        self.behaviors = behaviors
+        self.generator = ObjectStorageGenerator(client)
+        self._container_name = None
+        self._objects = {}
+
+    @property
+    def container_name(self):
+        if self._container_name is None:
+            container_name = self.behaviors.generate_unique_container_name(
+                'object_corpus')
+            self.client.create_container(container_name)
+            self._container_name = container_name
+            atexit.register(self.release)
+        return self._container_name
+
+    def _get_default_data_size(self, object_type):
+        if object_type == 'slo':
+            return int(self.generator.api_config.min_slo_segment_size * 3.5)
+        if object_type == 'dlo':
+            return 550
+        return 100
+
+    def get_object(self, object_type, data=None, data_size=None, seed=0,
+                   object_name=None):
+        """
+        Returns a corpus object of the given type and content, uploading it
+        if this is the first time it is asked for.
+
+        @param object_type: 'standard', 'dlo' or 'slo'
+        @type object_type: string
+        @param data: data for the object, generated from the seed if None
+        @type data: string
+        @param data_size: size of the data to generate, defaults to the
+                          size the generators use for the object type
+        @type data_size: int
+        @param seed: seed for the generated data
+        @type seed: hashable
+        @param object_name: name the corpus object name should start with
+        @type object_name: string
+
+        @return: data about the object, as returned by the generators, with
+                 the container_name and object_name of the object added
+        @rtype: dict
+        """
+        if data is None:
+            if not data_size:
+                data_size = self._get_default_data_size(object_type)
+            data = self.generator.generate_data(data_size, seed=seed)
+
+        key = (object_type, md5(data).hexdigest(), object_name)
+        if key not in self._objects:
+            self._objects[key] = self._upload(
+                object_type, data, '{0}_{1}_{2}'.format(
+                    object_name or 'corpus', object_type, key[1]))
+        return dict(self._objects[key])
+
+    def _upload(self, object_type, data, object_name):
+        generate_object = {
+            'standard': self.generator.generate_object,
+            'dlo': self.generator.generate_dynamic_large_object,
+            'slo': self.generator.generate_static_large_object
+        }[object_type]
+
+        container_name = self.container_name
+        object_info = generate_object(
+            container_name, object_name, data=data, data_size=len(data))
+        if not object_info['response'].ok:
+            raise Exception(
+                'Could not upload {0} corpus object, status code {1}'.format(
+                    object_type, object_info['response'].status_code))
+
+        object_info['container_name'] = container_name
+        object_info['object_name'] = object_name
+        return object_info
+
+    def release(self):
+        """
+        Deletes the corpus container and forgets its objects.
+        """
+        if self._container_name is not None:
+            self.behaviors.force_delete_containers([self._container_name])
+        self._container_name = None
+        self._objects = {}
+
+
+_object_corpus = None
+
+
+def get_object_corpus(client, behaviors):
+    """
+    Returns the object corpus shared by the process, creating it with the
+    client and behaviors given the first time.
+
+    @rtype: ObjectCorpus
+    """
+    global _object_corpus
+    if _object_corpus is None:
+        _object_corpus = ObjectCorpus(client, behaviors)
+    return _object_corpus
@@ -0,0 +1,899 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import atexit
+import hmac
+import json
+import math
+import tarfile
+import threading
+import time
+import uuid
+from cStringIO import StringIO
+from email.utils import formatdate, mktime_tz, parsedate_tz
+from hashlib import md5, sha1, sha256
+from SocketServer import ThreadingMixIn
+from urllib import quote, unquote
+from urlparse import parse_qs
+from wsgiref.simple_server import (
+    WSGIRequestHandler, WSGIServer, make_server)
+
+from cloudcafe.objectstorage.objectstorage_api.behaviors import \
+    ObjectStorageAPI_Behaviors
+from cloudcafe.objectstorage.objectstorage_api.client import \
+    ObjectStorageAPIClient
+from cloudcafe.objectstorage.objectstorage_api.config import \
+    ObjectStorageAPIConfig
+
+STATUS_MESSAGES = {
+    200: '200 OK', 201: '201 Created', 202: '202 Accepted',
+    204: '204 No Content', 206: '206 Partial Content',
+    304: '304 Not Modified', 400: '400 Bad Request',
+    401: '401 Unauthorized', 404: '404 Not Found',
+    405: '405 Method Not Allowed', 409: '409 Conflict',
+    411: '411 Length Required', 412: '412 Precondition Failed',
+    416: '416 Requested Range Not Satisfiable',
+    422: '422 Unprocessable Entity'}
+ARCHIVE_MODES = {'tar': 'r:', 'tar.gz': 'r:gz', 'tar.bz2': 'r:bz2'}
+TEMPURL_METHODS = ('GET', 'HEAD', 'PUT', 'POST', 'DELETE')
+LISTING_LIMIT = 10000
+
+
+class SwiftError(Exception):
+    """
+    Raised while handling a request to return an error response.
+    """
+
+    def __init__(self, status, body=''):
+        super(SwiftError, self).__init__(status)
+        self.status = status
+        self.body = body
+
+
+class StoredObject(object):
+    def __init__(self, data, content_type, metadata, timestamp,
+                 manifest=None):
+        self.data = data
+        self.content_type = content_type
+        self.metadata = metadata
+        self.timestamp = timestamp
+        self.manifest = manifest
+        self.etag = md5(data).hexdigest()
+
+    @property
+    def delete_at(self):
+        delete_at = self.metadata.get('x-delete-at')
+        return int(delete_at) if delete_at else None
+
+
+class StoredContainer(object):
+    def __init__(self, metadata, timestamp):
+        self.metadata = metadata
+        self.timestamp = timestamp
+        self.objects = {}
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietRequestHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalSwift(object):
+    """
+    In-process, in-memory stand-in for a Swift endpoint. It covers
+    accounts, containers, objects, DLO and SLO manifests, bulk delete,
+    extract-archive, TempURL, conditional and range GETs, copies, expiring
+    objects and object versioning. It is served over HTTP on localhost, so
+    the regular object storage client and behaviors can be pointed at it.
+    """
+
+    ACCOUNT = 'AUTH_local'
+
+    def __init__(self, auth_token=None, host='127.0.0.1', port=0,
+                 min_segment_size=1):
+        """
+        @param auth_token: token requests have to present
+        @type auth_token: string
+        @param host: address to listen on
+        @type host: string
+        @param port: port to listen on, any free port if 0
+        @type port: int
+        @param min_segment_size: minimum size of any but the last SLO
+                                 segment
+        @type min_segment_size: int
+        """
+        self.auth_token = auth_token or uuid.uuid4().hex
+        self.min_segment_size = min_segment_size
+        self.account_metadata = {}
+        self.containers = {}
+        self._lock = threading.RLock()
+        self._server = make_server(
+            host, port, self, server_class=_ThreadingWSGIServer,
+            handler_class=_QuietRequestHandler)
+        self._thread = None
+
+    @property
+    def url(self):
+        return 'http://{0}:{1}'.format(*self._server.server_address)
+
+    @property
+    def storage_url(self):
+        return '{0}/v1/{1}'.format(self.url, self.ACCOUNT)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self):
+        """
+        Removes all containers and account metadata.
+        """
+        with self._lock:
+            self.account_metadata = {}
+            self.containers = {}
+
+    def __call__(self, environ, start_response):
+        try:
+            status, headers, body = self._handle(environ)
+        except SwiftError as error:
+            status, headers, body = error.status, {}, error.body
+        headers.setdefault('Content-Type', 'text/plain; charset=UTF-8')
+        if environ['REQUEST_METHOD'] == 'HEAD':
+            headers.setdefault('Content-Length', '0')
+            body = ''
+        else:
+            headers['Content-Length'] = str(len(body))
+        headers['X-Trans-Id'] = uuid.uuid4().hex
+        start_response(STATUS_MESSAGES.get(status, str(status)),
+                       [(str(key), str(value))
+                        for key, value in headers.iteritems()])
+        return [body]
+
+    # Request parsing
+
+    @staticmethod
+    def _read_body(environ):
+        stream = environ['wsgi.input']
+        if environ.get('HTTP_TRANSFER_ENCODING', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int(stream.readline().split(';')[0].strip(), 16)
+                if size == 0:
+                    stream.readline()
+                    break
+                chunks.append(stream.read(size))
+                stream.readline()
+            return ''.join(chunks)
+        length = environ.get('CONTENT_LENGTH')
+        return stream.read(int(length)) if length else ''
+
+    @staticmethod
+    def _request_headers(environ):
+        headers = {}
+        for key, value in environ.iteritems():
+            if key.startswith('HTTP_'):
+                headers[key[5:].replace('_', '-').lower()] = value
+        if environ.get('CONTENT_TYPE'):
+            headers['content-type'] = environ['CONTENT_TYPE']
+        return headers
+
+    def _handle(self, environ):
+        method = environ['REQUEST_METHOD']
+        # wsgiref has already unquoted the path
+        path = environ.get('PATH_INFO', '')
+        params = dict((key, values[-1]) for key, values in parse_qs(
+            environ.get('QUERY_STRING', ''), keep_blank_values=True).items())
+        headers = self._request_headers(environ)
+        body = self._read_body(environ)
+
+        if path.rstrip('/') == '/info':
+            return 200, {'Content-Type': 'application/json'}, json.dumps(
+                self._info())
+
+        parts = path.split('/', 4)
+        if len(parts) < 3 or parts[1] != 'v1' or parts[2] != self.ACCOUNT:
+            raise SwiftError(404)
+        container = parts[3] if len(parts) > 3 and parts[3] else None
+        obj = parts[4] if len(parts) > 4 and parts[4] else None
+
+        with self._lock:
+            self._expire_objects()
+            if 'temp_url_sig' in params:
+                self._check_temp_url(method, path, params)
+            elif headers.get('x-auth-token') != self.auth_token:
+                raise SwiftError(401)
+
+            if 'bulk-delete' in params and method in ('POST', 'DELETE'):
+                return self._bulk_delete(headers, body)
+            if 'extract-archive' in params and method == 'PUT':
+                return self._extract_archive(
+                    container, obj, params, headers, body)
+            if obj is not None:
+                return self._object_request(
+                    method, container, obj, params, headers, body)
+            if container is not None:
+                return self._container_request(
+                    method, container, params, headers)
+            return self._account_request(method, params, headers)
+
+    def _info(self):
+        return {'swift': {'version': 'local'},
+                'slo': {'min_segment_size': self.min_segment_size},
+                'bulk_delete': {}, 'bulk_upload': {},
+                'tempurl': {'methods': list(TEMPURL_METHODS)}}
+
+    def _expire_objects(self):
+        now = time.time()
+        for container in self.containers.itervalues():
+            for name, stored in container.objects.items():
+                if stored.delete_at is not None and stored.delete_at <= now:
+                    del container.objects[name]
+
+    # TempURL
+
+    def _check_temp_url(self, method, path, params):
+        try:
+            expires = int(params.get('temp_url_expires'))
+        except (TypeError, ValueError):
+            raise SwiftError(401)
+        if expires < time.time():
+            raise SwiftError(401)
+
+        signature = params['temp_url_sig']
+        digest = sha256 if len(signature) == 64 else sha1
+        keys = [value for key, value in self.account_metadata.iteritems()
+                if key in ('x-account-meta-temp-url-key',
+                           'x-account-meta-temp-url-key-2')]
+        methods = [method]
+        if method == 'HEAD':
+            methods.extend(['GET', 'PUT'])
+        for key in keys:
+            for signed_method in methods:
+                expected = hmac.new(key, '{0}\n{1}\n{2}'.format(
+                    signed_method, expires, path), digest).hexdigest()
+                if expected == signature:
+                    return
+        raise SwiftError(401)
+
+    # Account
+
+    def _account_request(self, method, params, headers):
+        if method in ('GET', 'HEAD'):
+            response_headers = self._account_headers()
+            if method == 'HEAD':
+                return 204, response_headers, ''
+            names = sorted(self.containers)
+            entries = [{'name': name,
+                        'count': len(self.containers[name].objects),
+                        'bytes': self._bytes_used(self.containers[name])}
+                       for name in names]
+            return self._listing(entries, params, headers, response_headers)
+        if method == 'POST':
+            self._update_metadata(self.account_metadata, headers, 'account')
+            return 204, {}, ''
+        raise SwiftError(405)
+
+    def _account_headers(self):
+        headers = self._metadata_headers(self.account_metadata)
+        headers['X-Account-Container-Count'] = len(self.containers)
+        headers['X-Account-Object-Count'] = sum(
+            len(container.objects)
+            for container in self.containers.itervalues())
+        headers['X-Account-Bytes-Used'] = sum(
+            self._bytes_used(container)
+            for container in self.containers.itervalues())
+        return headers
+
+    # Containers
+
+    def _get_container(self, name):
+        container = self.containers.get(name)
+        if container is None:
+            raise SwiftError(404)
+        return container
+
+    def _container_request(self, method, name, params, headers):
+        if method == 'PUT':
+            status = 202 if name in self.containers else 201
+            container = self.containers.setdefault(
+                name, StoredContainer({}, time.time()))
+            self._update_metadata(container.metadata, headers, 'container')
+            return status, {}, ''
+
+        container = self._get_container(name)
+        if method == 'POST':
+            self._update_metadata(container.metadata, headers, 'container')
+            return 204, {}, ''
+        if method == 'DELETE':
+            if container.objects:
+                raise SwiftError(409, 'There was a conflict when trying to '
+                                      'complete your request.')
+            del self.containers[name]
+            return 204, {}, ''
+        if method in ('GET', 'HEAD'):
+            response_headers = self._metadata_headers(container.metadata)
+            response_headers['X-Container-Object-Count'] = len(
+                container.objects)
+            response_headers['X-Container-Bytes-Used'] = self._bytes_used(
+                container)
+            if method == 'HEAD':
+                return 204, response_headers, ''
+            entries = [self._object_entry(object_name, stored)
+                       for object_name, stored
+                       in sorted(container.objects.iteritems())]
+            return self._listing(entries, params, headers, response_headers)
+        raise SwiftError(405)
+
+    def _bytes_used(self, container):
+        return sum(len(stored.data)
+                   for stored in container.objects.itervalues())
+
+    def _object_entry(self, name, stored):
+        return {'name': name,
+                'hash': stored.etag,
+                'bytes': len(stored.data),
+                'content_type': stored.content_type,
+                'last_modified': time.strftime(
+                    '%Y-%m-%dT%H:%M:%S', time.gmtime(stored.timestamp)) +
+                '.{0:06d}'.format(int(stored.timestamp % 1 * 1000000))}
+
+    def _listing(self, entries, params, headers, response_headers):
+        prefix = params.get('prefix', '')
+        marker = params.get('marker', '')
+        end_marker = params.get('end_marker')
+        delimiter = params.get('delimiter')
+        try:
+            limit = min(int(params.get('limit', LISTING_LIMIT)),
+                        LISTING_LIMIT)
+        except ValueError:
+            raise SwiftError(412, 'Value of limit must be a positive integer')
+
+        listed = []
+        for entry in entries:
+            name = entry['name']
+            if len(listed) >= limit:
+                break
+            if not name.startswith(prefix) or name <= marker:
+                continue
+            if end_marker and name >= end_marker:
+                continue
+            if delimiter:
+                index = name.find(delimiter, len(prefix))
+                if index >= 0:
+                    subdir = name[:index + len(delimiter)]
+                    if subdir > marker and (
+                            not listed or
+                            listed[-1].get('subdir') != subdir):
+                        listed.append({'subdir': subdir})
+                    continue
+            listed.append(entry)
+
+        if not listed:
+            return 204, response_headers, ''
+
+        listing_format = params.get('format')
+        if not listing_format:
+            accept = headers.get('accept', '')
+            if 'json' in accept:
+                listing_format = 'json'
+            elif 'xml' in accept:
+                listing_format = 'xml'
+        if listing_format == 'json':
+            response_headers['Content-Type'] = (
+                'application/json; charset=utf-8')
+            return 200, response_headers, json.dumps(listed)
+        if listing_format == 'xml':
+            response_headers['Content-Type'] = (
+                'application/xml; charset=utf-8')
+            return 200, response_headers, self._xml_listing(listed)
+        return 200, response_headers, ''.join(
+            '{0}\n'.format(entry.get('name', entry.get('subdir')))
+            for entry in listed)
+
+    @staticmethod
+    def _xml_listing(listed):
+        items = []
+        for entry in listed:
+            if 'subdir' in entry:
+                items.append('<subdir name="{0}"><name>{0}</name>'
+                             '</subdir>'.format(entry['subdir']))
+                continue
+            items.append('<object>{0}</object>'.format(''.join(
+                '<{0}>{1}</{0}>'.format(key, value)
+                for key, value in sorted(entry.iteritems()))))
+        return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<listing>{0}</listing>'.format(''.join(items)))
+
+    # Objects
+
+    def _get_object(self, container_name, name):
+        stored = self._get_container(container_name).objects.get(name)
+        if stored is None:
+            raise SwiftError(404)
+        return stored
+
+    def _object_request(self, method, container_name, name, params,
+                        headers, body):
+        if method == 'PUT':
+            return self._put_object(
+                container_name, name, params, headers, body)
+        if method == 'COPY':
+            destination = unquote(headers.get('destination', ''))
+            dest_container, _, dest_name = destination.lstrip('/').partition(
+                '/')
+            headers['x-copy-from'] = '/{0}/{1}'.format(container_name, name)
+            return self._put_object(
+                dest_container, dest_name, {}, headers, '')
+
+        stored = self._get_object(container_name, name)
+        if method == 'POST':
+            metadata = dict((key, value) for key, value
+                            in stored.metadata.iteritems()
+                            if not key.startswith('x-object-meta-'))
+            self._update_metadata(metadata, headers, 'object')
+            stored.metadata = metadata
+            return 202, {}, ''
+        if method == 'DELETE':
+            return self._delete_object(container_name, name, stored, params)
+        if method in ('GET', 'HEAD'):
+            return self._get_object_response(
+                container_name, name, stored, params, headers)
+        raise SwiftError(405)
+
+    def _put_object(self, container_name, name, params, headers, body):
+        container = self._get_container(container_name)
+        metadata = {}
+        self._update_metadata(metadata, headers, 'object')
+        content_type = headers.get('content-type',
+                                   'application/octet-stream')
+        manifest = None
+
+        copy_from = headers.get('x-copy-from')
+        if copy_from:
+            source_container, _, source_name = unquote(
+                copy_from).lstrip('/').partition('/')
+            source = self._get_object(source_container, source_name)
+            body = self._read_content(source)[0]
+            copied = dict(source.metadata)
+            copied.pop('x-object-manifest', None)
+            copied.update(metadata)
+            metadata = copied
+            if 'content-type' not in headers:
+                content_type = source.content_type
+        elif params.get('multipart-manifest') == 'put':
+            manifest = self._build_manifest(body)
+            body = json.dumps(manifest)
+            metadata['x-static-large-object'] = 'True'
+
+        if 'x-delete-after' in headers:
+            metadata['x-delete-at'] = str(
+                int(time.time() + int(headers['x-delete-after'])))
+        metadata.pop('x-delete-after', None)
+
+        etag = headers.get('etag')
+        if etag and manifest is None and (
+                etag.strip('"').lower() != md5(body).hexdigest()):
+            raise SwiftError(422)
+
+        if name in container.objects:
+            self._save_version(container, name, container.objects[name])
+        stored = StoredObject(body, content_type, metadata, time.time(),
+                              manifest)
+        container.objects[name] = stored
+        return 201, {'Etag': self._object_etag(stored),
+                     'Last-Modified': self._last_modified(stored)}, ''
+
+    def _build_manifest(self, body):
+        try:
+            segments = json.loads(body)
+        except ValueError:
+            raise SwiftError(400, 'Manifest must be valid json.')
+        manifest = []
+        errors = []
+        for index, segment in enumerate(segments):
+            path = segment.get('path', '')
+            container_name, _, name = path.lstrip('/').partition('/')
+            try:
+                stored = self._get_object(container_name, name)
+            except SwiftError:
+                errors.append('{0}, 404 Not Found'.format(path))
+                continue
+            size = len(self._read_content(stored)[0])
+            etag = self._object_etag(stored).strip('"')
+            if segment.get('etag') and segment['etag'] != etag:
+                errors.append('{0}, Etag Mismatch'.format(path))
+            if segment.get('size_bytes') is not None and (
+                    int(segment['size_bytes']) != size):
+                errors.append('{0}, Size Mismatch'.format(path))
+            if index < len(segments) - 1 and size < self.min_segment_size:
+                errors.append('{0}, Too Small'.format(path))
+            manifest.append({'name': path, 'hash': etag, 'bytes': size})
+        if errors:
+            raise SwiftError(400, 'Errors:\n{0}'.format('\n'.join(errors)))
+        return manifest
+
+    def _save_version(self, container, name, stored):
+        versions_location = container.metadata.get('x-versions-location')
+        if not versions_location or versions_location not in self.containers:
+            return
+        version_name = '{0:03x}{1}/{2:.5f}'.format(
+            len(name), name, stored.timestamp)
+        self.containers[versions_location].objects[version_name] = stored
+
+    def _delete_object(self, container_name, name, stored, params):
+        container = self._get_container(container_name)
+        if params.get('multipart-manifest') == 'delete' and stored.manifest:
+            for segment in stored.manifest:
+                segment_container, _, segment_name = segment[
+                    'name'].lstrip('/').partition('/')
+                if segment_container in self.containers:
+                    self.containers[segment_container].objects.pop(
+                        segment_name, None)
+        del container.objects[name]
+
+        versions_location = container.metadata.get('x-versions-location')
+        versions = self.containers.get(versions_location)
+        if versions is not None:
+            prefix = '{0:03x}{1}/'.format(len(name), name)
+            version_names = sorted(version_name for version_name
+                                   in versions.objects
+                                   if version_name.startswith(prefix))
+            if version_names:
+                container.objects[name] = versions.objects.pop(
+                    version_names[-1])
+        return 204, {}, ''
+
+    def _read_content(self, stored):
+        """
+        Returns the content of an object, following DLO and SLO manifests,
+        and its etag.
+        """
+        if stored.manifest is not None:
+            data = []
+            for segment in stored.manifest:
+                segment_container, _, segment_name = segment[
+                    'name'].lstrip('/').partition('/')
+                data.append(self._read_content(self._get_object(
+                    segment_container, segment_name))[0])
+            return ''.join(data), self._object_etag(stored)
+
+        object_manifest = stored.metadata.get('x-object-manifest')
+        if object_manifest:
+            segment_container, _, prefix = unquote(
+                object_manifest).partition('/')
+            container = self.containers.get(segment_container)
+            segments = []
+            if container is not None:
+                segments = [container.objects[segment_name]
+                            for segment_name in sorted(container.objects)
+                            if segment_name.startswith(prefix)]
+            return (''.join(segment.data for segment in segments),
+                    self._object_etag(stored))
+        return stored.data, stored.etag
+
+    def _object_etag(self, stored):
+        if stored.manifest is not None:
+            return '"{0}"'.format(md5(''.join(
+                segment['hash'] for segment in stored.manifest)).hexdigest())
+        object_manifest = stored.metadata.get('x-object-manifest')
+        if object_manifest:
+            segment_container, _, prefix = unquote(
+                object_manifest).partition('/')
+            container = self.containers.get(segment_container)
+            etags = []
+            if container is not None:
+                etags = [container.objects[segment_name].etag
+                         for segment_name in sorted(container.objects)
+                         if segment_name.startswith(prefix)]
+            return '"{0}"'.format(md5(''.join(etags)).hexdigest())
+        return stored.etag
+
+    @staticmethod
+    def _last_modified(stored):
+        return formatdate(math.ceil(stored.timestamp), usegmt=True)
+
+    def _get_object_response(self, container_name, name, stored, params,
+                             headers):
+        if params.get('multipart-manifest') == 'get' and stored.manifest:
+            data, etag = stored.data, stored.etag
+        else:
+            data, etag = self._read_content(stored)
+
+        response_headers = self._metadata_headers(stored.metadata)
+        response_headers.update({
+            'Content-Type': stored.content_type,
+            'Etag': etag,
+            'Last-Modified': self._last_modified(stored),
+            'X-Timestamp': '{0:.5f}'.format(stored.timestamp),
+            'Accept-Ranges': 'bytes'})
+        if stored.manifest is not None:
+            response_headers['X-Static-Large-Object'] = 'True'
+
+        if 'temp_url_sig' in params:
+            self._set_disposition(response_headers, name, params)
+
+        self._check_conditions(stored, etag, headers)
+
+        range_header = headers.get('range')
+        if range_header:
+            ranges = self._parse_ranges(range_header, len(data))
+            if ranges == []:
+                raise SwiftError(416)
+            if ranges:
+                return self._range_response(
+                    data, ranges, response_headers)
+
+        response_headers['Content-Length'] = len(data)
+        return 200, response_headers, data
+
+    @staticmethod
+    def _set_disposition(response_headers, name, params):
+        filename = params.get('filename', name.rstrip('/').split('/')[-1])
+        if 'inline' in params:
+            disposition = 'inline'
+            if 'filename' in params:
+                disposition += '; filename="{0}"'.format(filename)
+        else:
+            disposition = 'attachment; filename="{0}"; ' \
+                          'filename*=UTF-8\'\'{1}'.format(
+                              filename, quote(filename))
+        response_headers['Content-Disposition'] = disposition
+
+    def _check_conditions(self, stored, etag, headers):
+        quoted = etag.strip('"')
+        if_match = headers.get('if-match')
+        if if_match and if_match != '*' and quoted not in [
+                value.strip().strip('"') for value in if_match.split(',')]:
+            raise SwiftError(412)
+        if_none_match = headers.get('if-none-match')
+        if if_none_match and (if_none_match == '*' or quoted in [
+                value.strip().strip('"')
+                for value in if_none_match.split(',')]):
+            raise SwiftError(304)
+
+        last_modified = math.ceil(stored.timestamp)
+        if_modified_since = self._parse_date(headers.get('if-modified-since'))
+        if if_modified_since is not None and (
+                last_modified <= if_modified_since):
+            raise SwiftError(304)
+        if_unmodified_since = self._parse_date(
+            headers.get('if-unmodified-since'))
+        if if_unmodified_since is not None and (
+                last_modified > if_unmodified_since):
+            raise SwiftError(412)
+
+    @staticmethod
+    def _parse_date(value):
+        if not value:
+            return None
+        parsed = parsedate_tz(value)
+        return mktime_tz(parsed) if parsed else None
+
+    @staticmethod
+    def _parse_ranges(range_header, length):
+        """
+        Returns the satisfiable (start, end) byte ranges, an empty list if
+        none is satisfiable, or None if the header is not a valid range.
+        """
+        units, _, specs = range_header.partition('=')
+        if units.strip() != 'bytes' or not specs:
+            return None
+        ranges = []
+        for spec in specs.split(','):
+            start, dash, end = spec.strip().partition('-')
+            if not dash or not (start.isdigit() or end.isdigit()):
+                return None
+            if (start and not start.isdigit()) or (
+                    end and not end.isdigit()):
+                return None
+            if not start:
+                if int(end) == 0:
+                    continue
+                ranges.append((max(length - int(end), 0), length - 1))
+                continue
+            if end and int(end) < int(start):
+                return None
+            if int(start) >= length:
+                continue
+            ranges.append((int(start), min(
+                int(end) if end else length - 1, length - 1)))
+        return ranges
+
+    @staticmethod
+    def _range_response(data, ranges, response_headers):
+        length = len(data)
+        content_type = response_headers['Content-Type']
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            response_headers['Content-Range'] = 'bytes {0}-{1}/{2}'.format(
+                start, end, length)
+            return 206, response_headers, data[start:end + 1]
+
+        boundary = uuid.uuid4().hex
+        parts = []
+        for start, end in ranges:
+            parts.append(
+                '--{0}\r\nContent-Type: {1}\r\n'
+                'Content-Range: bytes {2}-{3}/{4}\r\n\r\n{5}\r\n'.format(
+                    boundary, content_type, start, end, length,
+                    data[start:end + 1]))
+        parts.append('--{0}--'.format(boundary))
+        response_headers['Content-Type'] = (
+            'multipart/byteranges;boundary={0}'.format(boundary))
+        return 206, response_headers, ''.join(parts)
+
+    # Bulk operations
+
+    @staticmethod
+    def _bulk_response(headers, values, errors):
+        status = values.get('Response Status', '200 OK')
+        values['Response Body'] = values.get('Response Body', '')
+        values['Errors'] = errors
+        if 'json' in headers.get('accept', ''):
+            return 200, {'Content-Type': 'application/json'}, json.dumps(
+                values)
+        lines = ['{0}: {1}'.format(key, value)
+                 for key, value in sorted(values.iteritems())
+                 if key != 'Errors']
+        lines.append('Errors:')
+        lines.extend('{0}, {1}'.format(*error) for error in errors)
+        return 200, {'Response-Status': status}, '\n'.join(lines) + '\n'
+
+    def _bulk_delete(self, headers, body):
+        deleted = 0
+        not_found = 0
+        errors = []
+        for line in body.splitlines():
+            path = unquote(line.strip()).lstrip('/')
+            if not path:
+                continue
+            container_name, _, name = path.partition('/')
+            container = self.containers.get(container_name)
+            if name:
+                if container is None or name not in container.objects:
+                    not_found += 1
+                    continue
+                del container.objects[name]
+                deleted += 1
+            elif container is None:
+                not_found += 1
+            elif container.objects:
+                errors.append(['/' + path, '409 Conflict'])
+            else:
+                del self.containers[container_name]
+                deleted += 1
+        status = '400 Bad Request' if errors else '200 OK'
+        return self._bulk_response(
+            headers, {'Number Deleted': deleted,
+                      'Number Not Found': not_found,
+                      'Response Status': status}, errors)
+
+    def _extract_archive(self, container_name, prefix, params, headers,
+                         body):
+        archive_format = params.get('extract-archive')
+        if archive_format not in ARCHIVE_MODES:
+            raise SwiftError(400, 'Unsupported archive format')
+
+        created = 0
+        errors = []
+        try:
+            archive = tarfile.open(fileobj=StringIO(body),
+                                   mode=ARCHIVE_MODES[archive_format])
+            members = [member for member in archive.getmembers()
+                       if member.isfile()]
+        except (tarfile.TarError, IOError, EOFError) as error:
+            return self._bulk_response(
+                headers, {'Number Files Created': 0,
+                          'Response Status': '400 Bad Request',
+                          'Response Body': 'Invalid Tar File: {0}'.format(
+                              error)}, [])
+
+        for member in members:
+            path = member.name
+            if path.startswith('./'):
+                path = path[2:]
+            if container_name:
+                target_container = container_name
+                name = (prefix or '') + path
+            else:
+                target_container, _, name = path.partition('/')
+                if not name:
+                    errors.append([path, '400 Bad Request'])
+                    continue
+            container = self.containers.setdefault(
+                target_container, StoredContainer({}, time.time()))
+            if name in container.objects:
+                self._save_version(container, name, container.objects[name])
+            container.objects[name] = StoredObject(
+                archive.extractfile(member).read(),
+                'application/octet-stream', {}, time.time())
+            created += 1
+
+        status = '400 Bad Request' if errors else '201 Created'
+        return self._bulk_response(
+            headers, {'Number Files Created': created,
+                      'Response Status': status}, errors)
+
+    # Metadata
+
+    @staticmethod
+    def _update_metadata(metadata, headers, kind):
+        prefixes = ('x-{0}-'.format(kind),)
+        if kind == 'object':
+            prefixes += ('content-disposition', 'content-encoding',
+                         'x-delete-at', 'x-delete-after',
+                         'x-object-manifest', 'access-control-')
+        for key, value in headers.iteritems():
+            if key.startswith('x-remove-{0}-'.format(kind)):
+                metadata.pop('x-{0}-{1}'.format(
+                    kind, key[len('x-remove-{0}-'.format(kind)):]), None)
+            elif key.startswith(prefixes):
+                if value:
+                    metadata[key] = value
+                else:
+                    metadata.pop(key, None)
+
+    @staticmethod
+    def _metadata_headers(metadata):
+        return dict(('-'.join(part.capitalize() for part in key.split('-')),
+                     value) for key, value in metadata.iteritems())
+
+
+class LocalObjectStorageComposite(object):
+    """
+    Drop-in replacement for ObjectStorageComposite which points the object
+    storage client and behaviors at the process wide LocalSwift.
+    """
+
+    def __init__(self):
+        swift = get_local_swift()
+        self.config = ObjectStorageAPIConfig()
+        self.auth_info = None
+        self.storage_url = swift.storage_url
+        self.auth_token = swift.auth_token
+        self.client = ObjectStorageAPIClient(
+            self.storage_url, self.auth_token)
+        self.behaviors = ObjectStorageAPI_Behaviors(self.client, self.config)
+
+
+_local_swift = None
+_local_swift_lock = threading.Lock()
+
+
+def get_local_swift():
+    """
+    Returns the LocalSwift shared by the process, starting it the first
+    time. It is stopped when the process exits.
+
+    @rtype: LocalSwift
+    """
+    global _local_swift
+    with _local_swift_lock:
+        if _local_swift is None:
+            _local_swift = LocalSwift(
+                min_segment_size=ObjectStorageAPIConfig(
+                    ).min_slo_segment_size).start()
+            atexit.register(_local_swift.stop)
+    return _local_swift
@@ -0,0 +1,222 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import json
+import os
+import unittest
+
+from cloudcafe.common.tools.check_dict import get_value
+from cloudcafe.objectstorage.objectstorage_api.common.constants import \
+    Constants
+from cloudroast.common.concurrency import map_concurrently
+from cloudroast.common.timing import LatencyRecorder
+from cloudroast.objectstorage.fixtures import ObjectStorageFixture
+
+CONTENT_TYPE_TEXT = 'text/plain; charset=UTF-8'
+CONTAINER_NAME = 'list_scale_test_container'
+PSEUDO_DIR_COUNT = 10
+PAGE_SIZE = 1000
+ARCHIVE_BATCH_SIZE = 10000
+SEED_WORKERS = 20
+
+
+@unittest.skipUnless(get_value('listing-scale'),
+                     'set listing-scale to the number of objects to list')
+class ListingScaleTest(ObjectStorageFixture):
+    """
+    Seeds a container with listing-scale objects, spread over
+    pseudo-directories, and pages through it with marker, end_marker,
+    prefix and delimiter listings. Each walk must return exactly the
+    expected names; the latency of each page request and the listing
+    throughput are logged. If listing-p99-limit is set, the p99 page
+    latency of each walk must be below it, in seconds.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super(ListingScaleTest, cls).setUpClass()
+
+        cls.object_count = int(get_value('listing-scale'))
+        p99_limit = get_value('listing-p99-limit')
+        cls.p99_limit = float(p99_limit) if p99_limit else None
+
+        cls.container_name = CONTAINER_NAME
+        cls.client.create_container(cls.container_name)
+        cls.addClassCleanup(
+            cls.behaviors.force_delete_containers, [cls.container_name])
+
+        cls.pseudo_dirs = ['dir_{0}/'.format(x)
+                           for x in xrange(PSEUDO_DIR_COUNT)]
+        cls.obj_names = sorted(
+            '{0}obj_{1:07d}'.format(
+                cls.pseudo_dirs[x % PSEUDO_DIR_COUNT], x)
+            for x in xrange(cls.object_count))
+
+        if cls.is_feature_enabled('bulk_upload'):
+            cls._seed_with_archives(cls.obj_names)
+        else:
+            cls._seed_with_puts(cls.obj_names)
+
+    @classmethod
+    def _seed_with_archives(cls, obj_names):
+        """
+        Creates the objects with extract-archive uploads of
+        ARCHIVE_BATCH_SIZE objects each.
+        """
+        headers = {'Accept': 'application/json'}
+        for start in xrange(0, len(obj_names), ARCHIVE_BATCH_SIZE):
+            batch = obj_names[start:start + ARCHIVE_BATCH_SIZE]
+            archive_path = cls.client.create_archive(batch, None)
+            try:
+                with open(archive_path, 'rb') as archive_file:
+                    response = cls.client.create_archive_object(
+                        archive_file,
+                        'tar',
+                        upload_path=cls.container_name,
+                        headers=headers)
+            finally:
+                os.remove(archive_path)
+
+            if (not response.ok or
+                    int(response.entity.num_files_created) != len(batch)):
+                raise Exception(
+                    'Seeding {0} objects with extract-archive failed: '
+                    '{1}'.format(len(batch), response.content))
+
+    @classmethod
+    def _seed_with_puts(cls, obj_names):
+        """
+        Creates the objects with SEED_WORKERS concurrent PUTs.
+        """
+        object_data = Constants.VALID_OBJECT_DATA
+        headers = {'Content-Length': str(len(object_data)),
+                   'Content-Type': CONTENT_TYPE_TEXT}
+
+        uploads = map_concurrently(
+            lambda obj_name: cls.client.create_object(
+                cls.container_name, obj_name, headers=headers,
+                data=object_data),
+            obj_names, SEED_WORKERS)
+
+        failed = [upload.item for upload in uploads
+                  if not upload.ok or not upload.result.ok]
+        if failed:
+            raise Exception('Seeding failed for {0} objects, first: '
+                            '{1}'.format(len(failed), failed[0]))
+
+    def _walk_listing(self, recorder, **params):
+        """
+        Pages through the container listing, PAGE_SIZE names at a time,
+        using the last name of each page as the marker for the next.
+
+        @return: the names, or subdirs, returned by all pages
+        @rtype: list
+        """
+        params.update({'format': 'json', 'limit': PAGE_SIZE})
+        names = []
+        while True:
+            response = recorder.call(
+                self.client.list_objects, self.container_name,
+                params=dict(params))
+            self.assertTrue(
+                response.ok,
+                msg="listing with {0} failed with status code {1}".format(
+                    params, response.status_code))
+
+            page = [member.get('name', member.get('subdir'))
+                    for member in json.loads(response.content)]
+            recorder.add_items(len(page))
+            names.extend(page)
+
+            if len(page) < PAGE_SIZE:
+                break
+            params['marker'] = page[-1]
+        return names
+
+    def _check_latency(self, recorder):
+        self.fixture_log.info(str(recorder))
+        if self.p99_limit is None:
+            return
+
+        p99 = recorder.summary()['p99']
+        self.assertLessEqual(
+            p99,
+            self.p99_limit,
+            msg="{0} p99 page latency {1:.3f}s exceeded {2:.3f}s".format(
+                recorder.name, p99, self.p99_limit))
+
+    def test_marker_walk(self):
+        recorder = LatencyRecorder('marker walk')
+        names = self._walk_listing(recorder)
+
+        self.assertEqual(
+            self.obj_names,
+            names,
+            msg="marker walk returned {0} names, expected {1}".format(
+                len(names), len(self.obj_names)))
+        self._check_latency(recorder)
+
+    def test_end_marker_walk(self):
+        end_marker = self.obj_names[len(self.obj_names) / 2]
+        expected = [name for name in self.obj_names if name < end_marker]
+
+        recorder = LatencyRecorder('end_marker walk')
+        names = self._walk_listing(recorder, end_marker=end_marker)
+
+        self.assertEqual(
+            expected,
+            names,
+            msg="end_marker walk returned {0} names, expected {1}".format(
+                len(names), len(expected)))
+        self._check_latency(recorder)
+
+    def test_prefix_walk(self):
+        prefix = self.pseudo_dirs[-1]
+        expected = [name for name in self.obj_names
+                    if name.startswith(prefix)]
+
+        recorder = LatencyRecorder('prefix walk')
+        names = self._walk_listing(recorder, prefix=prefix)
+
+        self.assertEqual(
+            expected,
+            names,
+            msg="prefix walk returned {0} names, expected {1}".format(
+                len(names), len(expected)))
+        self._check_latency(recorder)
+
+    def test_delimiter_walk(self):
+        recorder = LatencyRecorder('delimiter walk')
+        subdirs = self._walk_listing(recorder, delimiter='/')
+
+        expected = sorted(set(
+            name.split('/')[0] + '/' for name in self.obj_names))
+        self.assertEqual(
+            expected,
+            subdirs,
+            msg="delimiter listing returned {0}, expected {1}".format(
+                subdirs, expected))
+
+        prefix = self.pseudo_dirs[0]
+        expected = [name for name in self.obj_names
+                    if name.startswith(prefix)]
+        names = self._walk_listing(recorder, prefix=prefix, delimiter='/')
+
+        self.assertEqual(
+            expected,
+            names,
+            msg="delimiter walk of {0} returned {1} names, expected "
+                "{2}".format(prefix, len(names), len(expected)))
+        self._check_latency(recorder)
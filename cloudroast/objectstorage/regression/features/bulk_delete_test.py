@@ -33,6 +33,19 @@ class BulkDeleteTest(ObjectStorageFixture):
         super(BulkDeleteTest, cls).setUpClass()
         cls.default_obj_name = Constants.VALID_OBJECT_NAME
 
+    def _create_objects(self, container_name, object_names):
+        """
+        Creates empty objects with a single extract-archive upload when
+        bulk_upload is enabled, and with one PUT each otherwise.
+        """
+        if self.is_feature_enabled('bulk_upload'):
+            self.seed_objects(
+                container_name, [(name, 0) for name in object_names])
+        else:
+            for name in object_names:
+                self.behaviors.create_object(
+                    container_name=container_name, object_name=name, data='')
+
     def test_bulk_deletion_of_multiple_objects(self):
         """
         Scenario:
@@ -59,9 +72,7 @@ class BulkDeleteTest(ObjectStorageFixture):
 
         objects_to_create = objects_to_remain + objects_to_delete
 
-        for name in objects_to_create:
-            self.behaviors.create_object(
-                container_name=container_name, object_name=name, data='')
+        self._create_objects(container_name, objects_to_create)
 
         targets = ['/{0}/{1}'.format(
             container_name, name) for name in objects_to_delete]
@@ -108,9 +119,7 @@ class BulkDeleteTest(ObjectStorageFixture):
 
         objects_list = ['{0}{1}'.format(base_name, x) for x in range(1, 10)]
 
-        for name in objects_list:
-            self.behaviors.create_object(
-                container_name=container_name, object_name=name, data='')
+        self._create_objects(container_name, objects_list)
 
         targets = ['/{0}/{1}'.format(
             container_name, name) for name in objects_list]
@@ -165,9 +174,7 @@ class BulkDeleteTest(ObjectStorageFixture):
         objects_list = ['{0}{1}'.format(base_name, x + 1) for x in xrange(
             0, self.objectstorage_api_config.bulk_delete_max_count)]
 
-        for name in objects_list:
-            self.behaviors.create_object(
-                container_name=container_name, object_name=name, data='')
+        self._create_objects(container_name, objects_list)
 
         targets = ['/{0}/{1}'.format(
             container_name, name) for name in objects_list]
@@ -213,9 +220,7 @@ class BulkDeleteTest(ObjectStorageFixture):
         objects_list = ['{0}{1}'.format(base_name, x + 1) for x in xrange(
             0, self.objectstorage_api_config.bulk_delete_max_count + 1)]
 
-        for name in objects_list:
-            self.behaviors.create_object(
-                container_name=container_name, object_name=name, data='')
+        self._create_objects(container_name, objects_list)
 
         targets = ['/{0}/{1}'.format(
             container_name, name) for name in objects_list]
@@ -14,7 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 from calendar import timegm
-from time import gmtime, sleep
+from time import gmtime
 
 from cafe.drivers.unittest.decorators import (
     DataDrivenFixture, data_driven_test)
@@ -54,9 +54,7 @@ class ExpiringObjectTest(ObjectStorageFixture):
         self.assertNotEqual(content_length, 0)
 
         # Wait for object to expire using interval from config
-        sleep(self.objectstorage_api_config.object_deletion_wait_interval)
-
-        response = self.client.get_object(container_name, object_name)
+        response = self.wait_for_object_deletion(container_name, object_name)
 
         self.assertEqual(response.status_code, 404)
 
@@ -75,9 +73,8 @@ class ExpiringObjectTest(ObjectStorageFixture):
         self.assertNotEqual(content_length, 0)
 
         # wait for the object to expire - delete after 60 seconds + 10 seconds
-        sleep(70)
-
-        response = self.client.get_object(container_name, object_name)
+        response = self.wait_for_object_deletion(
+            container_name, object_name, timeout=70)
 
         self.assertEqual(response.status_code, 404)
 
@@ -119,10 +116,9 @@ class ExpiringObjectTest(ObjectStorageFixture):
                 expected=expected,
                 received=str(received)))
 
-        # Sleep for period set as X-Delete-After(object expiration)
-        sleep(delete_after)
-
-        object_response = self.client.get_object(container_name, object_name)
+        # Wait for period set as X-Delete-After(object expiration)
+        object_response = self.wait_for_object_deletion(
+            container_name, object_name, timeout=delete_after)
 
         method = 'GET on expired object in Unicode Container'
         expected = 404
@@ -176,9 +172,8 @@ class ExpiringObjectTest(ObjectStorageFixture):
                 received=str(received)))
 
         # Wait for object to expire using interval from config
-        sleep(self.objectstorage_api_config.object_deletion_wait_interval)
-
-        object_response = self.client.get_object(container_name, object_name)
+        object_response = self.wait_for_object_deletion(
+            container_name, object_name)
 
         method = 'GET on expired object in Unicode Container'
         expected = 404
@@ -233,9 +228,8 @@ class ExpiringObjectTest(ObjectStorageFixture):
             'Object should exist before X-Delete-At.')
 
         # wait for the object to be deleted.
-        sleep(self.objectstorage_api_config.object_deletion_wait_interval)
-
-        resp = self.client.get_object(container_name, self.default_obj_name)
+        resp = self.wait_for_object_deletion(
+            container_name, self.default_obj_name)
 
         self.assertEqual(
             404, resp.status_code,
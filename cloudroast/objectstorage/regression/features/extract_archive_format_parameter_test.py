@@ -13,7 +13,6 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-import os
 import json
 
 from cafe.drivers.unittest.datasets import DatasetList
@@ -73,29 +72,24 @@ class ExtractArchiveFormatParameterTest(ObjectStorageFixture):
         cls.obj_names = \
             cls.obj_names_with_slashes + cls.obj_names_without_slashes
 
-        tar_archive = cls.client.create_archive(cls.obj_names, None)
-        cls.archive_paths["tar"] = tar_archive
+        cls.archive_paths["tar"] = cls.archive_seeder.get_archive_path(
+            cls.obj_names, "tar")
 
-        gz_archive = cls.client.create_archive(cls.obj_names, "gz")
-        cls.archive_paths["tar.gz"] = gz_archive
+        cls.archive_paths["tar.gz"] = cls.archive_seeder.get_archive_path(
+            cls.obj_names, "tar.gz")
 
-        bz2_archive = cls.client.create_archive(cls.obj_names, "bz2")
-        cls.archive_paths["tar.bz2"] = bz2_archive
+        cls.archive_paths["tar.bz2"] = cls.archive_seeder.get_archive_path(
+            cls.obj_names, "tar.bz2")
 
-    @classmethod
-    def tearDownClass(cls):
-        super(ExtractArchiveFormatParameterTest, cls).setUpClass()
-        for key in cls.archive_paths.keys():
-            os.remove(cls.archive_paths[key])
-
-    def read_archive_data(self, archive_path):
-        archive_data = None
-
-        archive_file = open(archive_path, 'r')
-        archive_data = archive_file.read()
-        archive_file.close()
+    def open_archive(self, archive_path):
+        """
+        Opens an archive to be uploaded from the file handle, so the
+        archive is streamed rather than read into memory.
+        """
+        archive_file = open(archive_path, 'rb')
+        self.addCleanup(archive_file.close)
 
-        return archive_data
+        return archive_file
 
     def get_members(self, keys, response_content):
         members = []
@@ -143,7 +137,7 @@ class ExtractArchiveFormatParameterTest(ObjectStorageFixture):
         url = "{0}/{1}".format(
             self.storage_url,
             container_name)
-        data = self.read_archive_data(self.archive_paths[archive_format])
+        data = self.open_archive(self.archive_paths[archive_format])
         params = {'extract-archive': wrong_format}
         headers = {'Accept': 'application/json'}
         response = self.client.put(
@@ -72,29 +72,24 @@ class ExtractArchiveTest(ObjectStorageFixture):
         cls.obj_names = \
             cls.obj_names_with_slashes + cls.obj_names_without_slashes
 
-        tar_archive = cls.client.create_archive(cls.obj_names, None)
-        cls.archive_paths["tar"] = tar_archive
+        cls.archive_paths["tar"] = cls.archive_seeder.get_archive_path(
+            cls.obj_names, "tar")
 
-        gz_archive = cls.client.create_archive(cls.obj_names, "gz")
-        cls.archive_paths["tar.gz"] = gz_archive
+        cls.archive_paths["tar.gz"] = cls.archive_seeder.get_archive_path(
+            cls.obj_names, "tar.gz")
 
-        bz2_archive = cls.client.create_archive(cls.obj_names, "bz2")
-        cls.archive_paths["tar.bz2"] = bz2_archive
+        cls.archive_paths["tar.bz2"] = cls.archive_seeder.get_archive_path(
+            cls.obj_names, "tar.bz2")
 
-    @classmethod
-    def tearDownClass(cls):
-        super(ExtractArchiveTest, cls).setUpClass()
-        for key in cls.archive_paths.keys():
-            os.remove(cls.archive_paths[key])
-
-    def read_archive_data(self, archive_path):
-        archive_data = None
-
-        archive_file = open(archive_path, 'r')
-        archive_data = archive_file.read()
-        archive_file.close()
+    def open_archive(self, archive_path):
+        """
+        Opens an archive to be uploaded from the file handle, so the
+        archive is streamed rather than read into memory.
+        """
+        archive_file = open(archive_path, 'rb')
+        self.addCleanup(archive_file.close)
 
-        return archive_data
+        return archive_file
 
     @data_driven_test(DatasetList(archive_formats))
     @ObjectStorageFixture.required_features('bulk_upload')
@@ -115,7 +110,7 @@ class ExtractArchiveTest(ObjectStorageFixture):
         container_name = self.create_temp_container(
             descriptor=BASE_NAME)
 
-        data = self.read_archive_data(self.archive_paths[archive_format])
+        data = self.open_archive(self.archive_paths[archive_format])
 
         headers = {'Accept': 'application/json'}
 
@@ -219,7 +214,7 @@ class ExtractArchiveTest(ObjectStorageFixture):
             self.behaviors.force_delete_containers,
             list(expected_listings.iterkeys()))
 
-        data = self.read_archive_data(self.archive_paths[archive_format])
+        data = self.open_archive(self.archive_paths[archive_format])
 
         headers = {'Accept': 'application/json'}
 
@@ -337,9 +332,10 @@ class ExtractArchiveTest(ObjectStorageFixture):
         container_name = self.create_temp_container(
             descriptor=BASE_NAME)
 
-        object_data = self.read_archive_data(
+        object_data = self.open_archive(
             self.archive_paths[archive_format])
-        headers = {'Content-Length': str(len(object_data))}
+        headers = {'Content-Length': str(
+            os.path.getsize(self.archive_paths[archive_format]))}
         obj_name = "{0}_{1}".format(BASE_NAME, self.default_obj_name)
         response = self.client.create_object(
             container_name,
@@ -13,7 +13,6 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-import os
 
 from cafe.engine.config import EngineConfig
 from cloudcafe.common.tools import randomstring as randstring
@@ -70,20 +69,14 @@ class ExtractCorruptArchiveTest(ObjectStorageFixture):
         cls.obj_names = \
             cls.obj_names_with_slashes + cls.obj_names_without_slashes
 
-        tar_archive = cls.client.create_archive(cls.obj_names, None)
-        cls.archive_paths["tar"] = tar_archive
+        cls.archive_paths["tar"] = cls.archive_seeder.get_archive_path(
+            cls.obj_names, "tar")
 
-        gz_archive = cls.client.create_archive(cls.obj_names, "gz")
-        cls.archive_paths["tar.gz"] = gz_archive
+        cls.archive_paths["tar.gz"] = cls.archive_seeder.get_archive_path(
+            cls.obj_names, "tar.gz")
 
-        bz2_archive = cls.client.create_archive(cls.obj_names, "bz2")
-        cls.archive_paths["tar.bz2"] = bz2_archive
-
-    @classmethod
-    def tearDownClass(cls):
-        super(ExtractCorruptArchiveTest, cls).setUpClass()
-        for key in cls.archive_paths.keys():
-            os.remove(cls.archive_paths[key])
+        cls.archive_paths["tar.bz2"] = cls.archive_seeder.get_archive_path(
+            cls.obj_names, "tar.bz2")
 
     def read_archive_data(self, archive_path):
         archive_data = None
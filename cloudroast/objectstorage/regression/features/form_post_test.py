@@ -203,10 +203,8 @@ class FormPostTest(ObjectStorageFixture):
                              files[0].get("name"), delete_at))
 
         # wait for the object to be deleted.
-        sleep(self.objectstorage_api_config.object_deletion_wait_interval)
-
-        delete_response = self.client.get_object(container_name,
-                                                 files[0].get("name"))
+        delete_response = self.wait_for_object_deletion(
+            container_name, files[0].get("name"))
 
         self.assertEqual(404,
                          delete_response.status_code,
@@ -268,10 +266,8 @@ class FormPostTest(ObjectStorageFixture):
                                                delete_after))
 
         # wait for the object to be deleted.
-        sleep(self.objectstorage_api_config.object_deletion_wait_interval)
-
-        delete_response = self.client.get_object(container_name,
-                                                 files[0].get("name"))
+        delete_response = self.wait_for_object_deletion(
+            container_name, files[0].get("name"))
 
         self.assertEqual(404,
                          delete_response.status_code,
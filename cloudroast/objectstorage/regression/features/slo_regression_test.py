@@ -20,9 +20,11 @@ from hashlib import md5
 from cafe.common.unicode import UNICODE_BLOCKS, BLOCK_NAMES
 from cloudcafe.objectstorage.objectstorage_api.common.constants import \
     Constants
+from cloudroast.common.concurrency import map_concurrently
 from cloudroast.objectstorage.fixtures import ObjectStorageFixture
 
 CONTAINER_DESCRIPTOR = 'static_large_object_regression_test'
+SEGMENT_UPLOAD_WORKERS = 4
 
 
 class StaticLargeObjectRegressionTest(ObjectStorageFixture):
@@ -61,6 +63,7 @@ class StaticLargeObjectRegressionTest(ObjectStorageFixture):
         object_size = 0
 
         slo_manifest = []
+        segments = []
         for x in range(0, self.num_segments):
             segment_container_name = self.create_temp_container(
                 '{0}_{1}'.format('slo_segment', x))
@@ -70,15 +73,8 @@ class StaticLargeObjectRegressionTest(ObjectStorageFixture):
             segment_etag = md5(segment_data).hexdigest()
             object_etag += segment_etag
             object_size += len(segment_data)
-
-            segment_response = self.client.create_object(
-                segment_container_name,
-                segment_name,
-                data=segment_data)
-            self.assertTrue(segment_response.ok,
-                            msg="Creating segment for SLO; Expected "
-                            "to receive a status code of 201 received a code "
-                            "of {0}".format(segment_response.status_code))
+            segments.append(
+                (segment_container_name, segment_name, segment_data))
 
             slo_manifest.append({
                 'path': '/{0}/{1}'.format(
@@ -86,6 +82,18 @@ class StaticLargeObjectRegressionTest(ObjectStorageFixture):
                 'etag': segment_etag,
                 'size_bytes': self.min_segment_size})
 
+        uploads = map_concurrently(
+            lambda segment: self.client.create_object(
+                segment[0], segment[1], data=segment[2]),
+            segments, SEGMENT_UPLOAD_WORKERS)
+        for upload in uploads:
+            if not upload.ok:
+                raise upload.error
+            self.assertTrue(upload.result.ok,
+                            msg="Creating segment for SLO; Expected "
+                            "to receive a status code of 201 received a code "
+                            "of {0}".format(upload.result.status_code))
+
         manifest_response = self.behaviors.create_static_large_object(
             container_name, object_name, manifest=slo_manifest)
         self.assertTrue(manifest_response.ok,
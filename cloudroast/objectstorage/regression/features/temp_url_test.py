@@ -44,13 +44,6 @@ sha_type.append_new_dataset(
 
 @DataDrivenFixture
 class TempUrlTest(ObjectStorageFixture):
-    def _reset_default_key(self):
-        response = None
-        headers = {'X-Account-Meta-Temp-URL-Key': self.tempurl_key}
-        response = self.client.set_temp_url_key(headers=headers)
-        time.sleep(self.objectstorage_api_config.tempurl_key_cache_time)
-        return response
-
     @classmethod
     def setUpClass(cls):
         super(TempUrlTest, cls).setUpClass()
@@ -68,16 +61,12 @@ class TempUrlTest(ObjectStorageFixture):
 
     def setUp(self):
         """
-        Check if the TempURL has been changed, if so, change it back to
-        the expected key and wait the appropriate amount of time to let the
-        key propagate through the system.
+        Make sure the expected TempURL key is set on the account. The key
+        is only set, and waited on to propagate through the system, if
+        neither account key holds it already.
         """
         super(TempUrlTest, self).setUp()
-
-        if self.tempurl_key != self.behaviors.get_tempurl_key():
-            response = self._reset_default_key()
-            if not response.ok:
-                raise Exception('Could not set TempURL key.')
+        self.tempurl_keys.set_key(self.tempurl_key)
 
     @data_driven_test(sha_type)
     @ObjectStorageFixture.required_features('tempurl')
@@ -326,11 +315,6 @@ class TempUrlTest(ObjectStorageFixture):
             headers=headers,
             data=self.object_data)
 
-        headers = {'X-Account-Meta-Temp-URL-Key': self.tempurl_key}
-        set_key_response = self.client.set_temp_url_key(headers=headers)
-
-        self.assertTrue(set_key_response.ok, msg="tempurl key was not set")
-
         if sha_type == 'sha2':
             tempurl_data = self.client.create_temp_url(
                 'GET',
@@ -414,11 +398,6 @@ class TempUrlTest(ObjectStorageFixture):
             headers=headers,
             data=self.object_data)
 
-        headers = {'X-Account-Meta-Temp-URL-Key': self.tempurl_key}
-        set_key_response = self.client.set_temp_url_key(headers=headers)
-
-        self.assertTrue(set_key_response.ok, msg="tempurl key was not set")
-
         if sha_type == 'sha2':
             tempurl_data = self.client.create_temp_url(
                 'GET',
@@ -509,11 +488,6 @@ class TempUrlTest(ObjectStorageFixture):
             headers=headers,
             data=self.object_data)
 
-        headers = {'X-Account-Meta-Temp-URL-Key': self.tempurl_key}
-        set_key_response = self.client.set_temp_url_key(headers=headers)
-
-        self.assertTrue(set_key_response.ok, msg="tempurl key was not set")
-
         if sha_type == 'sha2':
             tempurl_data = self.client.create_temp_url(
                 'GET',
@@ -609,11 +583,6 @@ class TempUrlTest(ObjectStorageFixture):
             headers=headers,
             data=self.object_data)
 
-        headers = {'X-Account-Meta-Temp-URL-Key': self.tempurl_key}
-        set_key_response = self.client.set_temp_url_key(headers=headers)
-
-        self.assertTrue(set_key_response.ok, msg="tempurl key was not set")
-
         if sha_type == 'sha2':
             tempurl_data = self.client.create_temp_url(
                 'GET',
@@ -995,15 +964,7 @@ class TempUrlTest(ObjectStorageFixture):
         foo_key = '{0}_foo'.format(Constants.BASE_TEMPURL_KEY)
         bar_key = '{0}_bar'.format(Constants.BASE_TEMPURL_KEY)
 
-        headers = {'X-Account-Meta-Temp-URL-Key': foo_key}
-        set_foo_key_response = self.client.set_temp_url_key(headers=headers)
-
-        self.assertTrue(set_foo_key_response.ok)
-
-        headers = {'X-Account-Meta-Temp-URL-Key-2': bar_key}
-        set_bar_key_response = self.client.set_temp_url_key(headers=headers)
-
-        self.assertTrue(set_bar_key_response.ok)
+        self.tempurl_keys.set_keys(foo_key, bar_key)
 
         if sha_type == 'sha2':
             foo_data = self.client.create_temp_url(
@@ -23,6 +23,7 @@ from cloudroast.objectstorage.generators import ObjectStorageGenerator
 CONTAINER_DESCRIPTOR = 'nested_slo_test_container'
 STATUS_CODE_MSG = ('{method} expected status code {expected}'
                    ' received status code {received}')
+SEGMENT_UPLOAD_WORKERS = 4
 
 
 class NestedSLOTest(ObjectStorageFixture):
@@ -32,7 +33,8 @@ class NestedSLOTest(ObjectStorageFixture):
 
         self.default_obj_name = Constants.VALID_OBJECT_NAME
         self.nested_obj_name = "nested_slo"
-        self.generator = ObjectStorageGenerator(self.client)
+        self.generator = ObjectStorageGenerator(
+            self.client, segment_upload_workers=SEGMENT_UPLOAD_WORKERS)
         self.nested_object_count = 5
         self.min_segment_size = \
             self.objectstorage_api_config.min_slo_segment_size
@@ -17,13 +17,10 @@ import unittest
 
 from cafe.drivers.unittest.decorators import (
     DataDrivenFixture, data_driven_test)
-from cloudcafe.objectstorage.objectstorage_api.common.constants import \
-    Constants
 from cloudroast.objectstorage.fixtures import ObjectStorageFixture
 from cloudroast.objectstorage.generators import ObjectDatasetList
 
 
-CONTAINER_NAME = 'object_range_request_test_container'
 CONTENT_MSG = 'expected {0} in the content body. received {1}'
 CONTENT_TYPE_MSG = 'expected content_type {0} received {1}'
 MULTIPART = "multipart/byteranges;boundary="
@@ -32,10 +29,6 @@ MULTIPART = "multipart/byteranges;boundary="
 @DataDrivenFixture
 class ObjectRangeRequestTest(ObjectStorageFixture):
 
-    def setUp(self):
-        super(ObjectRangeRequestTest, self).setUp()
-        self.object_name = Constants.VALID_OBJECT_NAME
-
     def get_boundary(self, content_type_header):
         """
         returns the boundary from the multipart content-type header:
@@ -81,8 +74,8 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
 
         return multipart_content
 
-    @data_driven_test(ObjectDatasetList())
-    def ddtest_basic_object_range_request(self, object_type, generate_object):
+    @data_driven_test(ObjectDatasetList(shared=True))
+    def ddtest_basic_object_range_request(self, object_type, get_object):
         """
         Scenario:
             Perform a get with various range request headers.
@@ -90,7 +83,6 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
         Expected Results:
             The data returned should be within the range specified.
         """
-        container_name = self.create_temp_container(descriptor=CONTAINER_NAME)
         # Check the object type, if it's a DLO/SLO we need to generate more
         # data due to minimum segment lengths.
         if object_type == "standard":
@@ -99,12 +91,14 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
             obj_data = ''.join(["grok_{0}/".format(x) for x in range(
                 1000000)])
 
-        generate_object(container_name, self.object_name, data=obj_data)
+        object_info = get_object(data=obj_data)
+        container_name = object_info.get('container_name')
+        object_name = object_info.get('object_name')
 
         headers = {'Range': 'bytes=-3'}
         response = self.client.get_object(
             container_name,
-            self.object_name,
+            object_name,
             headers=headers)
 
         if object_type == "standard":
@@ -119,7 +113,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
         headers = {'Range': 'bytes=0-3'}
         response = self.client.get_object(
             container_name,
-            self.object_name,
+            object_name,
             headers=headers)
 
         # In this case the content should be the same for all object types
@@ -129,7 +123,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
         headers = {'Range': 'bytes=4-4'}
         response = self.client.get_object(
             container_name,
-            self.object_name,
+            object_name,
             headers=headers)
 
         # In this case the content should be the same for all object types
@@ -142,7 +136,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
             headers = {'Range': 'bytes=9-'}
             response = self.client.get_object(
                 container_name,
-                self.object_name,
+                object_name,
                 headers=headers)
 
             self.assertEqual(response.content, "drok_two",
@@ -152,7 +146,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
             headers = {'Range': 'bytes=11888878-'}
             response = self.client.get_object(
                 container_name,
-                self.object_name,
+                object_name,
                 headers=headers)
 
             self.assertEqual(response.content, "grok_999999/",
@@ -160,8 +154,8 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
                                                     str(response.content)))
 
     @unittest.skip('JIRA Bug https://jira.rax.io/browse/STORDEV-189')
-    @data_driven_test(ObjectDatasetList())
-    def ddtest_multi_part_range_request(self, object_type, generate_object):
+    @data_driven_test(ObjectDatasetList(shared=True))
+    def ddtest_multi_part_range_request(self, object_type, get_object):
         """
         Scenario:
             Perform a get with various multi-part range request headers.
@@ -174,7 +168,6 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
             the body should be separated by this delimiter and the data
             in the body should be in order.
         """
-        container_name = self.create_temp_container(descriptor=CONTAINER_NAME)
         # Check the object type, if it's a DLO/SLO we need to generate more
         # data due to minimum segment lengths.
         if object_type == "standard":
@@ -183,12 +176,14 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
             obj_data = ''.join(["grok_{0}/".format(x) for x in range(
                 1000000)])
 
-        generate_object(container_name, self.object_name, data=obj_data)
+        object_info = get_object(data=obj_data)
+        container_name = object_info.get('container_name')
+        object_name = object_info.get('object_name')
 
         headers = {'Range': 'bytes=0-3,-3'}
         response = self.client.get_object(
             container_name,
-            self.object_name,
+            object_name,
             headers=headers)
 
         content_type = response.headers.get('content-type')
@@ -221,7 +216,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
         headers = {'Range': 'bytes=-3,0-3'}
         response = self.client.get_object(
             container_name,
-            self.object_name,
+            object_name,
             headers=headers)
 
         content_type = response.headers.get('content-type')
@@ -254,7 +249,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
         headers = {'Range': 'bytes=9-,0-3'}
         response = self.client.get_object(
             container_name,
-            self.object_name,
+            object_name,
             headers=headers)
 
         content_type = response.headers.get('content-type')
@@ -288,7 +283,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
 
         headers = {'Range': 'bytes=0-3,5-7,9-12'}
         response = self.client.get_object(container_name,
-                                          self.object_name,
+                                          object_name,
                                           headers=headers)
 
         content_type = response.headers.get('content-type')
@@ -328,9 +323,9 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
                              msg=CONTENT_MSG.format("drok",
                                                     str(response.content)))
 
-    @data_driven_test(ObjectDatasetList())
+    @data_driven_test(ObjectDatasetList(shared=True))
     def ddtest_range_request_with_bad_ranges(
-            self, object_type, generate_object):
+            self, object_type, get_object):
         """
         Scenario:
             Perform a get with various range request headers not specified
@@ -339,19 +334,20 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
         Expected Results:
             The request should return data without breaking.
         """
-        container_name = self.create_temp_container(descriptor=CONTAINER_NAME)
         if object_type == "standard":
             obj_data = "grok_one drok_two"
         else:
             obj_data = ''.join(["grok_{0}/".format(x) for x in range(
                 1000000)])
 
-        generate_object(container_name, self.object_name, data=obj_data)
+        object_info = get_object(data=obj_data)
+        container_name = object_info.get('container_name')
+        object_name = object_info.get('object_name')
 
         headers = {'Range': 'bytes=foobar'}
         response = self.client.get_object(
             container_name,
-            self.object_name,
+            object_name,
             headers=headers)
 
         self.assertEqual(
@@ -364,7 +360,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
         headers = {'Range': 'bytes=4'}
         response = self.client.get_object(
             container_name,
-            self.object_name,
+            object_name,
             headers=headers)
 
         self.assertEqual(
@@ -377,7 +373,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
         headers = {'Range': 'bytes=7-1'}
         response = self.client.get_object(
             container_name,
-            self.object_name,
+            object_name,
             headers=headers)
 
         self.assertEqual(
@@ -391,7 +387,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
             headers = {'Range': 'bytes=-160-5'}
             response = self.client.get_object(
                 container_name,
-                self.object_name,
+                object_name,
                 headers=headers)
 
             self.assertEqual(
@@ -404,7 +400,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
             headers = {'Range': 'bytes=-12888890-11888860'}
             response = self.client.get_object(
                 container_name,
-                self.object_name,
+                object_name,
                 headers=headers)
 
             self.assertEqual(
@@ -418,7 +414,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
             headers = {'Range': 'bytes=5-160'}
             response = self.client.get_object(
                 container_name,
-                self.object_name,
+                object_name,
                 headers=headers)
 
             self.assertEqual(
@@ -431,7 +427,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
             headers = {'Range': 'bytes=11888866-12888890'}
             response = self.client.get_object(
                 container_name,
-                self.object_name,
+                object_name,
                 headers=headers)
 
             self.assertEqual(
@@ -445,7 +441,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
             headers = {'Range': 'bytes=-160-160'}
             response = self.client.get_object(
                 container_name,
-                self.object_name,
+                object_name,
                 headers=headers)
 
             self.assertEqual(
@@ -458,7 +454,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
             headers = {'Range': 'bytes=-12888890-12888890'}
             response = self.client.get_object(
                 container_name,
-                self.object_name,
+                object_name,
                 headers=headers)
 
             self.assertEqual(
@@ -0,0 +1,144 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+
+from cloudcafe.common.tools.check_dict import get_value
+from cloudcafe.objectstorage.objectstorage_api.common.constants import \
+    Constants
+from cloudroast.objectstorage.fixtures import ObjectStorageFixture
+from cloudroast.objectstorage.generators import ObjectStorageGenerator
+
+CONTAINER_DESCRIPTOR = 'streaming_object_test_container'
+STATUS_CODE_MSG = ('{method} expected status code {expected}'
+                   ' received status code {received}')
+MB = 1024 * 1024
+STREAMING_SEGMENT_SIZE = 100 * MB
+
+
+@unittest.skipUnless(get_value('streaming-object-size'),
+                     'set streaming-object-size to the object size in MB')
+class StreamingObjectTest(ObjectStorageFixture):
+    """
+    Uploads objects of streaming-object-size MB, which can be several GB,
+    while only holding a chunk of their data in memory, and checks that
+    swift computed the same etag and size as the generator did while
+    producing the data.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super(StreamingObjectTest, cls).setUpClass()
+        cls.object_size = int(get_value('streaming-object-size')) * MB
+        cls.segment_size = max(
+            cls.objectstorage_api_config.min_slo_segment_size,
+            STREAMING_SEGMENT_SIZE)
+        cls.generator = ObjectStorageGenerator(cls.client)
+
+    def setUp(self):
+        super(StreamingObjectTest, self).setUp()
+        self.object_name = Constants.VALID_OBJECT_NAME
+        self.container_name = self.create_temp_container(
+            descriptor=CONTAINER_DESCRIPTOR)
+
+    def _check_object(self, object_info, expected_etag):
+        """
+        Checks the create responses of the object and of its segments,
+        then the etag and size swift reports for the object.
+        """
+        method = 'Streaming object creation'
+        for segment in object_info['extra'].get('segments', []):
+            received = segment['response'].status_code
+            self.assertEqual(
+                201,
+                received,
+                msg=STATUS_CODE_MSG.format(
+                    method='{0} of segment {1}'.format(
+                        method, segment['name']),
+                    expected=201,
+                    received=str(received)))
+
+        received = object_info['response'].status_code
+        self.assertEqual(
+            201,
+            received,
+            msg=STATUS_CODE_MSG.format(
+                method=method,
+                expected=201,
+                received=str(received)))
+
+        response = self.client.get_object_metadata(
+            self.container_name, self.object_name)
+
+        received = response.headers.get('etag')
+        self.assertEqual(
+            expected_etag,
+            received,
+            msg='object created with Etag header'
+                ' value expected: {0} received: {1}'.format(
+                    expected_etag, received))
+
+        received = int(response.headers.get('content-length'))
+        self.assertEqual(
+            self.object_size,
+            received,
+            msg='object size expected: {0} received: {1}'.format(
+                self.object_size, received))
+
+    def test_streaming_standard_object(self):
+        """
+        Scenario:
+            Upload a standard object with chunked transfer encoding.
+
+        Expected Results:
+            The object etag should be the md5 of the generated data.
+        """
+        object_info = self.generator.generate_streaming_object(
+            self.container_name, self.object_name, self.object_size)
+
+        self.assertEqual(object_info['md5'], object_info['etag'])
+        self._check_object(object_info, object_info['md5'])
+
+    @ObjectStorageFixture.required_features('dlo')
+    def test_streaming_dynamic_large_object(self):
+        """
+        Scenario:
+            Upload the segments of a dynamic large object with chunked
+            transfer encoding, then its manifest.
+
+        Expected Results:
+            The object etag should be the md5 of the segment etags.
+        """
+        object_info = self.generator.generate_streaming_dynamic_large_object(
+            self.container_name, self.object_name, self.object_size,
+            segment_size=self.segment_size)
+
+        self._check_object(object_info, '"{0}"'.format(object_info['etag']))
+
+    @ObjectStorageFixture.required_features('slo')
+    def test_streaming_static_large_object(self):
+        """
+        Scenario:
+            Upload the segments of a static large object with chunked
+            transfer encoding, then its manifest.
+
+        Expected Results:
+            The object etag should be the md5 of the segment etags.
+        """
+        object_info = self.generator.generate_streaming_static_large_object(
+            self.container_name, self.object_name, self.object_size,
+            segment_size=self.segment_size)
+
+        self._check_object(object_info, '"{0}"'.format(object_info['etag']))
@@ -0,0 +1,152 @@
+"""
+Copyright 2018 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import tarfile
+from cStringIO import StringIO
+from hashlib import sha1
+
+from cafe.engine.config import EngineConfig
+from cloudcafe.common.tools.md5hash import get_md5_hash
+
+ARCHIVE_MODES = {'tar': 'w', 'tar.gz': 'w:gz', 'tar.bz2': 'w:bz2'}
+
+
+class ArchiveSeeder(object):
+    """
+    Seeds containers with many objects in a single extract-archive request.
+
+    Archives are built in memory from a manifest of object names, or of
+    (name, size) pairs, and cached on disk by the hash of the manifest so
+    later classes and runs reuse them. The content of an object defaults to
+    the md5 hash of its name, which is what the extract archive tests
+    expect; objects with a size are filled with that hash repeated.
+    """
+
+    def __init__(self, client, cache_directory=None):
+        """
+        @param client: object storage client to upload archives with
+        @type client: ObjectStorageAPIClient
+        @param cache_directory: directory to cache built archives in,
+                                defaults to archive_cache in the engine
+                                temp directory
+        @type cache_directory: string
+        """
+        self.client = client
+        self._cache_directory = cache_directory
+
+    @property
+    def cache_directory(self):
+        if self._cache_directory is None:
+            self._cache_directory = os.path.join(
+                EngineConfig().temp_directory, 'archive_cache')
+        if not os.path.isdir(self._cache_directory):
+            try:
+                os.makedirs(self._cache_directory)
+            except OSError:
+                # Another runner process created it first
+                pass
+        return self._cache_directory
+
+    @staticmethod
+    def _normalize(manifest):
+        return [(entry, None) if isinstance(entry, basestring) else
+                (entry[0], entry[1]) for entry in manifest]
+
+    @staticmethod
+    def get_object_data(name, size=None):
+        """
+        Returns the content an object in a seeded archive has.
+
+        @rtype: string
+        """
+        data = get_md5_hash(name)
+        if size is None:
+            return data
+        return (data * (size / len(data) + 1))[:size]
+
+    def build_archive(self, manifest, archive_format='tar'):
+        """
+        Builds an archive of the objects in the manifest in memory.
+
+        @param manifest: object names, or (name, size) pairs
+        @type manifest: list
+        @param archive_format: 'tar', 'tar.gz' or 'tar.bz2'
+        @type archive_format: string
+
+        @return: the archive
+        @rtype: string
+        """
+        archive_data = StringIO()
+        archive = tarfile.open(
+            fileobj=archive_data, mode=ARCHIVE_MODES[archive_format])
+        for name, size in self._normalize(manifest):
+            data = self.get_object_data(name, size)
+            member = tarfile.TarInfo(name)
+            member.size = len(data)
+            archive.addfile(member, StringIO(data))
+        archive.close()
+        return archive_data.getvalue()
+
+    def get_archive_path(self, manifest, archive_format='tar'):
+        """
+        Returns the path of the cached archive for the manifest, building
+        it if it is not cached yet. The file must not be modified.
+
+        @rtype: string
+        """
+        manifest_hash = sha1(repr(self._normalize(manifest))).hexdigest()
+        path = os.path.join(self.cache_directory, '{0}.{1}'.format(
+            manifest_hash, archive_format))
+        if not os.path.exists(path):
+            temp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+            with open(temp_path, 'wb') as archive_file:
+                archive_file.write(self.build_archive(
+                    manifest, archive_format))
+            os.rename(temp_path, path)
+        return path
+
+    def seed(self, container_name, manifest, archive_format='tar',
+             headers=None):
+        """
+        Creates the objects in the manifest in the container with one
+        extract-archive upload.
+
+        @param container_name: container to create the objects in, which
+                               is created if it does not exist
+        @type container_name: string
+        @param manifest: object names, or (name, size) pairs
+        @type manifest: list
+
+        @return: the extract-archive response
+        """
+        all_headers = {'Accept': 'application/json'}
+        all_headers.update(headers or {})
+
+        with open(self.get_archive_path(
+                manifest, archive_format), 'rb') as archive_file:
+            response = self.client.create_archive_object(
+                archive_file,
+                archive_format,
+                upload_path=container_name,
+                headers=all_headers)
+
+        expected = len(manifest)
+        if not response.ok or int(
+                response.entity.num_files_created) != expected:
+            raise Exception(
+                'Seeding {0} objects into {1} failed: {2}'.format(
+                    expected, container_name, response.content))
+        return response
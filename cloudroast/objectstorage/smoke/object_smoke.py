@@ -44,13 +44,12 @@ class ObjectSmokeTest(ObjectStorageFixture):
         for i in range(10):
             yield "Test chunk %s\r\n" % i
 
-    @data_driven_test(ObjectDatasetList())
+    @data_driven_test(ObjectDatasetList(shared=True))
     def ddtest_object_retrieval_with_valid_object_name(
-            self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
-        object_name = self.default_obj_name
-        generate_object(container_name, object_name)
+            self, object_type, get_object):
+        object_info = get_object(object_name=self.default_obj_name)
+        container_name = object_info.get('container_name')
+        object_name = object_info.get('object_name')
 
         response = self.client.get_object(container_name, object_name)
 
@@ -66,23 +65,22 @@ class ObjectSmokeTest(ObjectStorageFixture):
                 expected=expected,
                 received=str(received)))
 
-    @data_driven_test(ObjectDatasetList(exclude=['dlo', 'slo']))
+    @data_driven_test(ObjectDatasetList(exclude=['dlo', 'slo'], shared=True))
     def ddtest_object_retrieval_with_if_match(
-            self, object_type, generate_object):
+            self, object_type, get_object):
         """
         Bug filed for dlo/slo support of If-match Header:
         https://bugs.launchpad.net/swift/+bug/1279076
         """
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
-        object_name = self.default_obj_name
-        obj_info = generate_object(container_name, object_name)
+        obj_info = get_object(object_name=self.default_obj_name)
+        container_name = obj_info.get('container_name')
+        object_name = obj_info.get('object_name')
 
         headers = {'If-Match': obj_info.get('etag')}
 
         response = self.client.get_object(
             container_name,
-            self.default_obj_name,
+            object_name,
             headers=headers)
 
         method = 'object retrieval with if match header'
@@ -97,23 +95,22 @@ class ObjectSmokeTest(ObjectStorageFixture):
                 expected=expected,
                 received=str(received)))
 
-    @data_driven_test(ObjectDatasetList(exclude=['dlo', 'slo']))
+    @data_driven_test(ObjectDatasetList(exclude=['dlo', 'slo'], shared=True))
     def ddtest_object_retrieval_with_if_none_match(
-            self, object_type, generate_object):
+            self, object_type, get_object):
         """
         Bug filed for dlo/slo support of If-match Header:
         https://bugs.launchpad.net/swift/+bug/1279076
         """
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
-        object_name = self.default_obj_name
-        object_info = generate_object(container_name, object_name)
+        object_info = get_object(object_name=self.default_obj_name)
+        container_name = object_info.get('container_name')
+        object_name = object_info.get('object_name')
 
         headers = {'If-None-Match': 'grok'}
 
         response = self.client.get_object(
             container_name,
-            self.default_obj_name,
+            object_name,
             headers=headers)
 
         method = 'object retrieval with if none match header'
@@ -132,7 +129,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
 
         response = self.client.get_object(
             container_name,
-            self.default_obj_name,
+            object_name,
             headers=headers)
 
         method = 'object should be flagged as not modified'
@@ -147,19 +144,18 @@ class ObjectSmokeTest(ObjectStorageFixture):
                 expected=expected,
                 received=str(received)))
 
-    @data_driven_test(ObjectDatasetList())
+    @data_driven_test(ObjectDatasetList(shared=True))
     def ddtest_object_retrieval_with_if_modified_since(
-            self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
-        object_name = self.default_obj_name
-        generate_object(container_name, object_name)
+            self, object_type, get_object):
+        object_info = get_object(object_name=self.default_obj_name)
+        container_name = object_info.get('container_name')
+        object_name = object_info.get('object_name')
 
         headers = {'If-Modified-Since': 'Fri, 17 Aug 2001 18:44:42 GMT'}
 
         response = self.client.get_object(
             container_name,
-            self.default_obj_name,
+            object_name,
             headers=headers)
 
         method = 'object retrieval with if modified since header (past date)'
@@ -174,19 +170,18 @@ class ObjectSmokeTest(ObjectStorageFixture):
                 expected=expected,
                 received=str(received)))
 
-    @data_driven_test(ObjectDatasetList())
+    @data_driven_test(ObjectDatasetList(shared=True))
     def ddtest_object_not_modified_with_if_modified_since(
-            self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
-        object_name = self.default_obj_name
-        generate_object(container_name, object_name)
+            self, object_type, get_object):
+        object_info = get_object(object_name=self.default_obj_name)
+        container_name = object_info.get('container_name')
+        object_name = object_info.get('object_name')
 
         headers = {'If-Modified-Since': 'Fri, 17 Aug 2101 18:44:42 GMT'}
 
         response = self.client.get_object(
             container_name,
-            self.default_obj_name,
+            object_name,
             headers=headers)
 
         method = 'object retrieval with if modified since header (future date)'
@@ -201,19 +196,18 @@ class ObjectSmokeTest(ObjectStorageFixture):
                 expected=expected,
                 received=str(received)))
 
-    @data_driven_test(ObjectDatasetList())
+    @data_driven_test(ObjectDatasetList(shared=True))
     def ddtest_object_retrieval_with_if_unmodified_since(
-            self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
-        object_name = self.default_obj_name
-        generate_object(container_name, object_name)
+            self, object_type, get_object):
+        object_info = get_object(object_name=self.default_obj_name)
+        container_name = object_info.get('container_name')
+        object_name = object_info.get('object_name')
 
         headers = {'If-Unmodified-Since': 'Fri, 17 Aug 2101 18:44:42 GMT'}
 
         response = self.client.get_object(
             container_name,
-            self.default_obj_name,
+            object_name,
             headers=headers)
 
         method = 'object retrieval with if unmodified since header'
@@ -228,19 +222,18 @@ class ObjectSmokeTest(ObjectStorageFixture):
                 expected=expected,
                 received=str(received)))
 
-    @data_driven_test(ObjectDatasetList())
+    @data_driven_test(ObjectDatasetList(shared=True))
     def ddtest_object_retrieval_fails_with_if_unmodified_since(
-            self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
-        object_name = self.default_obj_name
-        generate_object(container_name, object_name)
+            self, object_type, get_object):
+        object_info = get_object(object_name=self.default_obj_name)
+        container_name = object_info.get('container_name')
+        object_name = object_info.get('object_name')
 
         headers = {'If-Unmodified-Since': 'Fri, 17 Aug 2001 18:44:42 GMT'}
 
         response = self.client.get_object(
             container_name,
-            self.default_obj_name,
+            object_name,
             headers=headers)
 
         method = ('object retrieval precondition fail with if unmodified'
@@ -256,19 +249,18 @@ class ObjectSmokeTest(ObjectStorageFixture):
                 expected=expected,
                 received=str(received)))
 
-    @data_driven_test(ObjectDatasetList())
+    @data_driven_test(ObjectDatasetList(shared=True))
     def ddtest_partial_object_retrieval_with_start_range(
-            self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
-        object_name = self.default_obj_name
-        generate_object(container_name, object_name)
+            self, object_type, get_object):
+        object_info = get_object(object_name=self.default_obj_name)
+        container_name = object_info.get('container_name')
+        object_name = object_info.get('object_name')
 
         headers = {'Range': 'bytes=5-'}
 
         response = self.client.get_object(
             container_name,
-            self.default_obj_name,
+            object_name,
             headers=headers)
 
         method = 'partial object retrieval with start range'
@@ -281,19 +273,18 @@ class ObjectSmokeTest(ObjectStorageFixture):
             msg=STATUS_CODE_MSG.format(
                 method=method, expected=expected, received=str(received)))
 
-    @data_driven_test(ObjectDatasetList())
+    @data_driven_test(ObjectDatasetList(shared=True))
     def ddtest_partial_object_retrieval_with_end_range(
-            self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
-        object_name = self.default_obj_name
-        generate_object(container_name, object_name)
+            self, object_type, get_object):
+        object_info = get_object(object_name=self.default_obj_name)
+        container_name = object_info.get('container_name')
+        object_name = object_info.get('object_name')
 
         headers = {'Range': 'bytes=-4'}
 
         response = self.client.get_object(
             container_name,
-            self.default_obj_name,
+            object_name,
             headers=headers)
 
         method = 'partial object retrieval with end range'
@@ -308,19 +299,18 @@ class ObjectSmokeTest(ObjectStorageFixture):
                 expected=expected,
                 received=str(received)))
 
-    @data_driven_test(ObjectDatasetList())
+    @data_driven_test(ObjectDatasetList(shared=True))
     def ddtest_partial_object_retrieval_with_range(
-            self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
-        object_name = self.default_obj_name
-        generate_object(container_name, object_name)
+            self, object_type, get_object):
+        object_info = get_object(object_name=self.default_obj_name)
+        container_name = object_info.get('container_name')
+        object_name = object_info.get('object_name')
 
         headers = {'Range': 'bytes=5-8'}
 
         response = self.client.get_object(
             container_name,
-            self.default_obj_name,
+            object_name,
             headers=headers)
 
         method = 'partial object retrieval with start and end range'
@@ -335,19 +325,18 @@ class ObjectSmokeTest(ObjectStorageFixture):
                 expected=expected,
                 received=str(received)))
 
-    @data_driven_test(ObjectDatasetList())
+    @data_driven_test(ObjectDatasetList(shared=True))
     def ddtest_partial_object_retrieval_with_complete_range(
-            self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
-        object_name = self.default_obj_name
-        generate_object(container_name, object_name)
+            self, object_type, get_object):
+        object_info = get_object(object_name=self.default_obj_name)
+        container_name = object_info.get('container_name')
+        object_name = object_info.get('object_name')
 
         headers = {'Range': 'bytes=99-0'}
 
         response = self.client.get_object(
             container_name,
-            self.default_obj_name,
+            object_name,
             headers=headers)
 
         method = 'partial object retrieval with complete range'